@@ -8,6 +8,7 @@ import os
 import platform
 import subprocess  # nosec B404 - needed for CI/CD debugging
 import sys
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
 
@@ -74,24 +75,11 @@ def main():
     packages = ["pytest", "pytest-cov", "coverage", "flask", "werkzeug", "google-api-python-client", "requests", "mock"]
 
     for package in packages:
+        # Read installed distribution metadata instead of importing each package in a new interpreter
         try:
-            result = subprocess.run(  # nosec B603 - controlled execution for package version checking
-                [
-                    sys.executable,
-                    "-c",
-                    f'import {package.replace("-", "_")}; print({package.replace("-", "_")}.__version__)',
-                ],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                check=False,
-            )
-            if result.returncode == 0:
-                print(f"{package}: {result.stdout.strip()}")
-            else:
-                print(f"{package}: Not installed or error")
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
-            print(f"{package}: Error checking version - {e}")
+            print(f"{package}: {version(package)}")
+        except PackageNotFoundError:
+            print(f"{package}: Not installed")
 
     # Test discovery
     print_section("Test Discovery")
@@ -109,14 +97,20 @@ def main():
         "from src.core import error_handling",
     ]
 
-    for import_stmt in imports_to_test:
-        try:
-            # Use compile and exec for safer execution of known import statements
-            compiled_stmt = compile(import_stmt, "<string>", "exec")
-            exec(compiled_stmt)  # nosec B102 - controlled execution of known import statements
+    try:
+        # Compile and run all known import statements at once; only go line by line to find a failure
+        compiled_imports = compile("\n".join(imports_to_test), "<imports>", "exec")
+        exec(compiled_imports, {})  # nosec B102 - controlled execution of known import statements
+        for import_stmt in imports_to_test:
             print(f"✅ {import_stmt}")
-        except Exception as e:
-            print(f"❌ {import_stmt} - Error: {e}")
+    except Exception:
+        for import_stmt in imports_to_test:
+            try:
+                compiled_stmt = compile(import_stmt, "<string>", "exec")
+                exec(compiled_stmt, {})  # nosec B102 - controlled execution of known import statements
+                print(f"✅ {import_stmt}")
+            except Exception as e:
+                print(f"❌ {import_stmt} - Error: {e}")
 
     # Run a single simple test
     print_section("Single Test Execution")
@@ -14,16 +14,33 @@ The module supports both web application and installed application OAuth flows,
 with automatic token refresh and error recovery.
 """
 
+import contextlib
+import hashlib
+import json
 import logging
+import mimetypes
+import mmap
 import os
-from typing import Any, Optional
-
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict, List, Optional, Sequence, Tuple
+
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import Flow
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.discovery_cache.base import Cache
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload, build_http
+
+if TYPE_CHECKING:
+    from google_auth_oauthlib.flow import Flow
 
 # Import enhanced logging and error handling
 try:
@@ -43,7 +60,7 @@ try:
 except ImportError:
     HAS_ENHANCED_LOGGING = False
 
-from retry_utils import circuit_breaker, detailed_error_response, rate_limit, retry
+from retry_utils import TokenBucket, circuit_breaker, detailed_error_response, is_rate_limit_error, retry, single_flight
 
 SCOPES = [
     "https://www.googleapis.com/auth/drive",
@@ -63,27 +80,209 @@ else:
     logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
     logger = logging.getLogger(__name__)
 
+
+def _unwrapped(func: Callable) -> Callable:
+    return func
+
+
+def _drive_operation(operation_name: str, component: str) -> Callable[[Callable], Callable]:
+    """Decorator adding enhanced logging to a Drive operation, or leaving it unwrapped without it."""
+    if HAS_ENHANCED_LOGGING:
+        return handle_drive_operations(operation_name, component)
+    return _unwrapped
+
+
 # Constants for error handling
 MAX_RETRIES = 3
+# Results of deletes that fail with these statuses, which retrying cannot change:
+# already gone (404) counts as deleted, permission denied (403) as failed
+DELETE_ERROR_RESULTS = {404: True, 403: False}
 INITIAL_RETRY_DELAY = 1.0
 MAX_RETRY_DELAY = 15.0
 BACKOFF_FACTOR = 2.0
 
-# Rate limiting constants
-API_CALLS_PER_SECOND = 5.0  # Maximum 5 calls per second to avoid quota issues
-MAX_BURST = 10  # Allow bursts of up to 10 calls
+# Directory fetched discovery documents are kept in for DISCOVERY_CACHE_TTL seconds when the installed
+# client does not bundle the Drive document. Disabled when empty.
+DISCOVERY_CACHE_DIR = os.getenv("DISCOVERY_CACHE_DIR", "")
+DISCOVERY_CACHE_TTL = 24 * 60 * 60
+
+# Rate limiting constants, shared by all Drive API requests the process sends
+API_CALLS_PER_SECOND = float(os.getenv("DRIVE_API_CALLS_PER_SECOND", "5.0"))  # Avoid quota issues
+MAX_BURST = int(os.getenv("DRIVE_API_MAX_BURST", "10"))  # Allow bursts of up to 10 calls
+_drive_api_bucket = TokenBucket(API_CALLS_PER_SECOND, MAX_BURST)
+
+# Drive batch requests accept at most 100 calls
+MAX_BATCH_SIZE = 100
+
+# Multi-level folder paths up to this depth are resolved from one search for all their folder names.
+# Results beyond PATH_QUERY_MAX_PAGES pages are not fetched; the remaining segments are looked up one by one.
+MAX_PATH_QUERY_DEPTH = 50
+PATH_QUERY_MAX_PAGES = 5
+
+# Idle Drive API connections kept for reuse per authenticated service
+HTTP_POOL_SIZE = int(os.getenv("DRIVE_HTTP_POOL_SIZE", "20"))
+# Socket timeout in seconds for Drive API connections; a stalled connection fails over to a retry
+HTTP_TIMEOUT = float(os.getenv("DRIVE_HTTP_TIMEOUT", "60"))
+
+# Resumable upload chunk size; larger chunks mean fewer HTTP round trips per upload.
+# Drive requires a multiple of 256 KiB.
+UPLOAD_CHUNK_SIZE = int(os.getenv("DRIVE_UPLOAD_CHUNK_SIZE", str(8 * 1024 * 1024)))  # 8MB chunks
+# Very large files use bigger chunks, so no upload needs more than about 64 chunk requests.
+# Raise the cap on links with a high bandwidth-delay product, where each chunk round trip idles the link.
+MAX_UPLOAD_CHUNK_SIZE = int(os.getenv("DRIVE_MAX_UPLOAD_CHUNK_SIZE", str(32 * 1024 * 1024)))  # 32MB
+UPLOAD_CHUNK_ALIGNMENT = 256 * 1024
+# A chunk that fails with a retryable error is resent in place this many times before the whole
+# upload is retried; the client library asks Drive how much it received and resumes from there
+UPLOAD_CHUNK_RETRIES = 3
+# Files up to this size are sent in one multipart request instead of a resumable session
+SIMPLE_UPLOAD_MAX_SIZE = int(os.getenv("DRIVE_SIMPLE_UPLOAD_MAX_SIZE", str(5 * 1024 * 1024)))  # 5MB
+# Content is checksummed this many bytes at a time, yielding to other greenlets in between,
+# as one hashlib call over a whole large file would block the gevent hub until it finished
+CHECKSUM_CHUNK_SIZE = 1024 * 1024  # 1MB
+# Load the system MIME type tables now rather than during the first upload
+mimetypes.init()
+# Files spanning more than one upload chunk are memory-mapped, so chunks are copied straight
+# from the page cache instead of through read() calls on a buffered file
+MMAP_UPLOAD_MIN_SIZE = UPLOAD_CHUNK_SIZE
+
+# Files passed to upload_files_to_drive are uploaded this many at a time
+UPLOAD_CONCURRENCY = int(os.getenv("DRIVE_UPLOAD_CONCURRENCY", "4"))
+
+# Independent folder path lookups are resolved concurrently to overlap their round trips
+PATH_LOOKUP_WORKERS = 8
+_path_lookup_executor = ThreadPoolExecutor(max_workers=PATH_LOOKUP_WORKERS, thread_name_prefix="drive-path")
+
+# Folder IDs by path, reused for FOLDER_CACHE_TTL seconds so repeated uploads to the same folders
+# skip the Drive lookups. Only existing folders are cached; entries are dropped when folders are
+# deleted through this service or a new account is authorized.
+FOLDER_CACHE_TTL = float(os.getenv("FOLDER_CACHE_TTL", "300"))
+FOLDER_CACHE_SIZE = 4096
+_folder_id_cache: Dict[Tuple[str, ...], Tuple[str, float]] = {}
+_folder_id_cache_lock = threading.Lock()
+# Root folder ID of the account the folder caches belong to, as probed by the last service build.
+# A worker process that did not handle a re-authorization learns of a new account from a changed root.
+_account_root_folder_id: Optional[str] = None
+# SQLite database the folder IDs by path are also stored in, so other worker processes and
+# restarts within FOLDER_CACHE_TTL reuse them. Disabled when empty.
+FOLDER_CACHE_DB = os.getenv("FOLDER_CACHE_DB", "")
+# Subfolder IDs by name for each listed parent folder, kept for FOLDER_CACHE_TTL seconds and guarded
+# by the same lock. Walking a path then costs at most one list call per folder level.
+_folder_children_cache: Dict[str, Tuple[Dict[str, str], float]] = {}
+LIST_PAGE_SIZE = 1000
+# Folders created by this process that no upload has targeted yet, with when the mark expires,
+# guarded by the same lock. The first upload into one takes the mark; if it overwrites, it knows
+# there is nothing to replace and skips the lookup. Marks expire after NEW_FOLDER_TTL seconds, as
+# other worker processes may upload into the folder once they have resolved it.
+_new_folder_ids: Dict[str, float] = {}
+NEW_FOLDER_TTL = 10.0
+# IDs of files written by overwriting uploads, by (folder ID, file name), guarded by the same lock.
+# The next overwrite of the same file updates it in place without looking it up first.
+_uploaded_file_ids: Dict[Tuple[str, str], Tuple[str, float]] = {}
+
+# Locks serializing folder creation per (parent ID, folder name), so concurrent uploads to the
+# same new path create each folder once instead of leaving same-name duplicates
+_folder_create_locks: Dict[Tuple[str, str], threading.Lock] = {}
+_folder_create_locks_lock = threading.Lock()
+
+# Drive search queries; values are inserted as string literals escaped by _drive_escape.
+# Searches name spaces="drive" and corpora="user" so they never scan the app data folder or
+# shared drives the account can see.
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+_Q_CHILD_FOLDERS = f"mimeType='{FOLDER_MIME_TYPE}' and {{parent}} in parents and trashed=false"
+_Q_FOLDERS_NAMED_ANY = f"mimeType='{FOLDER_MIME_TYPE}' and ({{names}}) and trashed=false"
+_Q_FILE_IN_FOLDER = "name={name} and {parent} in parents and trashed=false"
+
+# Credentials of a built service are refreshed in the background this many seconds before they
+# expire, so requests do not wait on the token endpoint
+TOKEN_REFRESH_MARGIN = 300
+_credentials_refresh_timer: Optional[threading.Timer] = None
+_credentials_refresh_lock = threading.Lock()
+
+# Token file stat caching (seconds between filesystem checks)
+TOKEN_CHECK_TTL = float(os.getenv("TOKEN_CHECK_TTL", "1.0"))
+
+# Last observed token file state, shared by check_token_exists() and the service cache
+_token_state = {"checked_at": None, "mtime": None}
+# Parsed token file contents and the file mtime they were read at
+_token_info_cache: Tuple[Optional[int], Optional[Dict[str, Any]]] = (None, None)
+# Parsed OAuth client secrets and the (path, mtime) they were read at
+_client_config_cache: Tuple[Optional[Tuple[str, int]], Optional[Dict[str, Any]]] = (None, None)
+
+
+def get_token_mtime() -> Optional[int]:
+    """Get the token file modification time, statting the file at most once per TOKEN_CHECK_TTL.
+
+    Returns:
+        The token file mtime in nanoseconds, or None if the token file does not exist.
+    """
+    now = time.monotonic()
+    checked_at = _token_state["checked_at"]
+    if checked_at is not None and now - checked_at < TOKEN_CHECK_TTL:
+        return _token_state["mtime"]
+
+    try:
+        mtime = os.stat(TOKEN_PATH).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    _token_state["mtime"] = mtime
+    _token_state["checked_at"] = now
+    return mtime
+
+
+def invalidate_token_state() -> None:
+    """Forget the cached token file state so the next check hits the filesystem."""
+    global _token_info_cache
+    _token_state["checked_at"] = None
+    _token_state["mtime"] = None
+    _token_info_cache = (None, None)
 
 
 def check_token_exists():
     """Checks if token.json exists."""
-    return os.path.exists(TOKEN_PATH)
+    return get_token_mtime() is not None
+
+
+def _read_client_config() -> Dict[str, Any]:
+    """Read the parsed OAuth client secrets file, parsing it again only when it changes.
+
+    Returns:
+        The client secrets file contents.
+
+    Raises:
+        OSError: If the client secrets file cannot be read.
+        ValueError: If the client secrets file is not valid JSON.
+    """
+    global _client_config_cache
+    path = CREDENTIALS_PATH
+    key = (path, os.stat(path).st_mtime_ns)
+    if key == _client_config_cache[0]:
+        return _client_config_cache[1]
+    with open(path) as secrets:
+        # Key by the opened file, which may have been replaced since the stat
+        key = (path, os.fstat(secrets.fileno()).st_mtime_ns)
+        config = json.load(secrets)
+
+    _client_config_cache = (key, config)
+    return config
+
+
+def _new_oauth_flow() -> "Flow":
+    """Create an OAuth flow from the cached client secrets.
+
+    Each authorization gets its own Flow, which holds per-session OAuth state.
+    Flow supports both "web" and "installed" client secrets formats. google_auth_oauthlib
+    is imported here, so only the authorization endpoints pay for loading it.
+    """
+    from google_auth_oauthlib.flow import Flow
+
+    return Flow.from_client_config(_read_client_config(), SCOPES, redirect_uri=REDIRECT_URI)
 
 
 def generate_authorization_url():
     """Generates the Google Drive authorization URL."""
     try:
-        # Use Flow for web application credentials (supports both "web" and "installed" formats)
-        flow = Flow.from_client_secrets_file(CREDENTIALS_PATH, SCOPES, redirect_uri=REDIRECT_URI)
+        flow = _new_oauth_flow()
         authorization_url, _ = flow.authorization_url(
             prompt="consent", access_type="offline", include_granted_scopes="true"
         )
@@ -96,8 +295,7 @@ def generate_authorization_url():
 def exchange_code_for_tokens(code):
     """Exchanges the authorization code for access and refresh tokens and saves them."""
     try:
-        # Use Flow for web application credentials (supports both "web" and "installed" formats)
-        flow = Flow.from_client_secrets_file(CREDENTIALS_PATH, SCOPES, redirect_uri=REDIRECT_URI)
+        flow = _new_oauth_flow()
 
         # Exchange the authorization code for tokens
         # Using multi-scope approach to match shared OAuth client configuration
@@ -105,8 +303,9 @@ def exchange_code_for_tokens(code):
 
         creds = flow.credentials
         if creds and creds.valid:
-            with open(TOKEN_PATH, "w") as token:
-                token.write(creds.to_json())
+            _save_token(creds)
+            # The new tokens may belong to another account, whose folders have different IDs
+            invalidate_folder_cache()
             logger.info("Successfully exchanged authorization code for tokens")
             return True  # Success
         else:
@@ -117,22 +316,75 @@ def exchange_code_for_tokens(code):
         return False  # Exchange failed
 
 
+def _read_token_info() -> Optional[Dict[str, Any]]:
+    """Read the parsed token file, parsing it again only when its modification time changes.
+
+    Returns:
+        The token file contents, or None if the token file does not exist.
+
+    Raises:
+        ValueError: If the token file is not valid JSON.
+    """
+    global _token_info_cache
+    try:
+        mtime = os.stat(TOKEN_PATH).st_mtime_ns
+        if mtime == _token_info_cache[0]:
+            return _token_info_cache[1]
+        with open(TOKEN_PATH) as token:
+            # Key by the opened file, which may have been replaced since the stat
+            mtime = os.fstat(token.fileno()).st_mtime_ns
+            info = json.load(token)
+    except FileNotFoundError:
+        return None
+
+    _token_info_cache = (mtime, info)
+    return info
+
+
 def _load_existing_credentials() -> Optional[Credentials]:
     """Load existing credentials from token file.
 
     Returns:
         Credentials object if successful, None otherwise.
     """
-    if not os.path.exists(TOKEN_PATH):
-        return None
-
     try:
-        return Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)
+        info = _read_token_info()
+        if info is None:
+            return None
+        return Credentials.from_authorized_user_info(info, SCOPES)
     except Exception as e:
         logger.error(f"Error loading credentials from {TOKEN_PATH}: {e}")
         return None
 
 
+def _save_token(creds: Credentials) -> None:
+    """Write credentials to the token file atomically, skipping the write if nothing changed.
+
+    The token is written to an owner-only temporary file next to TOKEN_PATH and renamed over
+    it, so other workers reading the token file never see it partly written.
+
+    Args:
+        creds: Credentials to save.
+    """
+    token_json = creds.to_json()
+    with contextlib.suppress(OSError), open(TOKEN_PATH) as token:
+        if token.read() == token_json:
+            logger.debug("Token file already up to date")
+            return
+
+    temp_path = f"{TOKEN_PATH}.{os.getpid()}.{threading.get_ident()}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, "w") as token:
+            token.write(token_json)
+        os.replace(temp_path, TOKEN_PATH)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+    invalidate_token_state()
+
+
 def _refresh_credentials(creds: Credentials) -> Optional[Credentials]:
     """Refresh expired credentials and save them.
 
@@ -146,8 +398,7 @@ def _refresh_credentials(creds: Credentials) -> Optional[Credentials]:
         logger.info("Refreshing expired credentials")
         creds.refresh(Request())
         # Save the refreshed credentials
-        with open(TOKEN_PATH, "w") as token:
-            token.write(creds.to_json())
+        _save_token(creds)
         logger.info("Credentials refreshed successfully")
         return creds
     except Exception as e:
@@ -156,9 +407,202 @@ def _refresh_credentials(creds: Credentials) -> Optional[Credentials]:
         if "invalid_grant" in str(e).lower() or "invalid_token" in str(e).lower():
             logger.warning(f"Removing invalid token file: {TOKEN_PATH}")
             os.remove(TOKEN_PATH)
+            invalidate_token_state()
         return None
 
 
+def _schedule_credentials_refresh(creds: Credentials) -> None:
+    """Refresh credentials on a background timer shortly before they expire.
+
+    Only the most recently built service's credentials are kept fresh; scheduling a refresh
+    cancels any pending one. The refreshed access token stays in this process's memory and is
+    not written back to the token file, so other worker processes keep the access token they
+    loaded and refresh it themselves, on their own timer or when a request finds it expired.
+
+    Args:
+        creds: Credentials used by the Drive service.
+    """
+    global _credentials_refresh_timer
+
+    if not isinstance(creds.expiry, datetime) or not creds.refresh_token:
+        return
+
+    # google-auth stores expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    delay = max((creds.expiry - now).total_seconds() - TOKEN_REFRESH_MARGIN, 0.0)
+    timer = threading.Timer(delay, _refresh_credentials_in_background, args=(creds,))
+    timer.daemon = True
+    with _credentials_refresh_lock:
+        if _credentials_refresh_timer is not None:
+            _credentials_refresh_timer.cancel()
+        _credentials_refresh_timer = timer
+    timer.start()
+
+
+def _refresh_credentials_in_background(creds: Credentials) -> None:
+    """Refresh credentials ahead of expiry and schedule the next refresh."""
+    try:
+        creds.refresh(Request())
+    except Exception as e:
+        # Requests still refresh expired credentials on demand
+        logger.warning(f"Background credentials refresh failed: {e}")
+        return
+    logger.info("Credentials refreshed ahead of expiry")
+    _schedule_credentials_refresh(creds)
+
+
+class _HttpConnectionPool:
+    """Process-wide pool of idle httplib2.Http objects and their open connections.
+
+    Shared by every Drive service built in the process, so TCP/TLS connections to
+    googleapis.com survive service rebuilds after the token file changes.
+    """
+
+    def __init__(self, max_idle: int = HTTP_POOL_SIZE):
+        self.max_idle = max_idle
+        self._idle: List[httplib2.Http] = []
+        self._lock = threading.Lock()
+
+    def checkout(self) -> httplib2.Http:
+        """Take an idle connection, or create one if none is free."""
+        with self._lock:
+            if self._idle:
+                # Most recently used first: its connection is the least likely to have been closed
+                return self._idle.pop()
+        # build_http keeps 308 (resumable upload) out of the redirects httplib2 follows
+        http = build_http()
+        http.timeout = HTTP_TIMEOUT
+        return http
+
+    def checkin(self, http: httplib2.Http) -> None:
+        """Return a connection to the pool, keeping at most max_idle."""
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(http)
+
+
+_http_connection_pool = _HttpConnectionPool()
+
+
+class _PooledAuthorizedHttp:
+    """Authorized HTTP transport that shares a pool of persistent connections between requests.
+
+    httplib2.Http is not thread-safe, so each in-flight Drive call checks a connection out of
+    the pool, authorizes it with these credentials and returns it afterwards. Connections are
+    pooled rather than kept per thread, so TCP/TLS sessions to googleapis.com are reused even
+    when every request runs on a fresh greenlet or thread.
+
+    Every request also takes a token from the shared Drive API rate limit bucket, so the limit
+    applies to the HTTP requests actually sent: each API call, retry, batch and upload chunk.
+    """
+
+    def __init__(
+        self,
+        credentials: Credentials,
+        pool: Optional[_HttpConnectionPool] = None,
+        bucket: Optional[TokenBucket] = None,
+    ):
+        self.credentials = credentials
+        self._pool = pool if pool is not None else _http_connection_pool
+        self._bucket = bucket if bucket is not None else _drive_api_bucket
+
+    def _checkout(self) -> AuthorizedHttp:
+        return AuthorizedHttp(self.credentials, http=self._pool.checkout())
+
+    def _checkin(self, http: AuthorizedHttp) -> None:
+        self._pool.checkin(http.http)
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        """Send a request over a pooled connection once the rate limit allows it."""
+        wait_time = self._bucket.acquire()
+        if wait_time:
+            logger.debug(f"Rate limited Drive API request, waited {wait_time:.2f}s")
+
+        http = self._checkout()
+        try:
+            response, content = http.request(*args, **kwargs)
+        finally:
+            self._checkin(http)
+
+        # Rate limit errors (429, or 403 with a rate limit reason) slow the bucket down
+        if response.status in (403, 429) and is_rate_limit_error(HttpError(response, content)):
+            self._bucket.penalize()
+            logger.warning(f"Drive API rate limit hit, slowing down to {self._bucket.rate:.2f} requests/s")
+        else:
+            self._bucket.reward()
+        return response, content
+
+    def __getattr__(self, name: str) -> Any:
+        http = self._checkout()
+        try:
+            return getattr(http, name)
+        finally:
+            self._checkin(http)
+
+
+class _DiscoveryCache(Cache):
+    """Process-wide discovery document cache for clients that do not bundle the Drive document.
+
+    The file cache googleapiclient would otherwise use needs oauth2client, so without it every
+    service build fetched the discovery document over HTTPS. When a directory is given, fetched
+    documents are also written there for DISCOVERY_CACHE_TTL seconds, so new worker processes
+    and restarted containers do not fetch them again.
+    """
+
+    def __init__(self, directory: str = "") -> None:
+        self.directory = directory
+        self._documents: Dict[str, str] = {}
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(url.encode()).hexdigest() + ".json")
+
+    def get(self, url: str) -> Optional[str]:
+        content = self._documents.get(url)
+        if content is not None or not self.directory:
+            return content
+        path = self._path(url)
+        try:
+            if os.stat(path).st_mtime + DISCOVERY_CACHE_TTL < time.time():
+                return None
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+        except OSError:
+            return None
+        self._documents[url] = content
+        return content
+
+    def set(self, url: str, content: str) -> None:
+        self._documents[url] = content
+        if not self.directory:
+            return
+        path = self._path(url)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temporary file first so other processes never read a partial document
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not write discovery document cache '{path}': {e}")
+
+
+_discovery_cache = _DiscoveryCache(DISCOVERY_CACHE_DIR)
+
+
+@lru_cache(maxsize=1)
+def _get_drive_discovery_document() -> Optional[Dict[str, Any]]:
+    """Read and parse the Drive v3 discovery document bundled with google-api-python-client once per process.
+
+    Building from the parsed document skips a JSON parse of about 200 KB on every service rebuild.
+
+    Returns:
+        The parsed discovery document, or None if the installed client does not ship it.
+    """
+    document = get_static_doc("drive", "v3")
+    return json.loads(document) if document else None
+
+
 def _build_drive_service(creds: Credentials) -> Optional[Any]:
     """Build and test Google Drive service.
 
@@ -173,9 +617,23 @@ def _build_drive_service(creds: Credentials) -> Optional[Any]:
     """
     try:
         logger.debug("Building Google Drive service")
-        service = build("drive", "v3", credentials=creds)
-        # Test the service with a simple request
-        service.files().list(pageSize=1).execute()
+        http = _PooledAuthorizedHttp(creds)
+        discovery_document = _get_drive_discovery_document()
+        if discovery_document:
+            service = build_from_document(discovery_document, http=http)
+        else:
+            service = build("drive", "v3", http=http, static_discovery=False, cache=_discovery_cache)
+
+        # Each files() call rebuilds the collection from the discovery document (a few ms of CPU).
+        # The resource holds no per-request state, so build it once and reuse it for this service.
+        files_resource = service.files()
+        service.files = lambda: files_resource
+
+        # Test the service with the root folder lookup, which path resolution needs next anyway
+        root_id = _fetch_root_folder_id(service)
+        _check_account_root(root_id)
+        _cache_folder_id((), root_id)
+        _schedule_credentials_refresh(creds)
         logger.info("Google Drive authentication successful")
         return service
     except HttpError as error:
@@ -193,10 +651,14 @@ def _build_drive_service(creds: Credentials) -> Optional[Any]:
 
 
 @retry(max_retries=MAX_RETRIES, initial_delay=INITIAL_RETRY_DELAY, max_delay=MAX_RETRY_DELAY)
-@handle_drive_operations("authenticate_google_drive", "auth") if HAS_ENHANCED_LOGGING else lambda f: f
+@_drive_operation("authenticate_google_drive", "auth")
 def authenticate_google_drive() -> Optional[Any]:
     """Authenticates with Google Drive API using existing tokens if available with enhanced logging.
 
+    Each call loads the token file, builds a service from the bundled discovery document and
+    probes the API once. Callers serving many requests should reuse the result until the token
+    file changes, as the Flask app does with _get_cached_drive_service.
+
     Returns:
         Google Drive service object if authentication is successful, None otherwise.
 
@@ -220,12 +682,298 @@ def authenticate_google_drive() -> Optional[Any]:
     return _build_drive_service(creds)
 
 
+@lru_cache(maxsize=1024)
+def _split_folder_path(folder_path: str) -> Tuple[str, ...]:
+    """Split a '/'-separated folder path into its folder names, skipping empty segments.
+
+    Clients upload to a small set of folder paths, so the split is cached.
+
+    Args:
+        folder_path: Path of folders, separated by '/'.
+
+    Returns:
+        Tuple of folder names from the top level down.
+    """
+    return tuple(folder for folder in folder_path.split("/") if folder)
+
+
+class _PersistentFolderCache:
+    """Folder IDs by path in a SQLite database, shared by worker processes and kept across restarts.
+
+    Entries expire after FOLDER_CACHE_TTL like the in-memory cache. The cache is best effort:
+    database errors are logged and treated as misses.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple[Any, ...]]:
+        if not self.path:
+            return []
+        with self._lock:
+            try:
+                if self._connection is None:
+                    connection = sqlite3.connect(self.path, timeout=1.0, isolation_level=None, check_same_thread=False)
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS folder_paths "
+                        "(path TEXT PRIMARY KEY, folder_id TEXT NOT NULL, expires_at REAL NOT NULL)"
+                    )
+                    self._connection = connection
+                return self._connection.execute(sql, params).fetchall()
+            except sqlite3.Error as e:
+                logger.debug(f"Folder cache database {self.path} unavailable: {e}")
+                return []
+
+    def get(self, folders: Tuple[str, ...]) -> Optional[Tuple[str, float]]:
+        """Return the stored (folder_id, expires_at) for a path, with expires_at in epoch seconds."""
+        rows = self._execute(
+            "SELECT folder_id, expires_at FROM folder_paths WHERE path = ? AND expires_at > ?",
+            ("/".join(folders), time.time()),
+        )
+        return rows[0] if rows else None
+
+    def put(self, folders: Tuple[str, ...], folder_id: str) -> None:
+        """Store the ID of the folder at a path for FOLDER_CACHE_TTL seconds, dropping expired entries."""
+        now = time.time()
+        self._execute("DELETE FROM folder_paths WHERE expires_at <= ?", (now,))
+        self._execute(
+            "INSERT OR REPLACE INTO folder_paths VALUES (?, ?, ?)",
+            ("/".join(folders), folder_id, now + FOLDER_CACHE_TTL),
+        )
+
+    def forget(self, folder_id: str) -> None:
+        """Drop the stored paths of a deleted folder and everything below them."""
+        for (path,) in self._execute("SELECT path FROM folder_paths WHERE folder_id = ?", (folder_id,)):
+            self._execute(
+                "DELETE FROM folder_paths WHERE path = ? OR substr(path, 1, ?) = ?", (path, len(path) + 1, path + "/")
+            )
+
+    def clear(self) -> None:
+        """Drop all stored paths."""
+        self._execute("DELETE FROM folder_paths")
+
+
+_persistent_folder_cache = _PersistentFolderCache(FOLDER_CACHE_DB)
+
+
+def _remember_folder_id(folders: Tuple[str, ...], folder_id: str, expires_at: float) -> None:
+    """Keep the ID of the folder at the given path in memory until the monotonic time expires_at."""
+    with _folder_id_cache_lock:
+        _folder_id_cache.pop(folders, None)
+        if len(_folder_id_cache) >= FOLDER_CACHE_SIZE:
+            # Evict the least recently used entry; dicts keep insertion order and hits move to the end
+            del _folder_id_cache[next(iter(_folder_id_cache))]
+        _folder_id_cache[folders] = (folder_id, expires_at)
+
+
+def _get_cached_folder_id(folders: Tuple[str, ...]) -> Optional[str]:
+    """Return the cached ID of the folder at the given path, or None if it is not cached or expired.
+
+    Paths missing from memory are looked up in the folder cache database, if one is configured.
+    """
+    with _folder_id_cache_lock:
+        entry = _folder_id_cache.pop(folders, None)
+        if entry is not None:
+            _folder_id_cache[folders] = entry
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
+
+    persisted = _persistent_folder_cache.get(folders)
+    if persisted is None:
+        return None
+    folder_id, expires_at = persisted
+    _remember_folder_id(folders, folder_id, time.monotonic() + expires_at - time.time())
+    return folder_id
+
+
+def _cache_folder_id(folders: Tuple[str, ...], folder_id: str) -> None:
+    """Remember the ID of the folder at the given path for FOLDER_CACHE_TTL seconds."""
+    _remember_folder_id(folders, folder_id, time.monotonic() + FOLDER_CACHE_TTL)
+    _persistent_folder_cache.put(folders, folder_id)
+
+
+def _drive_escape(value: str) -> str:
+    """Quote a value as a Drive query string literal, escaping backslashes and single quotes."""
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def _get_cached_child_folders(parent_id: str) -> Optional[Dict[str, str]]:
+    """Return the cached subfolders of a folder, or None if they are not cached or expired."""
+    with _folder_id_cache_lock:
+        entry = _folder_children_cache.get(parent_id)
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
+    return None
+
+
+def _cache_child_folders(parent_id: str, children: Dict[str, str]) -> None:
+    """Remember the subfolders of a folder for FOLDER_CACHE_TTL seconds."""
+    with _folder_id_cache_lock:
+        if len(_folder_children_cache) >= FOLDER_CACHE_SIZE:
+            del _folder_children_cache[next(iter(_folder_children_cache))]
+        _folder_children_cache[parent_id] = (children, time.monotonic() + FOLDER_CACHE_TTL)
+
+
+def _add_cached_child_folder(parent_id: str, folder_name: str, folder_id: str) -> None:
+    """Record a folder created in a parent.
+
+    A parent whose subfolders are not cached gets a partial listing with just this folder;
+    find_folder_id looks up names missing from a listing again, so that is safe.
+    """
+    now = time.monotonic()
+    with _folder_id_cache_lock:
+        entry = _folder_children_cache.get(parent_id)
+        if entry is not None and entry[1] > now:
+            # Keep an older folder with the same name; lookups return the oldest match
+            _folder_children_cache[parent_id] = ({folder_name: folder_id, **entry[0]}, entry[1])
+            return
+        if entry is None and len(_folder_children_cache) >= FOLDER_CACHE_SIZE:
+            del _folder_children_cache[next(iter(_folder_children_cache))]
+        _folder_children_cache[parent_id] = ({folder_name: folder_id}, now + FOLDER_CACHE_TTL)
+
+
+def _mark_new_folder(folder_id: str) -> None:
+    """Record a folder this process has just created, so it is known to be empty."""
+    with _folder_id_cache_lock:
+        if len(_new_folder_ids) >= FOLDER_CACHE_SIZE:
+            del _new_folder_ids[next(iter(_new_folder_ids))]
+        _new_folder_ids[folder_id] = time.monotonic() + NEW_FOLDER_TTL
+
+
+def _get_uploaded_file_id(folder_id: str, file_name: str) -> Optional[str]:
+    """Return the ID of a file recently written by an overwriting upload, or None if not cached or expired."""
+    with _folder_id_cache_lock:
+        entry = _uploaded_file_ids.get((folder_id, file_name))
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
+    return None
+
+
+def _cache_uploaded_file_id(folder_id: str, file_name: str, file_id: Optional[str]) -> None:
+    """Remember (or with file_id None, forget) the file an overwriting upload wrote."""
+    with _folder_id_cache_lock:
+        if file_id is None:
+            _uploaded_file_ids.pop((folder_id, file_name), None)
+            return
+        if len(_uploaded_file_ids) >= FOLDER_CACHE_SIZE:
+            del _uploaded_file_ids[next(iter(_uploaded_file_ids))]
+        _uploaded_file_ids[(folder_id, file_name)] = (file_id, time.monotonic() + FOLDER_CACHE_TTL)
+
+
+def _forget_uploaded_file(file_id: str) -> None:
+    """Drop a deleted file from the cache of uploaded files."""
+    with _folder_id_cache_lock:
+        for key in [key for key, (cached_id, _) in _uploaded_file_ids.items() if cached_id == file_id]:
+            del _uploaded_file_ids[key]
+
+
+def _claim_new_folder(folder_id: str) -> bool:
+    """Return True for the first upload into a folder this process just created, which has no files yet.
+
+    Every upload must claim the mark, overwriting or not, so that no later upload skips the lookup.
+    """
+    with _folder_id_cache_lock:
+        expires_at = _new_folder_ids.pop(folder_id, None)
+    return expires_at is not None and expires_at > time.monotonic()
+
+
+def _forget_folder(folder_id: str) -> None:
+    """Drop cached entries for a deleted folder and everything below it.
+
+    The folder's cached paths identify its subtree. When none is cached, another cached path
+    may still pass through the folder, so all folder caches are cleared instead.
+
+    Args:
+        folder_id: ID of the deleted folder.
+    """
+    with _folder_id_cache_lock:
+        prefixes = [path for path, (cached_id, _) in _folder_id_cache.items() if cached_id == folder_id]
+        if prefixes:
+            for path in [path for path in _folder_id_cache if any(path[: len(p)] == p for p in prefixes)]:
+                del _folder_id_cache[path]
+            _folder_children_cache.pop(folder_id, None)
+            for parent_id, (children, expires_at) in list(_folder_children_cache.items()):
+                if folder_id in children.values():
+                    remaining = {name: child_id for name, child_id in children.items() if child_id != folder_id}
+                    _folder_children_cache[parent_id] = (remaining, expires_at)
+            _new_folder_ids.pop(folder_id, None)
+            for key in [key for key in _uploaded_file_ids if key[0] == folder_id]:
+                del _uploaded_file_ids[key]
+    if prefixes:
+        _persistent_folder_cache.forget(folder_id)
+    else:
+        invalidate_folder_cache()
+
+
+def _check_account_root(root_id: str) -> None:
+    """Clear the folder caches if a service was built for another account than they belong to.
+
+    Args:
+        root_id: Root folder ID of the account the service was built for.
+    """
+    global _account_root_folder_id
+
+    previous_root_id = _account_root_folder_id or _get_cached_folder_id(())
+    if previous_root_id and previous_root_id != root_id:
+        logger.info("Authorized account changed, clearing folder caches")
+        invalidate_folder_cache()
+    _account_root_folder_id = root_id
+
+
+def invalidate_folder_cache() -> None:
+    """Forget all cached folder IDs so the next lookups query Drive."""
+    global _account_root_folder_id
+
+    _account_root_folder_id = None
+    with _folder_id_cache_lock:
+        _folder_id_cache.clear()
+        _folder_children_cache.clear()
+        _new_folder_ids.clear()
+        _uploaded_file_ids.clear()
+    _persistent_folder_cache.clear()
+
+
+def _create_folder_once(drive_service: Any, folder_name: str, parent_id: str) -> Optional[str]:
+    """Create a folder unless another thread in this process created it while we waited.
+
+    Args:
+        drive_service: The Google Drive service instance.
+        folder_name: Name of the folder to create.
+        parent_id: ID of the parent folder.
+
+    Returns:
+        The ID of the created or concurrently created folder, or None if creation fails.
+    """
+    key = (parent_id, folder_name)
+    with _folder_create_locks_lock:
+        lock = _folder_create_locks.setdefault(key, threading.Lock())
+
+    with lock:
+        try:
+            # create_folder records new folders in the parent's cached listing
+            children = _get_cached_child_folders(parent_id)
+            folder_id = children.get(folder_name) if children is not None else None
+            if folder_id:
+                logger.debug(f"Folder '{folder_name}' was created concurrently with ID: {folder_id}")
+                return folder_id
+            return create_folder(drive_service, folder_name, parent_id)
+        finally:
+            with _folder_create_locks_lock:
+                if _folder_create_locks.get(key) is lock:
+                    del _folder_create_locks[key]
+
+
+@single_flight()
 @retry(max_retries=MAX_RETRIES, initial_delay=INITIAL_RETRY_DELAY, max_delay=MAX_RETRY_DELAY)
-@handle_drive_operations("create_folder_if_not_exists", "folder_ops") if HAS_ENHANCED_LOGGING else lambda f: f
+@_drive_operation("create_folder_if_not_exists", "folder_ops")
 def create_folder_if_not_exists(drive_service: Any, folder_path: str) -> Optional[str]:
     """Creates folders in Google Drive if they don't exist with enhanced logging.
 
-    Handles nested folders as well.
+    Handles nested folders as well. Resolved paths are cached for FOLDER_CACHE_TTL seconds,
+    so repeated uploads to one folder resolve its path once rather than once per upload, and
+    concurrent calls for the same path wait for and share a single resolution.
 
     Args:
         drive_service: The Google Drive service instance.
@@ -242,39 +990,120 @@ def create_folder_if_not_exists(drive_service: Any, folder_path: str) -> Optiona
         return None
 
     parent_folder_id = "root"  # Start at the root of Drive
-    folders = folder_path.strip("/").split("/")  # Split path into folder names
-
-    # Skip empty folder names
-    folders = [f for f in folders if f]
+    folders = _split_folder_path(folder_path)
     if not folders:
         return parent_folder_id
 
+    cached_folder_id = _get_cached_folder_id(folders)
+    if cached_folder_id:
+        logger.debug(f"Using cached folder ID for '{folder_path}': {cached_folder_id}")
+        return cached_folder_id
+
     try:
-        for folder_name in folders:
+        # Resolve the existing part of multi-level paths from one search
+        resolved = 0
+        missing = False
+        if 1 < len(folders) <= MAX_PATH_QUERY_DEPTH:
+            parent_folder_id, resolved, missing = _resolve_folder_path_listed(drive_service, folders)
+
+        for folder_name in folders[resolved:]:
             logger.debug(f"Processing folder: {folder_name} (parent: {parent_folder_id})")
-            folder_id = find_folder_id(drive_service, folder_name, parent_folder_id)
+            # Nothing below a missing folder can exist, so only the first unresolved segment is looked up
+            folder_id = None if missing else find_folder_id(drive_service, folder_name, parent_folder_id)
             if not folder_id:
                 logger.info(f"Folder '{folder_name}' not found, creating it")
-                folder_id = create_folder(drive_service, folder_name, parent_folder_id)
+                folder_id = _create_folder_once(drive_service, folder_name, parent_folder_id)
                 if not folder_id:
                     logger.error(f"Failed to create folder '{folder_name}'")
                     return None
                 logger.info(f"Created folder '{folder_name}' with ID: {folder_id}")
+                missing = True
             else:
                 logger.debug(f"Found existing folder '{folder_name}' with ID: {folder_id}")
             parent_folder_id = folder_id  # Next folder will be inside this one
 
+        _cache_folder_id(folders, parent_folder_id)
         return parent_folder_id  # Return the ID of the final folder
     except Exception as e:
         logger.exception(f"Error creating folder path '{folder_path}': {e}")
         raise
 
 
+def create_folders_if_not_exist(drive_service: Any, folder_paths: Sequence[str]) -> Dict[str, Optional[str]]:
+    """Creates several folder paths in Google Drive if they don't exist, handling the paths concurrently.
+
+    Sibling paths are created in parallel on a bounded thread pool. Paths that share a missing
+    prefix still create it once, since concurrent creations of the same folder are serialized.
+
+    Args:
+        drive_service: The Google Drive service instance.
+        folder_paths: Paths of folders to create, separated by '/'.
+
+    Returns:
+        Mapping of each folder path to the ID of its last folder, or None if creation failed.
+
+    Raises:
+        Exception: If folder creation fails after retries.
+    """
+    futures = {
+        folder_path: _path_lookup_executor.submit(create_folder_if_not_exists, drive_service, folder_path)
+        for folder_path in dict.fromkeys(folder_paths)
+    }
+    return {folder_path: future.result() for folder_path, future in futures.items()}
+
+
 @retry(max_retries=MAX_RETRIES, initial_delay=INITIAL_RETRY_DELAY, max_delay=MAX_RETRY_DELAY)
-@rate_limit(calls_per_second=API_CALLS_PER_SECOND, max_burst=MAX_BURST)
+def _list_child_folders_page(drive_service: Any, parent_id: str, page_token: Optional[str]) -> Dict[str, Any]:
+    """Fetch one page of the subfolders of a folder, oldest first."""
+    return (
+        drive_service.files()
+        .list(
+            q=_Q_CHILD_FOLDERS.format(parent=_drive_escape(parent_id)),
+            fields="nextPageToken,files(id,name)",
+            orderBy="createdTime",
+            pageSize=LIST_PAGE_SIZE,
+            spaces="drive",
+            corpora="user",
+            pageToken=page_token,
+        )
+        .execute()
+    )
+
+
+def _list_child_folders(drive_service: Any, parent_id: str) -> Dict[str, str]:
+    """List the subfolders of a folder and cache them.
+
+    Args:
+        drive_service: The Google Drive service instance.
+        parent_id: ID of the folder to list.
+
+    Returns:
+        Mapping of subfolder name to ID. Where several subfolders share a name, the oldest is kept.
+
+    Raises:
+        Exception: If the API call fails after retries.
+    """
+    children: Dict[str, str] = {}
+    page_token = None
+    while True:
+        results = _list_child_folders_page(drive_service, parent_id, page_token)
+        for item in results.get("files", []):
+            children.setdefault(item["name"], item["id"])
+        page_token = results.get("nextPageToken")
+        if not page_token:
+            break
+
+    _cache_child_folders(parent_id, children)
+    return children
+
+
 def find_folder_id(drive_service: Any, folder_name: str, parent_id: str) -> Optional[str]:
     """Finds a folder ID by name within a parent folder.
 
+    All subfolders of the parent are listed in one call and cached, so looking up sibling
+    folders afterwards needs no API call. A name missing from the cached listing is looked
+    up again in case the folder was created since.
+
     Args:
         drive_service: The Google Drive service instance.
         folder_name: Name of the folder to find.
@@ -290,45 +1119,33 @@ def find_folder_id(drive_service: Any, folder_name: str, parent_id: str) -> Opti
         logger.error("Cannot find folder: drive_service is None")
         return None
 
-    # Escape single quotes in folder name for the query
-    safe_folder_name = folder_name.replace("'", "\\'") if folder_name else ""
-
-    if not safe_folder_name:
+    if not folder_name:
         logger.warning("Empty folder name provided to find_folder_id")
         return None
 
     try:
-        logger.debug(f"Searching for folder '{safe_folder_name}' in parent '{parent_id}'")
-        results = (
-            drive_service.files()
-            .list(
-                q=f"mimeType='application/vnd.google-apps.folder' and name='{safe_folder_name}' and "
-                f"'{parent_id}' in parents and trashed=false",
-                fields="files(id,name)",
-                pageSize=1,  # We only need the first match
-            )
-            .execute()
-        )
+        logger.debug(f"Searching for folder '{folder_name}' in parent '{parent_id}'")
+        children = _get_cached_child_folders(parent_id)
+        folder_id = children.get(folder_name) if children is not None else None
+        if not folder_id:
+            folder_id = _list_child_folders(drive_service, parent_id).get(folder_name)
 
-        items = results.get("files", [])
-        if items:
-            folder_id = items[0]["id"]
-            logger.debug(f"Found folder '{safe_folder_name}' with ID: {folder_id}")
+        if folder_id:
+            logger.debug(f"Found folder '{folder_name}' with ID: {folder_id}")
             return folder_id
         else:
-            logger.debug(f"Folder '{safe_folder_name}' not found in parent '{parent_id}'")
+            logger.debug(f"Folder '{folder_name}' not found in parent '{parent_id}'")
             return None  # Folder not found
     except HttpError as error:
         error_details = detailed_error_response(error)
         logger.error(f"Google Drive API error while finding folder: {error_details}")
         raise
     except Exception as e:
-        logger.exception(f"Unexpected error while finding folder '{safe_folder_name}': {e}")
+        logger.exception(f"Unexpected error while finding folder '{folder_name}': {e}")
         raise
 
 
 @retry(max_retries=MAX_RETRIES, initial_delay=INITIAL_RETRY_DELAY, max_delay=MAX_RETRY_DELAY)
-@rate_limit(calls_per_second=API_CALLS_PER_SECOND, max_burst=MAX_BURST)
 def create_folder(drive_service: Any, folder_name: str, parent_id: str) -> Optional[str]:
     """Creates a folder in Google Drive.
 
@@ -351,18 +1168,25 @@ def create_folder(drive_service: Any, folder_name: str, parent_id: str) -> Optio
         logger.error("Cannot create folder: folder_name is empty")
         return None
 
-    file_metadata = {"name": folder_name, "mimeType": "application/vnd.google-apps.folder", "parents": [parent_id]}
+    file_metadata = {"name": folder_name, "mimeType": FOLDER_MIME_TYPE, "parents": [parent_id]}
 
     try:
         logger.debug(f"Creating folder '{folder_name}' in parent '{parent_id}'")
-        file = drive_service.files().create(body=file_metadata, fields="id,name").execute()
+        file = drive_service.files().create(body=file_metadata, fields="id").execute()
 
         folder_id = file.get("id")
+        if folder_id:
+            _add_cached_child_folder(parent_id, folder_name, folder_id)
+            _cache_child_folders(folder_id, {})  # A new folder has no subfolders yet
+            _mark_new_folder(folder_id)
         logger.info(f"Created folder '{folder_name}' with ID: {folder_id}")
         return folder_id
     except HttpError as error:
         error_details = detailed_error_response(error)
         logger.error(f"Google Drive API error while creating folder: {error_details}")
+        if error.resp.status == 404:
+            # The cached parent may have been deleted outside this service; resolve it again next time
+            _forget_folder(parent_id)
         raise
     except Exception as e:
         logger.exception(f"Unexpected error while creating folder '{folder_name}': {e}")
@@ -370,7 +1194,6 @@ def create_folder(drive_service: Any, folder_name: str, parent_id: str) -> Optio
 
 
 @retry(max_retries=MAX_RETRIES, initial_delay=INITIAL_RETRY_DELAY, max_delay=MAX_RETRY_DELAY)
-@rate_limit(calls_per_second=API_CALLS_PER_SECOND, max_burst=MAX_BURST)
 def find_file_id(drive_service: Any, file_name: str, folder_id: str) -> Optional[str]:
     """Finds a file ID by name within a parent folder.
 
@@ -389,20 +1212,20 @@ def find_file_id(drive_service: Any, file_name: str, folder_id: str) -> Optional
         logger.error("Cannot find file: drive_service is None")
         return None
 
-    # Escape single quotes in file name for the query
-    safe_file_name = file_name.replace("'", "\\'") if file_name else ""
-
-    if not safe_file_name:
+    if not file_name:
         logger.warning("Empty file name provided to find_file_id")
         return None
 
     try:
-        logger.debug(f"Searching for file '{safe_file_name}' in folder '{folder_id}'")
+        logger.debug(f"Searching for file '{file_name}' in folder '{folder_id}'")
         results = (
             drive_service.files()
             .list(
-                q=f"name='{safe_file_name}' and '{folder_id}' in parents and trashed=false",
-                fields="files(id,name)",
+                q=_Q_FILE_IN_FOLDER.format(name=_drive_escape(file_name), parent=_drive_escape(folder_id)),
+                fields="files(id)",
+                orderBy="createdTime",  # Oldest first, so a just-uploaded copy never shadows the original
+                spaces="drive",
+                corpora="user",
                 pageSize=1,  # We only need the first match
             )
             .execute()
@@ -411,22 +1234,43 @@ def find_file_id(drive_service: Any, file_name: str, folder_id: str) -> Optional
         items = results.get("files", [])
         if items:
             file_id = items[0]["id"]
-            logger.debug(f"Found file '{safe_file_name}' with ID: {file_id}")
+            logger.debug(f"Found file '{file_name}' with ID: {file_id}")
             return file_id
         else:
-            logger.debug(f"File '{safe_file_name}' not found in folder '{folder_id}'")
+            logger.debug(f"File '{file_name}' not found in folder '{folder_id}'")
             return None  # File not found
     except HttpError as error:
         error_details = detailed_error_response(error)
         logger.error(f"Google Drive API error while finding file: {error_details}")
         raise
     except Exception as e:
-        logger.exception(f"Unexpected error while finding file '{safe_file_name}': {e}")
+        logger.exception(f"Unexpected error while finding file '{file_name}': {e}")
         raise
 
 
+def _delete_error_result(error: HttpError, kind: str, item_id: str) -> Optional[bool]:
+    """Map a failed delete to its final result, or None if the error should be raised.
+
+    Args:
+        error: The error the delete failed with.
+        kind: What was deleted ("file" or "folder"), for logging.
+        item_id: ID of the file or folder.
+
+    Returns:
+        The result from DELETE_ERROR_RESULTS for the error's status, or None if it has none or
+        the error is a rate limit 403, which is retried like a 429.
+    """
+    if is_rate_limit_error(error):
+        return None
+    result = DELETE_ERROR_RESULTS.get(error.resp.status)
+    if result is True:
+        logger.warning(f"{kind.capitalize()} with ID {item_id} not found (already deleted)")
+    elif result is False:
+        logger.error(f"Permission denied when deleting {kind} with ID {item_id}: {error.reason}")
+    return result
+
+
 @retry(max_retries=MAX_RETRIES, initial_delay=INITIAL_RETRY_DELAY, max_delay=MAX_RETRY_DELAY)
-@rate_limit(calls_per_second=API_CALLS_PER_SECOND, max_burst=MAX_BURST)
 def delete_file_by_id(drive_service: Any, file_id: str) -> bool:
     """Deletes a file in Google Drive by its file ID.
 
@@ -451,105 +1295,471 @@ def delete_file_by_id(drive_service: Any, file_id: str) -> bool:
     try:
         logger.debug(f"Deleting file with ID: {file_id}")
         drive_service.files().delete(fileId=file_id).execute()
+        _forget_uploaded_file(file_id)
         logger.info(f"Successfully deleted file with ID: {file_id}")
         return True  # Deletion successful
     except HttpError as error:
-        # If the file doesn't exist (404), consider it a success
-        if error.resp.status == 404:
-            logger.warning(f"File with ID {file_id} not found (already deleted)")
-            return True
+        result = _delete_error_result(error, "file", file_id)
+        if result is not None:
+            return result
 
         error_details = detailed_error_response(error)
         logger.error(f"Google Drive API error while deleting file: {error_details}")
-
-        # For permission errors, don't retry
-        if error.resp.status == 403:
-            logger.error(f"Permission denied when deleting file with ID: {file_id}")
-            return False
-
         raise
     except Exception as e:
         logger.exception(f"Unexpected error while deleting file with ID {file_id}: {e}")
         raise
 
 
-def _validate_upload_parameters(drive_service: Any, file_path: str, folder_id: str) -> bool:
+@retry(max_retries=MAX_RETRIES, initial_delay=INITIAL_RETRY_DELAY, max_delay=MAX_RETRY_DELAY)
+def _execute_delete_batch(drive_service: Any, file_ids: Sequence[str]) -> Dict[str, Optional[HttpError]]:
+    """Send up to MAX_BATCH_SIZE deletes in one BatchHttpRequest.
+
+    Returns:
+        Mapping of file ID to the HttpError its delete failed with, or None if it succeeded.
+    """
+    errors: Dict[str, Optional[HttpError]] = {}
+
+    def _collect(request_id: str, response: Any, exception: Optional[HttpError]) -> None:
+        errors[request_id] = exception
+
+    batch = drive_service.new_batch_http_request(callback=_collect)
+    for file_id in file_ids:
+        batch.add(drive_service.files().delete(fileId=file_id), request_id=file_id)
+    batch.execute()
+    return errors
+
+
+def delete_files_batch(drive_service: Any, file_ids: Sequence[str]) -> Dict[str, bool]:
+    """Deletes several files in Google Drive, sending up to 100 deletes per HTTP request.
+
+    Files that are already gone (404) count as deleted and permission errors (403) as
+    failed; deletes that fail for other reasons, including rate limits, are retried one by
+    one with delete_file_by_id.
+
+    Args:
+        drive_service: The Google Drive service instance.
+        file_ids: IDs of the files to delete.
+
+    Returns:
+        Mapping of each file ID to True if it was deleted, False otherwise.
+
+    Raises:
+        Exception: If a batch request or a retried delete fails after retries.
+    """
+    if not drive_service:
+        logger.error("Cannot delete files: drive_service is None")
+        return dict.fromkeys(file_ids, False)
+    return _delete_batch(drive_service, file_ids, "file", delete_file_by_id, _forget_uploaded_file)
+
+
+def _delete_batch(
+    drive_service: Any,
+    item_ids: Sequence[str],
+    kind: str,
+    delete_one: Callable[[Any, str], bool],
+    forget: Callable[[str], None],
+) -> Dict[str, bool]:
+    """Delete files or folders in batch requests, retrying deletes without a final result one by one.
+
+    Args:
+        drive_service: The Google Drive service instance.
+        item_ids: IDs of the files or folders to delete.
+        kind: What is deleted ("file" or "folder"), for logging.
+        delete_one: Deletes a single item of this kind, used for deletes the batch did not settle.
+        forget: Drops cached state for an item the batch deleted or found already gone.
+
+    Returns:
+        Mapping of each ID to True if it was deleted, False otherwise.
+    """
+    # Batch request IDs must be unique, so duplicate IDs are deleted once
+    unique_ids = [item_id for item_id in dict.fromkeys(item_ids) if item_id]
+    results: Dict[str, bool] = dict.fromkeys(item_ids, False)
+
+    for start in range(0, len(unique_ids), MAX_BATCH_SIZE):
+        chunk = unique_ids[start : start + MAX_BATCH_SIZE]
+        logger.debug(f"Deleting {len(chunk)} {kind}s in one batch request")
+        errors = _execute_delete_batch(drive_service, chunk)
+        for item_id in chunk:
+            error = errors.get(item_id)
+            if error is not None:
+                result = _delete_error_result(error, kind, item_id)
+            else:
+                result = True if item_id in errors else None
+            # Deletes without a final result are retried on their own
+            results[item_id] = result if result is not None else delete_one(drive_service, item_id)
+            if result:
+                forget(item_id)
+
+    logger.info(f"Deleted {sum(results.values())} of {len(results)} {kind}s")
+    return results
+
+
+def _validate_upload_parameters(drive_service: Any, file_path: str, folder_id: str) -> Optional[os.stat_result]:
     """Validate upload parameters.
 
+    The file is statted once here and the result reused for its size.
+
     Args:
         drive_service: The Google Drive service instance.
         file_path: Path to the file to upload.
         folder_id: ID of the folder to upload to.
 
     Returns:
-        True if all parameters are valid, False otherwise.
+        The file's stat result if all parameters are valid, None otherwise.
     """
     if not drive_service:
         logger.error("Cannot upload file: drive_service is None")
-        return False
-
-    if not os.path.exists(file_path):
-        logger.error(f"Cannot upload file: file '{file_path}' does not exist")
-        return False
+        return None
 
     if not folder_id:
         logger.error("Cannot upload file: folder_id is empty")
-        return False
+        return None
 
-    return True
+    try:
+        return os.stat(file_path)
+    except OSError:
+        logger.error(f"Cannot upload file: file '{file_path}' does not exist")
+        return None
 
 
-def _handle_existing_file(drive_service: Any, file_name: str, folder_id: str, overwrite: bool) -> None:
-    """Handle existing file based on overwrite setting.
+def _find_existing_file(drive_service: Any, file_name: str, folder_id: str) -> Optional[str]:
+    """Find the file an overwriting upload replaces, treating lookup failures as no match.
 
     Args:
         drive_service: The Google Drive service instance.
         file_name: Name of the file to check.
         folder_id: ID of the folder to search in.
-        overwrite: Whether to overwrite existing files.
-    """
-    if not overwrite:
-        return
 
+    Returns:
+        The ID of the existing file, or None if there is none or the lookup failed.
+    """
     try:
-        existing_file_id = find_file_id(drive_service, file_name, folder_id)
-        if existing_file_id:
-            logger.info(f"Found existing file '{file_name}' with ID {existing_file_id}. Deleting it before upload.")
-            delete_success = delete_file_by_id(drive_service, existing_file_id)
-            if not delete_success:
-                logger.warning(f"Failed to delete existing file '{file_name}'. Proceeding with upload anyway.")
+        return find_file_id(drive_service, file_name, folder_id)
     except Exception as e:
         logger.warning(f"Error checking for existing file: {e}. Proceeding with upload anyway.")
+        return None
+
+
+def _upload_media(drive_service: Any, media: Any, file_name: str, folder_id: str, overwrite: bool) -> Optional[str]:
+    """Upload media to Google Drive, replacing a file with the same name when overwrite is set.
+
+    A file being replaced is updated in place with a single request, so it keeps its ID, link
+    and revision history and stays untouched if the upload fails. Resumable uploads whose
+    content has not changed are skipped. Files this process uploaded within FOLDER_CACHE_TTL
+    are not looked up again, nor is the first upload into a folder this process just created.
+
+    Args:
+        drive_service: The Google Drive service instance.
+        media: The resumable media body to upload.
+        file_name: Name of the file.
+        folder_id: ID of the folder to upload to.
+        overwrite: Whether to overwrite existing files.
+
+    Returns:
+        The webViewLink of the uploaded file, or None if upload failed.
+
+    Raises:
+        Exception: If the API call fails after retries.
+    """
+    new_folder = _claim_new_folder(folder_id)
+    if overwrite:
+        # Hashed at most once, however many existing files the content is compared with
+        media_md5 = lru_cache(maxsize=1)(partial(_media_md5, media))
+        uploaded_file_id = _get_uploaded_file_id(folder_id, file_name)
+        response = (
+            _overwrite_file(drive_service, media, file_name, folder_id, uploaded_file_id, media_md5)
+            if uploaded_file_id
+            else None
+        )
+        if response is None and new_folder:
+            logger.debug(f"Folder '{folder_id}' was just created, so '{file_name}' has nothing to replace")
+        elif response is None:
+            existing_file_id = _find_existing_file(drive_service, file_name, folder_id)
+            if existing_file_id:
+                logger.info(f"Found existing file '{file_name}' with ID {existing_file_id}. Updating it in place.")
+                response = _overwrite_file(
+                    drive_service, media, file_name, folder_id, existing_file_id, media_md5, in_place=True
+                )
+        if response is not None:
+            _cache_uploaded_file_id(folder_id, file_name, response.get("id"))
+            return response.get("webViewLink")
+
+    response = _execute_media_upload(drive_service, media, file_name, folder_id)
+    if overwrite:
+        _cache_uploaded_file_id(folder_id, file_name, response.get("id"))
+    return response.get("webViewLink")  # Return the webViewLink (shareable link)
+
+
+def _overwrite_file(
+    drive_service: Any,
+    media: Any,
+    file_name: str,
+    folder_id: str,
+    file_id: str,
+    media_md5: Callable[[], str],
+    in_place: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """Replace the content of an existing file, skipping resumable uploads of unchanged content.
+
+    The file's metadata is fetched once, before any content is sent: a file that was trashed,
+    renamed or moved is left alone, and a resumable upload is only sent when the checksum differs,
+    as one metadata request is cheaper than re-sending it.
+
+    Args:
+        drive_service: The Google Drive service instance.
+        media: The media body to upload.
+        file_name: Name of the file.
+        folder_id: ID of the folder the file is in.
+        file_id: ID of the file to replace.
+        media_md5: Returns the hex MD5 digest of the media's content.
+        in_place: Whether the file was just found by name in the folder, so for a non-resumable
+            upload its metadata need not be fetched.
+
+    Returns:
+        The file's metadata, or None if it is gone, trashed, renamed or moved and a new file
+        should be created instead.
+
+    Raises:
+        Exception: If the API call fails after retries.
+    """
+    resumable = media.resumable()
+    if in_place and not resumable:
+        return _update_existing_file(drive_service, media, file_name, folder_id, file_id)
+
+    try:
+        metadata = _get_existing_file_metadata(drive_service, file_id)
+    except HttpError as error:
+        if error.resp.status != 404:
+            raise
+        logger.info(f"Existing file '{file_name}' ({file_id}) no longer exists")
+        _cache_uploaded_file_id(folder_id, file_name, None)
+        return None
+
+    if not _file_in_place(metadata, file_name, folder_id):
+        logger.warning(f"Existing file '{file_name}' ({file_id}) was moved, renamed or trashed")
+        _cache_uploaded_file_id(folder_id, file_name, None)
+        return None
+    if resumable and metadata.get("md5Checksum") == media_md5():
+        logger.info(f"File '{file_name}' ({file_id}) is unchanged, skipping upload")
+        return metadata
+    return _update_existing_file(drive_service, media, file_name, folder_id, file_id)
+
+
+def _media_md5(media: Any) -> str:
+    """Compute the hex MD5 digest of a media body's content, as Drive reports it in md5Checksum."""
+    if isinstance(media, _PrefetchingMmapUpload):
+        return media.md5()
+    return _chunked_md5(media.getbytes, media.size())
+
+
+def _chunked_md5(read: Callable[[int, int], Any], size: int) -> str:
+    """Compute a hex MD5 digest CHECKSUM_CHUNK_SIZE bytes at a time, letting other greenlets run in between.
+
+    Args:
+        read: Returns the given number of bytes from the given offset.
+        size: Total number of bytes to hash.
+
+    Returns:
+        The hex MD5 digest.
+    """
+    digest = hashlib.md5(usedforsecurity=False)
+    for offset in range(0, size, CHECKSUM_CHUNK_SIZE):
+        digest.update(read(offset, min(CHECKSUM_CHUNK_SIZE, size - offset)))
+        time.sleep(0)  # Yields to the gevent hub when time is monkey-patched
+    return digest.hexdigest()
+
+
+@retry(max_retries=MAX_RETRIES, initial_delay=INITIAL_RETRY_DELAY, max_delay=MAX_RETRY_DELAY)
+def _get_existing_file_metadata(drive_service: Any, file_id: str) -> Dict[str, Any]:
+    """Fetch what is needed to tell whether an existing file can be kept as is."""
+    return drive_service.files().get(fileId=file_id, fields="id,name,parents,trashed,webViewLink,md5Checksum").execute()
+
+
+def _file_in_place(metadata: Dict[str, Any], file_name: str, folder_id: str) -> bool:
+    """Return True if a file's metadata shows it untrashed in the folder under the given name."""
+    return (
+        not metadata.get("trashed") and metadata.get("name") == file_name and folder_id in metadata.get("parents", [])
+    )
+
+
+def _update_existing_file(
+    drive_service: Any, media: Any, file_name: str, folder_id: str, file_id: str
+) -> Optional[Dict[str, Any]]:
+    """Replace the content of an existing file known to be in place.
+
+    Args:
+        drive_service: The Google Drive service instance.
+        media: The media body to upload.
+        file_name: Name of the file.
+        folder_id: ID of the folder the file is in.
+        file_id: ID of the file to replace.
+
+    Returns:
+        The updated file's metadata, or None if the file is gone and a new file should be
+        created instead.
+
+    Raises:
+        Exception: If the API call fails after retries.
+    """
+    try:
+        return _execute_media_upload(drive_service, media, file_name, folder_id, file_id=file_id)
+    except HttpError as error:
+        if error.resp.status != 404:
+            raise
+        logger.info(f"Existing file '{file_name}' ({file_id}) no longer exists")
+        _cache_uploaded_file_id(folder_id, file_name, None)
+        return None
+
+
+@lru_cache(maxsize=256)
+def _mimetype_for_suffix(suffix: str) -> str:
+    """Guess the MIME type for a file name suffix such as ".pdf" or ".tar.gz"."""
+    return mimetypes.guess_type(f"file{suffix}")[0] or "application/octet-stream"
+
+
+def _guess_mimetype(file_path: str) -> str:
+    """Guess a file's MIME type from its name as MediaFileUpload would, caching it per suffix.
+
+    Args:
+        file_path: Path or name of the file.
+
+    Returns:
+        The MIME type, or application/octet-stream if it cannot be guessed.
+    """
+    name = os.path.basename(file_path)
+    dot = name.find(".", 1)
+    return _mimetype_for_suffix(name[dot:] if dot > 0 else "")
+
+
+def _upload_chunk_size(file_size: int) -> int:
+    """Choose the resumable upload chunk size for a file.
+
+    Uses UPLOAD_CHUNK_SIZE, growing up to MAX_UPLOAD_CHUNK_SIZE for files large enough to
+    need more than 64 chunks. The result is a multiple of 256 KiB, as Drive requires.
+
+    Args:
+        file_size: Size of the file in bytes.
+
+    Returns:
+        Chunk size in bytes.
+    """
+    chunk_size = max(UPLOAD_CHUNK_SIZE, min(MAX_UPLOAD_CHUNK_SIZE, file_size // 64))
+    return max(UPLOAD_CHUNK_ALIGNMENT, chunk_size - chunk_size % UPLOAD_CHUNK_ALIGNMENT)
+
+
+class _PrefetchingMmapUpload(MediaIoBaseUpload):
+    """Media upload from a memory-mapped file that has the kernel read each next chunk ahead.
+
+    The readahead runs while the current chunk is being sent, so the disk read of the next
+    chunk overlaps the network transfer without a reader thread.
+    """
 
+    def __init__(self, mapped: mmap.mmap, mimetype: str, chunksize: int, resumable: bool):
+        super().__init__(mapped, mimetype, chunksize=chunksize, resumable=resumable)
+        self._mapped = mapped
 
-def _perform_resumable_upload(drive_service: Any, file_path: str, file_name: str, folder_id: str) -> Optional[str]:
+    def has_stream(self) -> bool:
+        # HttpRequest.next_chunk reads streams through stream() instead of getbytes, which would
+        # bypass the readahead, so each chunk is read through getbytes as bytes
+        return False
+
+    def getbytes(self, begin: int, length: int) -> bytes:
+        data = super().getbytes(begin, length)
+        start = begin + len(data)
+        if start < len(self._mapped) and hasattr(mmap, "MADV_WILLNEED"):
+            # madvise ranges start on a page boundary
+            aligned_start = start - start % mmap.PAGESIZE
+            self._mapped.madvise(mmap.MADV_WILLNEED, aligned_start, start - aligned_start + length)
+        return data
+
+    def md5(self) -> str:
+        """Compute the hex MD5 digest of the file straight from the memory map, without copying it."""
+        # The view must be released before the map can be closed
+        with memoryview(self._mapped) as view:
+            return _chunked_md5(lambda offset, length: view[offset : offset + length], len(view))
+
+
+def _perform_resumable_upload(
+    drive_service: Any, file_path: str, file_name: str, folder_id: str, overwrite: bool, file_size: int
+) -> Optional[str]:
     """Perform the actual file upload with resumable upload and progress tracking.
 
+    Files up to SIMPLE_UPLOAD_MAX_SIZE are sent in a single request instead, and files over
+    MMAP_UPLOAD_MIN_SIZE are read through a memory map, prefetching each next chunk.
+
     Args:
         drive_service: The Google Drive service instance.
         file_path: Path to the file to upload.
         file_name: Name of the file.
         folder_id: ID of the folder to upload to.
+        overwrite: Whether to overwrite existing files.
+        file_size: Size of the file in bytes.
 
     Returns:
         The webViewLink of the uploaded file, or None if upload failed.
 
+    Raises:
+        Exception: If the API call fails after retries.
+    """
+    if file_size > MMAP_UPLOAD_MIN_SIZE:
+        with open(file_path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            media = _PrefetchingMmapUpload(
+                mapped,
+                mimetype=_guess_mimetype(file_path),
+                chunksize=_upload_chunk_size(file_size),
+                resumable=file_size > SIMPLE_UPLOAD_MAX_SIZE,
+            )
+            return _upload_media(drive_service, media, file_name, folder_id, overwrite)
+        finally:
+            mapped.close()
+
+    # Resumable uploads survive network interruptions; small files are cheaper to resend whole
+    media = MediaFileUpload(
+        file_path,
+        mimetype=_guess_mimetype(file_path),
+        resumable=file_size > SIMPLE_UPLOAD_MAX_SIZE,
+        chunksize=_upload_chunk_size(file_size),
+    )
+    return _upload_media(drive_service, media, file_name, folder_id, overwrite)
+
+
+def _execute_media_upload(
+    drive_service: Any, media: Any, file_name: str, folder_id: str, file_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Send a media upload to Google Drive, chunk by chunk with progress logging if it is resumable.
+
+    Args:
+        drive_service: The Google Drive service instance.
+        media: The media body to upload.
+        file_name: Name of the file.
+        folder_id: ID of the folder to upload to.
+        file_id: ID of an existing file whose content to replace; a new file is created if None.
+
+    Returns:
+        The uploaded file's id and webViewLink.
+
     Raises:
         Exception: If the API call fails after retries.
     """
     try:
-        # Use resumable upload for all files to handle network interruptions
-        media = MediaFileUpload(file_path, resumable=True, chunksize=1024 * 1024)  # 1MB chunks
         file_metadata = {"name": file_name, "parents": [folder_id]}
 
         logger.debug(f"Starting upload of file '{file_name}'")
-        request = drive_service.files().create(body=file_metadata, media_body=media, fields="id,name,webViewLink,size")
+        if file_id:
+            request = drive_service.files().update(fileId=file_id, media_body=media, fields="id,webViewLink")
+        else:
+            request = drive_service.files().create(body=file_metadata, media_body=media, fields="id,webViewLink")
 
-        # Use resumable upload with progress tracking
-        response = None
+        # Use resumable upload with progress tracking; simple uploads complete in one request
+        response = None if media.resumable() else request.execute()
         last_progress = 0
         while response is None:
-            status, response = request.next_chunk()
+            status, response = request.next_chunk(num_retries=UPLOAD_CHUNK_RETRIES)
             if status:
                 progress = int(status.progress() * 100)
                 # Only log if progress has increased by at least 20%
@@ -558,10 +1768,13 @@ def _perform_resumable_upload(drive_service: Any, file_path: str, file_name: str
                     last_progress = progress
 
         logger.info(f"File '{file_name}' uploaded successfully. File ID: {response.get('id')}")
-        return response.get("webViewLink")  # Return the webViewLink (shareable link)
+        return response
     except HttpError as error:
         error_details = detailed_error_response(error)
         logger.error(f"Google Drive API error during file upload: {error_details}")
+        if error.resp.status == 404 and not file_id:
+            # The parent folder may have been deleted outside this service; resolve it again next time
+            invalidate_folder_cache()
         raise
     except Exception as e:
         logger.exception(f"Unexpected error during file upload: {e}")
@@ -569,15 +1782,22 @@ def _perform_resumable_upload(drive_service: Any, file_path: str, file_name: str
 
 
 @retry(max_retries=MAX_RETRIES, initial_delay=INITIAL_RETRY_DELAY, max_delay=MAX_RETRY_DELAY)
-@handle_drive_operations("upload_file_to_drive", "file_ops") if HAS_ENHANCED_LOGGING else lambda f: f
-def upload_file_to_drive(drive_service: Any, file_path: str, folder_id: str, overwrite: bool = True) -> Optional[str]:
+@_drive_operation("upload_file_to_drive", "file_ops")
+def upload_file_to_drive(
+    drive_service: Any, file_path: str, folder_id: str, overwrite: bool = True, file_name: Optional[str] = None
+) -> Optional[str]:
     """Uploads a file to Google Drive in the specified folder with enhanced logging.
 
+    folder_id is used as given, without any folder lookups. Resolve a path once with
+    create_folder_if_not_exists or get_folder_id_by_path and reuse the ID for its uploads;
+    re-uploading a file uploaded within FOLDER_CACHE_TTL then updates it in place without lookups.
+
     Args:
         drive_service: The Google Drive service instance.
         file_path: Path to the file to upload.
         folder_id: ID of the folder to upload to.
         overwrite: If True, overwrites existing file with the same name. If False, keeps both files.
+        file_name: Name to give the file in Google Drive. Defaults to the basename of file_path.
 
     Returns:
         The webViewLink (shareable link) of the uploaded file, or None if upload failed.
@@ -586,25 +1806,208 @@ def upload_file_to_drive(drive_service: Any, file_path: str, folder_id: str, ove
         Exception: If the API call fails after retries.
     """
     # Validate parameters
-    if not _validate_upload_parameters(drive_service, file_path, folder_id):
+    file_stat = _validate_upload_parameters(drive_service, file_path, folder_id)
+    if file_stat is None:
         return None
 
-    file_name = os.path.basename(file_path)
-    file_size = os.path.getsize(file_path)
+    file_name = file_name or os.path.basename(file_path)
+    file_size = file_stat.st_size
 
     logger.info(f"Preparing to upload file '{file_name}' ({file_size} bytes) to folder '{folder_id}'")
 
-    # Handle existing file based on overwrite setting
-    _handle_existing_file(drive_service, file_name, folder_id, overwrite)
-
     # Perform the upload
-    return _perform_resumable_upload(drive_service, file_path, file_name, folder_id)
+    return _perform_resumable_upload(drive_service, file_path, file_name, folder_id, overwrite, file_size)
+
+
+def upload_files_to_drive(
+    drive_service: Any,
+    uploads: Sequence[Tuple[str, str]],
+    overwrite: bool = True,
+    max_concurrency: Optional[int] = None,
+) -> List[Optional[str]]:
+    """Uploads several independent files to Google Drive concurrently.
+
+    Each file is uploaded with upload_file_to_drive on a bounded thread pool. The service's
+    pooled HTTP transport gives every in-flight upload its own connection, and the shared
+    rate limit still applies to the metadata calls.
+
+    Args:
+        drive_service: The Google Drive service instance.
+        uploads: Pairs of (file_path, folder_id) to upload.
+        overwrite: If True, overwrites existing files with the same name. If False, keeps both files.
+        max_concurrency: Maximum uploads in flight. Defaults to UPLOAD_CONCURRENCY.
+
+    Returns:
+        The webViewLink of each uploaded file, in the order given, or None for uploads that failed.
+    """
+    if not uploads:
+        return []
+
+    def _upload(file_path: str, folder_id: str) -> Optional[str]:
+        try:
+            return upload_file_to_drive(drive_service, file_path, folder_id, overwrite=overwrite)
+        except Exception as e:
+            logger.error(f"Upload of '{file_path}' failed: {e}")
+            return None
+
+    workers = min(max_concurrency or UPLOAD_CONCURRENCY, len(uploads))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="drive-upload") as executor:
+        futures = [executor.submit(_upload, file_path, folder_id) for file_path, folder_id in uploads]
+    return [future.result() for future in futures]
+
+
+@retry(max_retries=MAX_RETRIES, initial_delay=INITIAL_RETRY_DELAY, max_delay=MAX_RETRY_DELAY)
+@_drive_operation("upload_stream_to_drive", "file_ops")
+def upload_stream_to_drive(
+    drive_service: Any,
+    stream: BinaryIO,
+    file_name: str,
+    folder_id: str,
+    mimetype: Optional[str] = None,
+    overwrite: bool = True,
+) -> Optional[str]:
+    """Uploads the contents of a file-like object to Google Drive without staging it on disk.
+
+    Args:
+        drive_service: The Google Drive service instance.
+        stream: Seekable binary stream with the file contents.
+        file_name: Name to give the file in Google Drive.
+        folder_id: ID of the folder to upload to.
+        mimetype: MIME type of the content. Defaults to application/octet-stream.
+        overwrite: If True, overwrites existing file with the same name. If False, keeps both files.
+
+    Returns:
+        The webViewLink (shareable link) of the uploaded file, or None if upload failed.
+
+    Raises:
+        Exception: If the API call fails after retries.
+    """
+    if not drive_service:
+        logger.error("Cannot upload file: drive_service is None")
+        return None
+
+    if not folder_id:
+        logger.error("Cannot upload file: folder_id is empty")
+        return None
+
+    # Measure the stream and rewind it, so a retried attempt re-sends the content from the start
+    stream.seek(0, os.SEEK_END)
+    file_size = stream.tell()
+    stream.seek(0)
+
+    logger.info(f"Preparing to upload stream '{file_name}' ({file_size} bytes) to folder '{folder_id}'")
+
+    media = MediaIoBaseUpload(
+        stream,
+        mimetype=mimetype or "application/octet-stream",
+        chunksize=_upload_chunk_size(file_size),
+        resumable=file_size > SIMPLE_UPLOAD_MAX_SIZE,
+    )
+    return _upload_media(drive_service, media, file_name, folder_id, overwrite)
+
+
+def _fetch_root_folder_id(drive_service: Any) -> str:
+    """Fetch the ID of the root folder of My Drive, which search results list as a parent."""
+    return drive_service.files().get(fileId="root", fields="id").execute()["id"]
+
+
+def _get_root_folder_id(drive_service: Any) -> str:
+    """Return the ID of the root folder of My Drive, cached under the empty path.
+
+    Args:
+        drive_service: The Google Drive service instance.
+
+    Returns:
+        The root folder ID.
+    """
+    root_id = _get_cached_folder_id(())
+    if not root_id:
+        root_id = _fetch_root_folder_id(drive_service)
+        _cache_folder_id((), root_id)
+    return root_id
+
+
+def _list_folders_named_page(drive_service: Any, names: Sequence[str], page_token: Optional[str]) -> Dict[str, Any]:
+    """Fetch one page of the folders with any of the given names, oldest first."""
+    return (
+        drive_service.files()
+        .list(
+            q=_Q_FOLDERS_NAMED_ANY.format(names=" or ".join(f"name={_drive_escape(name)}" for name in names)),
+            fields="nextPageToken,files(id,name,parents)",
+            orderBy="createdTime",
+            pageSize=LIST_PAGE_SIZE,
+            spaces="drive",
+            corpora="user",
+            pageToken=page_token,
+        )
+        .execute()
+    )
+
+
+def _get_cached_ancestor(folders: Tuple[str, ...]) -> Tuple[Optional[str], int]:
+    """Return the ID and depth of the deepest ancestor of a folder path whose ID is cached, or (None, 0)."""
+    for depth in range(len(folders) - 1, 0, -1):
+        folder_id = _get_cached_folder_id(folders[:depth])
+        if folder_id:
+            return folder_id, depth
+    return None, 0
+
+
+def _resolve_folder_path_listed(drive_service: Any, folders: Tuple[str, ...]) -> Tuple[str, int, bool]:
+    """Resolve leading folder path segments from a single search for all of their names.
+
+    Lists every folder named like any segment below the deepest cached ancestor, then walks
+    the results from that ancestor (or the root), matching each segment to a folder with that
+    name whose parent is the previously resolved folder. Where several match, the oldest is
+    used, as in find_folder_id.
+
+    Args:
+        drive_service: The Google Drive service instance.
+        folders: Folder names in the path, from the top level down.
+
+    Returns:
+        Tuple of (folder_id, resolved, missing) where folder_id is the ID of the deepest folder
+        resolved ("root" if none) and resolved is the number of segments resolved. missing is
+        True when the search returned every matching folder and the next segment is not among
+        them, so it does not exist. Otherwise, segments that could not be resolved from the
+        search should be looked up one by one.
+    """
+    ancestor_id, start = _get_cached_ancestor(folders)
+    names = tuple(dict.fromkeys(folders[start:]))
+    children: Dict[Tuple[str, str], str] = {}
+    page_token = None
+    try:
+        current_folder_id = ancestor_id or _get_root_folder_id(drive_service)
+        for _ in range(PATH_QUERY_MAX_PAGES):
+            results = _list_folders_named_page(drive_service, names, page_token)
+            for item in results.get("files", []):
+                for parent_id in item.get("parents", []):
+                    children.setdefault((parent_id, item["name"]), item["id"])
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                break
+    except HttpError as error:
+        logger.debug(f"Folder path search failed, resolving path segment by segment: {error}")
+        return ancestor_id or "root", start, False
+
+    for index in range(start, len(folders)):
+        folder_id = children.get((current_folder_id, folders[index]))
+        if not folder_id:
+            # Without further pages, the search saw every folder with this name. Unresolved paths
+            # continue from the "root" alias, which the subfolder listings are cached under.
+            return current_folder_id if index else "root", index, not page_token
+        current_folder_id = folder_id
+
+    return current_folder_id, len(folders), False
 
 
+@single_flight()
 @retry(max_retries=MAX_RETRIES, initial_delay=INITIAL_RETRY_DELAY, max_delay=MAX_RETRY_DELAY)
 def get_folder_id_by_path(drive_service: Any, folder_path: str) -> Optional[str]:
     """Gets the ID of a folder given its full path.
 
+    Concurrent lookups of the same path wait for and share a single resolution.
+
     Args:
         drive_service: The Google Drive service instance.
         folder_path: Path of folders, separated by '/'.
@@ -620,18 +2023,27 @@ def get_folder_id_by_path(drive_service: Any, folder_path: str) -> Optional[str]
         return None
 
     parent_folder_id = "root"  # Start at the root of Drive
-    folders = folder_path.strip("/").split("/")
-
-    # Skip empty folder names
-    folders = [f for f in folders if f]
+    folders = _split_folder_path(folder_path)
     if not folders:
         return parent_folder_id
 
+    current_folder_id = _get_cached_folder_id(folders)
+    if current_folder_id:
+        logger.debug(f"Using cached folder ID for '{folder_path}': {current_folder_id}")
+        return current_folder_id
     current_folder_id = parent_folder_id
 
     try:
         logger.debug(f"Looking up folder path: {folder_path}")
-        for folder_name in folders:
+        # Resolve multi-level paths from one search; anything left unresolved is looked up per segment
+        resolved = 0
+        if 1 < len(folders) <= MAX_PATH_QUERY_DEPTH:
+            current_folder_id, resolved, missing = _resolve_folder_path_listed(drive_service, folders)
+            if missing:
+                logger.info(f"Folder '{folders[resolved]}' not found in path '{folder_path}'")
+                return None
+
+        for folder_name in folders[resolved:]:
             folder_id = find_folder_id(drive_service, folder_name, current_folder_id)
             if folder_id:
                 current_folder_id = folder_id
@@ -641,14 +2053,38 @@ def get_folder_id_by_path(drive_service: Any, folder_path: str) -> Optional[str]
                 return None  # Folder path not found
 
         logger.info(f"Found folder path '{folder_path}' with ID: {current_folder_id}")
+        _cache_folder_id(folders, current_folder_id)
         return current_folder_id  # Return the ID of the final folder in the path
     except Exception as e:
         logger.exception(f"Error getting folder ID for path '{folder_path}': {e}")
         raise
 
 
+def get_folder_ids_by_paths(drive_service: Any, folder_paths: Sequence[str]) -> Dict[str, Optional[str]]:
+    """Gets the IDs of several folders given their full paths, resolving the paths concurrently.
+
+    Segments within one path depend on each other and are still walked in order; distinct
+    paths are looked up in parallel on a bounded thread pool. API calls remain subject to
+    the shared rate limit.
+
+    Args:
+        drive_service: The Google Drive service instance.
+        folder_paths: Paths of folders, separated by '/'.
+
+    Returns:
+        Mapping of each folder path to its folder ID, or None if the path does not exist.
+
+    Raises:
+        Exception: If a lookup fails after retries.
+    """
+    futures = {
+        folder_path: _path_lookup_executor.submit(get_folder_id_by_path, drive_service, folder_path)
+        for folder_path in dict.fromkeys(folder_paths)
+    }
+    return {folder_path: future.result() for folder_path, future in futures.items()}
+
+
 @retry(max_retries=MAX_RETRIES, initial_delay=INITIAL_RETRY_DELAY, max_delay=MAX_RETRY_DELAY)
-@rate_limit(calls_per_second=API_CALLS_PER_SECOND, max_burst=MAX_BURST)
 def delete_folder_by_id(drive_service: Any, folder_id: str) -> bool:
     """Deletes a folder in Google Drive by its folder ID.
 
@@ -678,22 +2114,19 @@ def delete_folder_by_id(drive_service: Any, folder_id: str) -> bool:
     try:
         logger.debug(f"Deleting folder with ID: {folder_id}")
         drive_service.files().delete(fileId=folder_id).execute()
+        # Cached paths may end at or pass through the deleted folder
+        _forget_folder(folder_id)
         logger.info(f"Successfully deleted folder with ID: {folder_id}")
         return True  # Deletion successful
     except HttpError as error:
-        # If the folder doesn't exist (404), consider it a success
-        if error.resp.status == 404:
-            logger.warning(f"Folder with ID {folder_id} not found (already deleted)")
-            return True
+        result = _delete_error_result(error, "folder", folder_id)
+        if result:
+            _forget_folder(folder_id)  # Already gone
+        if result is not None:
+            return result
 
         error_details = detailed_error_response(error)
         logger.error(f"Google Drive API error while deleting folder: {error_details}")
-
-        # For permission errors, don't retry
-        if error.resp.status == 403:
-            logger.error(f"Permission denied when deleting folder with ID: {folder_id}")
-            return False
-
         raise
     except Exception as e:
         logger.exception(f"Unexpected error while deleting folder with ID {folder_id}: {e}")
@@ -701,7 +2134,7 @@ def delete_folder_by_id(drive_service: Any, folder_id: str) -> bool:
 
 
 @retry(max_retries=MAX_RETRIES, initial_delay=INITIAL_RETRY_DELAY, max_delay=MAX_RETRY_DELAY)
-@handle_drive_operations("delete_folder_by_path", "folder_ops") if HAS_ENHANCED_LOGGING else lambda f: f
+@_drive_operation("delete_folder_by_path", "folder_ops")
 def delete_folder_by_path(drive_service: Any, folder_path: str) -> bool:
     """Deletes a folder in Google Drive given its full path with enhanced logging.
 
@@ -738,3 +2171,38 @@ def delete_folder_by_path(drive_service: Any, folder_path: str) -> bool:
     except Exception as e:
         logger.exception(f"Error deleting folder at path '{folder_path}': {e}")
         raise
+
+
+def delete_folders_by_paths(drive_service: Any, folder_paths: Sequence[str]) -> Dict[str, bool]:
+    """Deletes several folders given their full paths, sending up to 100 deletes per HTTP request.
+
+    The paths are resolved concurrently as in get_folder_ids_by_paths, then the folders are
+    deleted together in batch requests instead of one request each, as in delete_files_batch.
+
+    Args:
+        drive_service: The Google Drive service instance.
+        folder_paths: Paths of the folders to delete, separated by '/'.
+
+    Returns:
+        Mapping of each folder path to True if the folder was deleted, False otherwise.
+
+    Raises:
+        Exception: If a lookup or delete fails after retries.
+    """
+    results = dict.fromkeys(folder_paths, False)
+    if not drive_service:
+        logger.error("Cannot delete folders: drive_service is None")
+        return results
+
+    folder_ids = get_folder_ids_by_paths(drive_service, [folder_path for folder_path in folder_paths if folder_path])
+    # Paths without folder names resolve to the root folder, which is never deleted
+    targets = {path: folder_id for path, folder_id in folder_ids.items() if folder_id and folder_id != "root"}
+    # Cached paths may end at or pass through a deleted folder, so each is forgotten
+    deleted = _delete_batch(drive_service, list(targets.values()), "folder", delete_folder_by_id, _forget_folder)
+    for folder_path, folder_id in targets.items():
+        results[folder_path] = deleted[folder_id]
+
+    missing = [folder_path for folder_path in results if folder_path not in targets]
+    if missing:
+        logger.warning(f"Folder paths not found, cannot delete: {missing}")
+    return results
@@ -0,0 +1,41 @@
+"""Gunicorn configuration for running the service in production.
+
+Usage:
+    gunicorn -c gunicorn_conf.py wsgi:app
+
+Drive API calls are network-bound, so workers use gevent (when installed) to keep many
+requests in flight per process. Gunicorn's gevent worker monkey-patches the standard
+library before the application is imported. Without gevent, threaded workers are used.
+"""
+
+import multiprocessing
+import os
+
+try:
+    import gevent  # noqa: F401
+
+    HAS_GEVENT = True
+except ImportError:
+    HAS_GEVENT = False
+
+# Bind on all interfaces so the container port mapping works
+bind = os.environ.get("GUNICORN_BIND", f"0.0.0.0:{os.environ.get('PORT', '5000')}")  # nosec B104
+
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gevent" if HAS_GEVENT else "gthread")
+workers = int(os.environ.get("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+
+# Concurrent connections per gevent worker / threads per gthread worker
+worker_connections = int(os.environ.get("GUNICORN_WORKER_CONNECTIONS", "1000"))
+threads = int(os.environ.get("GUNICORN_THREADS", "8"))
+
+# Let the kernel balance incoming connections across workers
+reuse_port = True
+
+# Keep client connections open between requests; allow slow uploads to finish
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", "30"))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = 30
+
+accesslog = None  # Request logging is handled by the application
+errorlog = "-"
+loglevel = os.environ.get("LOG_LEVEL", "INFO").lower()
@@ -1,9 +1,12 @@
 """Utility functions for implementing retry logic and error handling."""
 
 import contextlib
+import email.utils
 import functools
 import logging
+import threading
 import time
+from concurrent.futures import Future
 from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 from googleapiclient.errors import HttpError
@@ -32,6 +35,12 @@ RETRYABLE_GOOGLE_ERRORS = [
     "transientError",
 ]
 
+# Google API error reasons that mean requests are being sent too fast
+RATE_LIMIT_GOOGLE_ERRORS = ["rateLimitExceeded", "userRateLimitExceeded"]
+
+# Status codes whose Retry-After header tells us when to try again
+RETRY_AFTER_STATUS_CODES = [429, 503]
+
 
 class RetryableError(Exception):
     """Exception class for errors that should trigger a retry."""
@@ -39,6 +48,67 @@ class RetryableError(Exception):
     pass
 
 
+def _find_http_error(error: Optional[BaseException]) -> Optional[HttpError]:
+    """Return the HttpError behind an exception, following explicit exception chaining."""
+    while error is not None:
+        if isinstance(error, HttpError):
+            return error
+        error = error.__cause__
+    return None
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """
+    Get the delay requested by a Retry-After header on a rate-limited or unavailable response.
+
+    Args:
+        error: The exception that was raised, or an exception raised from an HttpError
+
+    Returns:
+        Seconds to wait before retrying, or None if the response did not say
+    """
+    http_error = _find_http_error(error)
+    if http_error is None or not http_error.resp:
+        return None
+    # Rate limit 403s are throttled like 429s and may carry the same hint
+    if http_error.resp.status not in RETRY_AFTER_STATUS_CODES and not is_rate_limit_error(http_error):
+        return None
+
+    value = http_error.resp.get("retry-after")
+    if not isinstance(value, str):
+        return None
+
+    # Retry-After is either a number of seconds or an HTTP date
+    with contextlib.suppress(ValueError):
+        return max(0.0, float(value))
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """
+    Determine if an error means the API is rejecting requests for being sent too fast.
+
+    Args:
+        error: The exception that was raised, or an exception raised from an HttpError
+
+    Returns:
+        True for 429 responses and 403 responses with a rate limit reason, False otherwise
+    """
+    http_error = _find_http_error(error)
+    if http_error is None or not http_error.resp:
+        return False
+    if http_error.resp.status == 429:
+        return True
+    if http_error.resp.status != 403 or not isinstance(http_error.content, bytes):
+        return False
+    error_content = http_error.content.decode("utf-8", errors="replace")
+    return any(reason in error_content for reason in RATE_LIMIT_GOOGLE_ERRORS)
+
+
 def is_retryable_error(error: Exception) -> bool:
     """
     Determine if an error should trigger a retry.
@@ -49,14 +119,16 @@ def is_retryable_error(error: Exception) -> bool:
     Returns:
         True if the error should trigger a retry, False otherwise
     """
-    # Check if it's an HttpError with a retryable status code
-    if isinstance(error, HttpError):
-        if error.resp.status in RETRYABLE_STATUS_CODES:
+    # Check if it's an HttpError with a retryable status code, including HttpErrors
+    # that were converted to Drive exceptions with "raise ... from"
+    http_error = _find_http_error(error)
+    if http_error is not None:
+        if http_error.resp.status in RETRYABLE_STATUS_CODES:
             return True
 
         # Check for specific Google API error reasons
         try:
-            error_content = error.content.decode("utf-8")
+            error_content = http_error.content.decode("utf-8")
             for retryable_error in RETRYABLE_GOOGLE_ERRORS:
                 if retryable_error in error_content:
                     return True
@@ -146,6 +218,17 @@ def retry(
                     # Calculate delay with exponential backoff and optional jitter
                     delay = _calculate_retry_delay(delay, max_delay, backoff_factor, jitter)
 
+                    # Honor the server's Retry-After; give up rather than wait longer than max_delay
+                    retry_after = get_retry_after(e)
+                    if retry_after is not None:
+                        if retry_after > max_delay:
+                            logger.warning(
+                                f"Not retrying {func.__name__}: server asked to wait {retry_after:.0f}s, "
+                                f"more than the {max_delay:.0f}s limit"
+                            )
+                            raise
+                        delay = max(delay, retry_after)
+
                     logger.warning(
                         f"Retryable error in {func.__name__}: {str(e)}. "
                         f"Retrying in {delay:.2f}s ({retry_count + 1}/{max_retries})"
@@ -164,42 +247,106 @@ def retry(
     return decorator
 
 
-def rate_limit(calls_per_second: float = 1.0, max_burst: int = 1) -> Callable:
+class TokenBucket:
+    """
+    Thread-safe token bucket whose refill rate adapts to rate limit errors.
+
+    The rate starts at calls_per_second. penalize() halves it (down to min_rate) and drains
+    the bucket; each reward() raises it again by a twentieth of calls_per_second. One bucket
+    can be shared by several functions so that together they stay under a single limit.
+    """
+
+    def __init__(self, calls_per_second: float, max_burst: int, min_rate: Optional[float] = None):
+        """
+        Initialize the bucket full.
+
+        Args:
+            calls_per_second: Maximum sustained calls per second
+            max_burst: Maximum number of calls allowed in a burst
+            min_rate: Lowest rate penalize() may reduce to (default: calls_per_second / 16)
+        """
+        self.max_rate = calls_per_second
+        self.min_rate = min_rate if min_rate is not None else calls_per_second / 16
+        self.rate = calls_per_second
+        self.max_burst = max_burst
+        self.tokens = float(max_burst)
+        self.last_refill = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available.
+
+        The token is reserved under the lock and the wait happens outside it, so concurrent
+        callers queue up at the current rate instead of all waking at once.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.time()
+            self.tokens = min(self.max_burst, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1.0
+            wait_time = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+    def reset(self) -> None:
+        """Refill the bucket and restore the configured rate."""
+        with self._lock:
+            self.rate = self.max_rate
+            self.tokens = float(self.max_burst)
+
+    def penalize(self) -> None:
+        """Slow down after a rate limit error."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+
+    def reward(self) -> None:
+        """Speed back up towards the configured rate after a successful call."""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+def rate_limit(calls_per_second: float = 1.0, max_burst: int = 1, bucket: Optional[TokenBucket] = None) -> Callable:
     """
     Decorator that rate limits a function to a maximum number of calls per second.
 
+    Rate limit errors (429, or 403 with a rate limit reason) slow the bucket down and
+    successful calls speed it back up.
+
     Args:
         calls_per_second: Maximum number of calls per second
         max_burst: Maximum number of calls allowed in a burst
+        bucket: Token bucket shared with other functions; when given, calls_per_second and
+            max_burst are ignored
 
     Returns:
         Decorated function with rate limiting
     """
-    last_called = [0.0]  # Use a list for mutable closure
-    tokens = [max_burst]  # Token bucket
+    limiter = bucket if bucket is not None else TokenBucket(calls_per_second, max_burst)
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            current_time = time.time()
-            time_since_last = current_time - last_called[0]
-
-            # Add tokens based on time elapsed (up to max_burst)
-            new_tokens = time_since_last * calls_per_second
-            tokens[0] = min(max_burst, tokens[0] + new_tokens)
-
-            # If we have less than 1 token, wait until we have at least 1
-            if tokens[0] < 1.0:
-                wait_time = (1.0 - tokens[0]) / calls_per_second
-                logger.debug(f"Rate limiting {func.__name__}, waiting {wait_time:.2f}s")
-                time.sleep(wait_time)
-                tokens[0] = 1.0  # Now we have exactly 1 token
+            wait_time = limiter.acquire()
+            if wait_time:
+                logger.debug(f"Rate limited {func.__name__}, waited {wait_time:.2f}s")
 
-            # Consume 1 token and call the function
-            tokens[0] -= 1.0
-            last_called[0] = time.time()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    limiter.penalize()
+                    logger.warning(f"Rate limit hit in {func.__name__}, slowing down to {limiter.rate:.2f} calls/s")
+                raise
 
-            return func(*args, **kwargs)
+            limiter.reward()
+            return result
 
         return wrapper
 
@@ -277,6 +424,74 @@ def circuit_breaker(
     return decorator
 
 
+def single_flight(ttl: float = 0.0) -> Callable:
+    """
+    Decorator that coalesces concurrent calls with the same arguments into a single execution.
+
+    Callers arriving while a call is in flight wait for it and share its result or exception.
+    Successful (truthy) results are also reused for ttl seconds after the call completes; a falsy
+    result, like an exception, is only shared with callers already waiting, so the next call
+    tries again. The decorated function gains a cache_clear() method to drop all remembered calls.
+
+    Args:
+        ttl: Time in seconds to keep returning a completed call's successful result
+
+    Returns:
+        Decorated function with single-flight deduplication
+    """
+    calls: Dict[Any, List[Any]] = {}  # key -> [future, expires_at (None while in flight)]
+    lock = threading.Lock()
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            with lock:
+                # Evict completed calls whose results have expired
+                for expired_key in [k for k, (_, expires_at) in calls.items() if expires_at and expires_at <= now]:
+                    del calls[expired_key]
+
+                entry = calls.get(key)
+                if entry is None:
+                    future: Future = Future()
+                    calls[key] = [future, None]
+                    leader = True
+                else:
+                    future = entry[0]
+                    leader = False
+
+            if not leader:
+                logger.debug(f"Joining in-flight call to {func.__name__}")
+                return future.result()
+
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                with lock:
+                    calls.pop(key, None)
+                future.set_exception(e)
+                raise
+
+            with lock:
+                if ttl > 0 and result and key in calls:
+                    calls[key][1] = time.monotonic() + ttl
+                else:
+                    calls.pop(key, None)
+            future.set_result(result)
+            return result
+
+        def cache_clear() -> None:
+            with lock:
+                calls.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
 def detailed_error_response(error: Exception) -> Dict[str, Any]:
     """Generate a detailed error response dictionary from an exception.
 
@@ -129,12 +129,15 @@ def handle_drive_operations(operation_name: str, component: str = "drive_operati
     """
 
     def decorator(func: Callable) -> Callable:
+        # Built once per decorated function rather than on every call
+        logger = get_logger(func.__module__, component)
+        start_message = f"Starting {operation_name}"
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            logger = get_logger(func.__module__, component)
             start_time = time.time()
 
-            logger.info(f"Starting {operation_name}")
+            logger.info(start_message)
 
             try:
                 # Execute with circuit breaker protection
@@ -201,12 +204,15 @@ def handle_api_errors(operation_name: str, component: str = "api"):
     """
 
     def decorator(func: Callable) -> Callable:
+        # Built once per decorated function rather than on every call
+        logger = get_logger(func.__module__, component)
+        start_message = f"Starting {operation_name}"
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            logger = get_logger(func.__module__, component)
             start_time = time.time()
 
-            logger.info(f"Starting {operation_name}")
+            logger.info(start_message)
 
             try:
                 result = func(*args, **kwargs)
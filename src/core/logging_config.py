@@ -6,12 +6,17 @@ established in the match-list-processor service. It includes service context, co
 separation, location information, and comprehensive error handling for Google Drive operations.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import re
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+# Background listener that writes queued log records to the configured handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
 
 
 class GoogleDriveFormatter(logging.Formatter):
@@ -109,10 +114,15 @@ def configure_logging(
     enable_structured: bool = True,
     log_dir: str = "logs",
     log_file: str = "google-drive-service.log",
+    enable_async: bool = True,
 ) -> None:
     """
     Configure enhanced logging for Google Drive service.
 
+    With enable_async, records are formatted in the calling thread and handed to a
+    QueueHandler; a background QueueListener performs the console and file writes so
+    request threads never block on log I/O.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         enable_console: Enable console logging
@@ -120,10 +130,17 @@ def configure_logging(
         enable_structured: Enable structured logging format
         log_dir: Directory for log files
         log_file: Log file name
+        enable_async: Write log records from a background thread
     """
+    global _queue_listener
     # Convert log level string to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
 
+    # Stop a listener from a previous configuration, flushing its queued records
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
     # Clear existing handlers
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
@@ -134,13 +151,16 @@ def configure_logging(
 
     # Create formatter
     formatter = GoogleDriveFormatter(enable_structured=enable_structured)
+    # In async mode records are formatted before queueing, so the writing handlers pass the message through
+    handler_formatter = logging.Formatter("%(message)s") if enable_async else formatter
+    handlers: List[logging.Handler] = []
 
     # Console handler
     if enable_console:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(numeric_level)
-        console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        console_handler.setFormatter(handler_formatter)
+        handlers.append(console_handler)
 
     # Create log directory if it doesn't exist
     if enable_file:
@@ -151,8 +171,19 @@ def configure_logging(
         file_handler = logging.handlers.RotatingFileHandler(
             os.path.join(log_dir, log_file), maxBytes=10 * 1024 * 1024, backupCount=5  # 10MB
         )
-        file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(handler_formatter)
+        handlers.append(file_handler)
+
+    if enable_async and handlers:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(formatter)
+        root_logger.addHandler(queue_handler)
+        _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
 
     # Reduce verbosity of third-party libraries
     logging.getLogger("requests").setLevel(logging.WARNING)
@@ -166,10 +197,17 @@ def configure_logging(
     logger = get_logger(__name__, "logging_config")
     logger.info(
         f"Logging configured: level={log_level}, console={enable_console}, "
-        f"file={enable_file}, structured={enable_structured}"
+        f"file={enable_file}, structured={enable_structured}, async={enable_async}"
     )
 
 
+@atexit.register
+def _stop_queue_listener() -> None:
+    """Flush queued log records on interpreter exit."""
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+
 def log_error_context(
     logger: logging.Logger, error: Exception, operation: str, context: Optional[Dict[str, Any]] = None
 ) -> None:
@@ -197,7 +235,10 @@ def log_error_context(
             filtered_context[key] = value
 
     logger.error(
-        f"Error in {operation}: {error.__class__.__name__}: {str(error)}",
+        "Error in %s: %s: %s",
+        operation,
+        error.__class__.__name__,
+        error,
         extra={"operation": operation, "error_type": error.__class__.__name__, "context": filtered_context},
         exc_info=True,
     )
@@ -7,6 +7,9 @@ and circuit breaker isolation between tests.
 
 import pytest
 
+from app import _exchange_code_once, _health_response_cache, _invalidate_service_status
+from google_drive_utils import _drive_api_bucket, invalidate_folder_cache, invalidate_token_state
+
 # Import enhanced logging components if available
 try:
     from src.core.error_handling import reset_circuit_breaker
@@ -16,6 +19,60 @@ except ImportError:
     HAS_ENHANCED_LOGGING = False
 
 
+@pytest.fixture(autouse=True)
+def reset_token_state():
+    """Reset the cached token file state between tests."""
+    invalidate_token_state()
+    yield
+    invalidate_token_state()
+
+
+@pytest.fixture(autouse=True)
+def reset_folder_cache():
+    """Forget cached folder IDs between tests."""
+    invalidate_folder_cache()
+    yield
+    invalidate_folder_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_drive_api_bucket():
+    """Refill the shared Drive API rate limit bucket between tests."""
+    _drive_api_bucket.reset()
+    yield
+    _drive_api_bucket.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_health_response():
+    """Reset the cached /health response between tests."""
+    _health_response_cache["body"] = None
+    yield
+    _health_response_cache["body"] = None
+
+
+@pytest.fixture(autouse=True)
+def reset_service_status():
+    """Reset the cached /service/status result between tests."""
+    _invalidate_service_status()
+    yield
+    _invalidate_service_status()
+
+
+@pytest.fixture(autouse=True)
+def reset_oauth_exchanges():
+    """Forget deduplicated OAuth code exchanges between tests."""
+    _exchange_code_once.cache_clear()
+    yield
+    _exchange_code_once.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def isolate_upload_jobs(tmp_path, monkeypatch):
+    """Keep background upload job records in a per-test directory."""
+    monkeypatch.setattr("app.UPLOAD_JOB_DIR", str(tmp_path / "upload_jobs"))
+
+
 @pytest.fixture(autouse=True)
 def reset_enhanced_logging():
     """Reset enhanced logging circuit breaker between tests."""
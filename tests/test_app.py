@@ -1,8 +1,20 @@
 import io
+import itertools
 import json
+import os
+import tempfile
+import threading
+import time
 import unittest
+from datetime import datetime
+from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
+from flask.json.provider import DefaultJSONProvider
+from googleapiclient.errors import HttpError
+from werkzeug.datastructures import FileStorage
+
+import app as app_module
 from app import app
 
 
@@ -36,6 +48,38 @@ class TestApp(unittest.TestCase):
         self.assertIn("timestamp", response_data)
         self.assertIn("version", response_data)
 
+    def test_ping_and_health_head(self):
+        """Test HEAD requests to the health endpoints return headers without a body."""
+        for path in ("/ping", "/health"):
+            response = self.client.head(path)
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data, b"")
+            self.assertGreater(int(response.headers["Content-Length"]), 0)
+
+    @patch("app.logger")
+    def test_health_check_bypasses_flask(self, mock_logger):
+        """Test that /health is served by the middleware without running request hooks."""
+        response = self.client.get("/health")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(int(response.headers["Content-Length"]), len(response.data))
+        mock_logger.info.assert_not_called()
+
+    def test_health_check_response_reused_within_ttl(self):
+        """Test that the serialized /health response is rebuilt only after the cache TTL."""
+        with patch("app.get_version", return_value="1.2.3") as mock_get_version:
+            first = self.client.get("/health").data
+            second = self.client.get("/health").data
+
+            self.assertEqual(first, second)
+            mock_get_version.assert_called_once()
+
+            with patch("app.HEALTH_CACHE_TTL", 0):
+                self.client.get("/health")
+            self.assertEqual(mock_get_version.call_count, 2)
+
     def test_auth_status_authenticated(self):
         """Test the auth status endpoint when tokens exist."""
         with patch("app.check_token_exists") as mock_token_check:
@@ -66,11 +110,13 @@ class TestApp(unittest.TestCase):
             self.assertEqual(response_data["status"], "unauthenticated")
             self.assertEqual(response_data["auth_status"], "unauthenticated")
 
-    def test_service_status_healthy(self):
+    @patch("app.get_token_mtime", return_value=1.0)
+    def test_service_status_healthy(self, mock_token_mtime):
         """Test the service status endpoint when the service is healthy."""
         with patch("app.authenticate_google_drive") as mock_auth:
             # Configure mock to return a valid service
-            mock_auth.return_value = MagicMock()
+            mock_service = MagicMock()
+            mock_auth.return_value = mock_service
 
             # Make request
             response = self.client.get("/service/status")
@@ -79,6 +125,16 @@ class TestApp(unittest.TestCase):
             self.assertEqual(response.status_code, 200)
             response_data = json.loads(response.data)
             self.assertEqual(response_data["status"], "healthy")
+            # Building the service already probed the root folder
+            mock_service.files().get.assert_not_called()
+
+            # A cached service is checked with a root folder lookup
+            app_module._invalidate_service_status()
+            response = self.client.get("/service/status")
+
+            self.assertEqual(json.loads(response.data)["status"], "healthy")
+            mock_auth.assert_called_once()
+            mock_service.files().get.assert_called_once_with(fileId="root", fields="id")
 
     def test_service_status_degraded(self):
         """Test the service status endpoint when authentication is required."""
@@ -110,6 +166,22 @@ class TestApp(unittest.TestCase):
             self.assertEqual(response_data["status"], "unhealthy")
             self.assertEqual(response_data["reason"], "Test error")
 
+    def test_service_status_cached(self):
+        """Test that repeated service status checks within the TTL reuse the first Drive check."""
+        with patch("app.authenticate_google_drive") as mock_auth:
+            mock_auth.return_value = None
+
+            first = self.client.get("/service/status")
+            second = self.client.get("/service/status")
+
+            self.assertEqual(mock_auth.call_count, 1)
+            self.assertEqual(second.status_code, 200)
+            self.assertEqual(json.loads(second.data), json.loads(first.data))
+
+            app_module._invalidate_service_status()
+            self.client.get("/service/status")
+            self.assertEqual(mock_auth.call_count, 2)
+
     def test_authorize_gdrive_success(self):
         """Test the authorize_gdrive endpoint when successful."""
         with patch("app.generate_authorization_url") as mock_gen_url:
@@ -138,6 +210,56 @@ class TestApp(unittest.TestCase):
             response_data = json.loads(response.data)
             self.assertIn("error", response_data)
 
+    def test_oauth_callback_success(self):
+        """Test the OAuth callback page when the code exchange succeeds."""
+        with patch("app.exchange_code_for_tokens") as mock_exchange:
+            mock_exchange.return_value = True
+
+            response = self.client.get("/oauth/callback?code=test_code")
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.mimetype, "text/html")
+            self.assertEqual(int(response.headers["Content-Length"]), len(response.data))
+            self.assertIn(b"Authorization Successful!", response.data)
+            mock_exchange.assert_called_once_with("test_code")
+
+    def test_duplicate_auth_code_exchanged_once(self):
+        """Test that the same code submitted via both OAuth paths is only exchanged once."""
+        with patch("app.exchange_code_for_tokens") as mock_exchange:
+            mock_exchange.return_value = True
+
+            callback_response = self.client.get("/oauth/callback?code=dup_code")
+            submit_response = self.client.post("/submit_auth_code", data={"code": "dup_code"})
+
+            self.assertEqual(callback_response.status_code, 200)
+            self.assertEqual(submit_response.status_code, 200)
+            mock_exchange.assert_called_once_with("dup_code")
+
+    def test_oauth_callback_no_code(self):
+        """Test the OAuth callback page when no code is provided."""
+        response = self.client.get("/oauth/callback")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(b"No authorization code received.", response.data)
+
+    def test_oauth_callback_exchange_failure(self):
+        """Test the OAuth callback page when the code exchange fails."""
+        with patch("app.exchange_code_for_tokens") as mock_exchange:
+            mock_exchange.return_value = False
+
+            response = self.client.get("/oauth/callback?code=test_code")
+
+            self.assertEqual(response.status_code, 500)
+            self.assertIn(b"Failed to exchange authorization code for tokens.", response.data)
+
+    def test_oauth_callback_error_is_escaped(self):
+        """Test the OAuth callback error page escapes the error parameter."""
+        response = self.client.get("/oauth/callback?error=<script>alert(1)</script>")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(b"&lt;script&gt;alert(1)&lt;/script&gt;", response.data)
+        self.assertNotIn(b"<script>alert(1)</script>", response.data)
+
     def test_submit_auth_code_missing_code(self):
         """Test the submit_auth_code endpoint when the code is missing."""
         # Make request without code
@@ -207,6 +329,20 @@ class TestApp(unittest.TestCase):
             # Check for the actual error message format from the app
             self.assertIn("details", response_data["error"])
 
+    @patch("app.check_token_exists")
+    @patch("app.authenticate_google_drive")
+    def test_upload_file_too_large(self, mock_auth, mock_check_token):
+        """Test that uploads above MAX_CONTENT_LENGTH are rejected with 413 before reaching Drive."""
+        mock_check_token.return_value = True
+
+        data = {"folder_path": "test/folder", "file": (io.BytesIO(b"x" * 2048), "test_file.txt")}
+        with patch.dict(app.config, {"MAX_CONTENT_LENGTH": 1024}):
+            response = self.client.post("/upload_file", data=data, content_type="multipart/form-data")
+
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(json.loads(response.data)["error"]["code"], 413)
+        mock_auth.assert_not_called()
+
     def test_upload_file_no_folder_path(self):
         """Test the upload_file endpoint when no folder path is provided."""
         with patch("app.check_token_exists") as mock_check_token:
@@ -229,19 +365,14 @@ class TestApp(unittest.TestCase):
     @patch("app.check_token_exists")
     @patch("app.authenticate_google_drive")
     @patch("app.create_folder_if_not_exists")
-    @patch("app.upload_file_to_drive")
-    @patch("os.path.join")
-    @patch("os.remove")
-    def test_upload_file_success(
-        self, mock_remove, mock_join, mock_upload, mock_create_folder, mock_auth, mock_check_token
-    ):
-        """Test the upload_file endpoint when successful."""
+    @patch("app.upload_stream_to_drive")
+    def test_upload_file_success(self, mock_stream_upload, mock_create_folder, mock_auth, mock_check_token):
+        """Test the upload_file endpoint when the upload succeeds."""
         # Configure mocks
         mock_check_token.return_value = True
         mock_auth.return_value = MagicMock()
         mock_create_folder.return_value = "folder_id"
-        mock_upload.return_value = "https://drive.google.com/file/d/123"
-        mock_join.return_value = "/tmp/gdrive_upload_test_file.txt"
+        mock_stream_upload.return_value = "https://drive.google.com/file/d/123"
 
         # Create test data
         data = {"folder_path": "test/folder", "file": (io.BytesIO(self.test_file_content), "test_file.txt")}
@@ -256,25 +387,48 @@ class TestApp(unittest.TestCase):
         self.assertEqual(response_data["file_url"], "https://drive.google.com/file/d/123")
         self.assertEqual(response_data["overwrite_mode"], "enabled")
 
-        # Verify temp file was removed
-        mock_remove.assert_called_once_with("/tmp/gdrive_upload_test_file.txt")
+    @patch("app.check_token_exists")
+    @patch("app.authenticate_google_drive")
+    @patch("app.create_folder_if_not_exists")
+    @patch("app.upload_stream_to_drive")
+    def test_upload_file_without_content_type(
+        self, mock_stream_upload, mock_create_folder, mock_auth, mock_check_token
+    ):
+        """Test that a file part sent without a Content-Type gets the MIME type guessed from its name."""
+        mock_check_token.return_value = True
+        mock_auth.return_value = MagicMock()
+        mock_create_folder.return_value = "folder_id"
+        mock_stream_upload.return_value = "https://drive.google.com/file/d/123"
+
+        # The test client always sets a part's Content-Type, so the body is built by hand
+        body = (
+            b"--boundary\r\n"
+            b'Content-Disposition: form-data; name="folder_path"\r\n\r\n'
+            b"test/folder\r\n"
+            b"--boundary\r\n"
+            b'Content-Disposition: form-data; name="file"; filename="report.pdf"\r\n\r\n'
+            + self.test_file_content
+            + b"\r\n--boundary--\r\n"
+        )
+
+        response = self.client.post("/upload_file", data=body, content_type="multipart/form-data; boundary=boundary")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_stream_upload.call_args[1]["mimetype"], "application/pdf")
 
     @patch("app.check_token_exists")
     @patch("app.authenticate_google_drive")
     @patch("app.create_folder_if_not_exists")
-    @patch("app.upload_file_to_drive")
-    @patch("os.path.join")
-    @patch("os.remove")
+    @patch("app.upload_stream_to_drive")
     def test_upload_file_with_overwrite_false(
-        self, mock_remove, mock_join, mock_upload, mock_create_folder, mock_auth, mock_check_token
+        self, mock_stream_upload, mock_create_folder, mock_auth, mock_check_token
     ):
         """Test the upload_file endpoint with overwrite=false."""
         # Configure mocks
         mock_check_token.return_value = True
         mock_auth.return_value = MagicMock()
         mock_create_folder.return_value = "folder_id"
-        mock_upload.return_value = "https://drive.google.com/file/d/123"
-        mock_join.return_value = "/tmp/gdrive_upload_test_file.txt"
+        mock_stream_upload.return_value = "https://drive.google.com/file/d/123"
 
         # Create test data
         data = {
@@ -290,13 +444,59 @@ class TestApp(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         response_data = json.loads(response.data)
         self.assertEqual(response_data["status"], "success")
-        self.assertEqual(response_data["file_url"], "https://drive.google.com/file/d/123")
         self.assertEqual(response_data["overwrite_mode"], "disabled")
 
-        # Verify upload_file_to_drive was called with overwrite=False
-        mock_upload.assert_called_once_with(
-            mock_auth.return_value, "/tmp/gdrive_upload_test_file.txt", "folder_id", overwrite=False
-        )
+        # Verify upload_stream_to_drive was called with overwrite=False
+        self.assertFalse(mock_stream_upload.call_args[1]["overwrite"])
+
+    @patch("app.check_token_exists")
+    @patch("app.authenticate_google_drive")
+    @patch("app.create_folder_if_not_exists")
+    @patch("app.upload_file_to_drive")
+    @patch("app.upload_stream_to_drive")
+    def test_upload_file_streamed(
+        self, mock_stream_upload, mock_upload, mock_create_folder, mock_auth, mock_check_token
+    ):
+        """Test the upload_file endpoint streams uploads to Drive without a temporary file."""
+        mock_check_token.return_value = True
+        mock_auth.return_value = MagicMock()
+        mock_create_folder.return_value = "folder_id"
+        mock_stream_upload.return_value = "https://drive.google.com/file/d/123"
+
+        data = {"folder_path": "test/folder", "file": (io.BytesIO(self.test_file_content), "test_file.txt")}
+
+        response = self.client.post("/upload_file", data=data, content_type="multipart/form-data")
+
+        self.assertEqual(response.status_code, 200)
+        response_data = json.loads(response.data)
+        self.assertEqual(response_data["file_url"], "https://drive.google.com/file/d/123")
+        self.assertEqual(response_data["file_name"], "test_file.txt")
+
+        mock_upload.assert_not_called()
+        args, kwargs = mock_stream_upload.call_args
+        self.assertEqual(args[0], mock_auth.return_value)
+        self.assertEqual(args[2:], ("test_file.txt", "folder_id"))
+        self.assertEqual(kwargs["mimetype"], "text/plain")
+        self.assertTrue(kwargs["overwrite"])
+
+    @patch("app.check_token_exists")
+    @patch("app.authenticate_google_drive")
+    @patch("app.create_folder_if_not_exists")
+    @patch("app.upload_stream_to_drive")
+    def test_upload_file_streamed_failure(self, mock_stream_upload, mock_create_folder, mock_auth, mock_check_token):
+        """Test the upload_file endpoint when a streamed upload fails."""
+        mock_check_token.return_value = True
+        mock_auth.return_value = MagicMock()
+        mock_create_folder.return_value = "folder_id"
+        mock_stream_upload.return_value = None
+
+        data = {"folder_path": "test/folder", "file": (io.BytesIO(self.test_file_content), "test_file.txt")}
+
+        response = self.client.post("/upload_file", data=data, content_type="multipart/form-data")
+
+        self.assertEqual(response.status_code, 500)
+        response_data = json.loads(response.data)
+        self.assertEqual(response_data["error"]["type"], "UploadError")
 
     @patch("app.check_token_exists")
     @patch("app.authenticate_google_drive")
@@ -318,6 +518,184 @@ class TestApp(unittest.TestCase):
         self.assertIn("error", response_data)
         self.assertIn("Google Drive authentication failed", response_data["error"]["message"])
 
+    @patch("app.check_token_exists")
+    @patch("app.authenticate_google_drive")
+    @patch("app.create_folder_if_not_exists")
+    @patch("app.upload_stream_to_drive")
+    @patch("app._save_to_temp_file")
+    def test_upload_file_large_streamed_from_request(
+        self, mock_save, mock_stream_upload, mock_create_folder, mock_auth, mock_check_token
+    ):
+        """Test that large uploads are sent from the request's own spool file without another copy."""
+        mock_check_token.return_value = True
+        mock_auth.return_value = MagicMock()
+        mock_create_folder.return_value = "folder_id"
+        uploaded = []
+        mock_stream_upload.side_effect = (
+            lambda service, stream, *args, **kwargs: uploaded.append(stream.read()) or "url"
+        )
+
+        content = os.urandom(2 * 1024 * 1024)
+        data = {"folder_path": "test/folder", "file": (io.BytesIO(content), "large.bin")}
+
+        response = self.client.post("/upload_file", data=data, content_type="multipart/form-data")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(uploaded, [content])
+        mock_save.assert_not_called()
+
+    @patch("app.SPOOL_BUFFER_SIZE", 1024)
+    def test_save_to_temp_file(self):
+        """Test that spooling copies the whole upload to a uniquely named temp file."""
+        content = os.urandom(10 * 1024 + 7)
+        temp_file_path = app_module._save_to_temp_file(FileStorage(io.BytesIO(content), filename="data.bin"))
+        try:
+            self.assertTrue(os.path.basename(temp_file_path).startswith("gdrive_upload_"))
+            self.assertTrue(temp_file_path.endswith(".bin"))
+            with open(temp_file_path, "rb") as f:
+                self.assertEqual(f.read(), content)
+        finally:
+            os.remove(temp_file_path)
+
+    def test_save_to_temp_file_sanitizes_suffix(self):
+        """Test that only a sanitized extension of the client filename reaches the temp file path."""
+        with tempfile.TemporaryDirectory() as temp_dir, patch("app.UPLOAD_TEMP_DIR", temp_dir):
+            temp_file_path = app_module._save_to_temp_file(
+                FileStorage(io.BytesIO(b"data"), filename="../../etc/passwd.c\x00sv")
+            )
+            self.assertEqual(os.path.dirname(temp_file_path), temp_dir)
+            self.assertNotIn("..", os.path.basename(temp_file_path))
+            os.remove(temp_file_path)
+
+    def _wait_for_upload_job(self, job_id):
+        """Poll a background upload job until it finishes."""
+        for _ in range(200):
+            response_data = json.loads(self.client.get(f"/upload_status/{job_id}").data)
+            if "finished_at" in response_data:
+                return response_data
+            time.sleep(0.01)
+        self.fail(f"Upload job {job_id} did not finish")
+
+    @patch("app.check_token_exists")
+    @patch("app.authenticate_google_drive")
+    @patch("app.create_folder_if_not_exists")
+    @patch("app.upload_file_to_drive")
+    def test_upload_file_async(self, mock_upload, mock_create_folder, mock_auth, mock_check_token):
+        """Test that async uploads are accepted immediately and completed by a background worker."""
+        mock_check_token.return_value = True
+        mock_auth.return_value = MagicMock()
+        mock_create_folder.return_value = "folder_id"
+        mock_upload.return_value = "https://drive.google.com/file/d/123"
+
+        data = {
+            "folder_path": "test/folder",
+            "async": "true",
+            "file": (io.BytesIO(self.test_file_content), "test_file.txt"),
+        }
+
+        response = self.client.post("/upload_file", data=data, content_type="multipart/form-data")
+
+        self.assertEqual(response.status_code, 202)
+        response_data = json.loads(response.data)
+        self.assertEqual(response_data["status"], "accepted")
+        self.assertEqual(response.headers["Location"], response_data["status_url"])
+
+        job = self._wait_for_upload_job(response_data["job_id"])
+        self.assertEqual(job["status"], "completed")
+        self.assertEqual(job["file_url"], "https://drive.google.com/file/d/123")
+        self.assertEqual(job["file_name"], "test_file.txt")
+
+        temp_file_path = mock_upload.call_args[0][1]
+        self.assertEqual(mock_upload.call_args[1]["file_name"], "test_file.txt")
+        self.assertFalse(os.path.exists(temp_file_path))
+
+    @patch("app.check_token_exists")
+    @patch("app._upload_job_slots", threading.Semaphore(0))
+    def test_upload_file_async_queue_full(self, mock_check_token):
+        """Test that async uploads are rejected with 429 when the upload queue is full."""
+        mock_check_token.return_value = True
+
+        data = {
+            "folder_path": "test/folder",
+            "async": "true",
+            "file": (io.BytesIO(self.test_file_content), "test_file.txt"),
+        }
+
+        response = self.client.post("/upload_file", data=data, content_type="multipart/form-data")
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response.headers)
+        self.assertEqual(json.loads(response.data)["error"]["type"], "TooManyRequests")
+
+    @patch("app.check_token_exists")
+    @patch("app.authenticate_google_drive")
+    @patch("app.create_folder_if_not_exists")
+    @patch("app.upload_file_to_drive")
+    @patch("app._save_to_temp_file")
+    @patch("app._upload_job_slots", threading.BoundedSemaphore(1))
+    def test_upload_file_async_spool_failure(
+        self, mock_save, mock_upload, mock_create_folder, mock_auth, mock_check_token
+    ):
+        """Test that a failed spool fails the request, creates no folders and frees the started job's slot."""
+        mock_check_token.return_value = True
+        mock_auth.return_value = MagicMock()
+        mock_create_folder.return_value = "folder_id"
+        mock_save.side_effect = OSError("disk full")
+
+        data = {
+            "folder_path": "test/folder",
+            "async": "true",
+            "file": (io.BytesIO(self.test_file_content), "test_file.txt"),
+        }
+
+        response = self.client.post("/upload_file", data=data, content_type="multipart/form-data")
+
+        self.assertEqual(response.status_code, 500)
+        self.assertTrue(app_module._upload_job_slots.acquire(timeout=2))
+        mock_create_folder.assert_not_called()
+        mock_upload.assert_not_called()
+
+    @patch("app.check_token_exists")
+    @patch("app._upload_job_executor")
+    @patch("app._upload_job_slots", threading.BoundedSemaphore(1))
+    def test_upload_file_async_submit_failure(self, mock_executor, mock_check_token):
+        """Test that a job the executor refuses to start frees its slot and is recorded as failed."""
+        mock_check_token.return_value = True
+        mock_executor.submit.side_effect = RuntimeError("cannot schedule new futures after shutdown")
+
+        data = {
+            "folder_path": "test/folder",
+            "async": "true",
+            "file": (io.BytesIO(self.test_file_content), "test_file.txt"),
+        }
+
+        response = self.client.post("/upload_file", data=data, content_type="multipart/form-data")
+
+        self.assertEqual(response.status_code, 500)
+        self.assertTrue(app_module._upload_job_slots.acquire(blocking=False))
+        job = app_module._load_upload_job(mock_executor.submit.call_args[0][1])
+        self.assertEqual(job["status"], "failed")
+        self.assertIn("finished_at", job)
+
+    def test_upload_status_from_other_worker(self):
+        """Test that a job recorded by another worker process is served from the shared job directory."""
+        os.makedirs(app_module.UPLOAD_JOB_DIR, exist_ok=True)
+        job = {"job_id": "abc123", "status": "completed", "file_url": "https://drive.google.com/file/d/123"}
+        with open(os.path.join(app_module.UPLOAD_JOB_DIR, "abc123.json"), "w") as f:
+            json.dump(job, f)
+
+        response = self.client.get("/upload_status/abc123")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data), job)
+        self.assertEqual(self.client.get("/upload_status/..").status_code, 404)
+
+    def test_upload_status_unknown_job(self):
+        """Test the upload_status endpoint with an unknown job id."""
+        response = self.client.get("/upload_status/does-not-exist")
+
+        self.assertEqual(response.status_code, 404)
+
     def test_delete_folder_no_folder_path(self):
         """Test the delete_folder endpoint when no folder path is provided."""
         # Make request without folder path
@@ -329,6 +707,23 @@ class TestApp(unittest.TestCase):
         self.assertIn("error", response_data)
         self.assertEqual(response_data["error"]["message"], "Folder path is required")
 
+    @patch("app.check_token_exists")
+    @patch("app.authenticate_google_drive")
+    def test_invalid_folder_path_rejected(self, mock_auth, mock_check_token):
+        """Test that folder paths with control characters or excessive length are rejected with 400."""
+        mock_check_token.return_value = True
+
+        for folder_path in ["bad\nfolder", "a" * (app_module.MAX_FOLDER_PATH_LENGTH + 1)]:
+            response = self.client.post("/delete_folder", data={"folder_path": folder_path})
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(json.loads(response.data)["error"]["message"], "Folder path is invalid")
+
+            data = {"folder_path": folder_path, "file": (io.BytesIO(self.test_file_content), "test_file.txt")}
+            response = self.client.post("/upload_file", data=data, content_type="multipart/form-data")
+            self.assertEqual(response.status_code, 400)
+
+        mock_auth.assert_not_called()
+
     @patch("app.check_token_exists")
     @patch("app.authenticate_google_drive")
     @patch("app.delete_folder_by_path")
@@ -450,6 +845,80 @@ class TestApp(unittest.TestCase):
             response_data = json.loads(response.data)
             self.assertIn("error", response_data)
 
+    @patch("app.get_token_mtime")
+    @patch("app.authenticate_google_drive")
+    def test_drive_service_cached_while_token_unchanged(self, mock_auth, mock_token_mtime):
+        """Test that the Drive service is reused while the token file is unchanged."""
+        mock_auth.return_value = MagicMock()
+        mock_token_mtime.return_value = 1000
+
+        app_module._invalidate_drive_service_cache()
+        try:
+            first = app_module._get_cached_drive_service()
+            second = app_module._get_cached_drive_service()
+        finally:
+            app_module._invalidate_drive_service_cache()
+
+        self.assertIs(first, second)
+        mock_auth.assert_called_once()
+
+    @patch("app.get_token_mtime")
+    @patch("app.authenticate_google_drive")
+    def test_drive_service_rebuilt_when_token_changes(self, mock_auth, mock_token_mtime):
+        """Test that the Drive service is rebuilt after the token file changes."""
+        mock_auth.side_effect = [MagicMock(), MagicMock()]
+        mock_token_mtime.side_effect = [1000, 1000, 2000, 2000]
+
+        app_module._invalidate_drive_service_cache()
+        try:
+            first = app_module._get_cached_drive_service()
+            second = app_module._get_cached_drive_service()
+        finally:
+            app_module._invalidate_drive_service_cache()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(mock_auth.call_count, 2)
+
+    @patch("app.get_token_mtime")
+    @patch("app.authenticate_google_drive")
+    def test_drive_service_cache_hit_is_lock_free(self, mock_auth, mock_token_mtime):
+        """Test that a cached Drive service is returned without taking the rebuild lock."""
+        mock_auth.return_value = MagicMock()
+        mock_token_mtime.return_value = 1000
+
+        app_module._invalidate_drive_service_cache()
+        try:
+            first = app_module._get_cached_drive_service()
+            with patch("app._drive_service_lock") as mock_lock:
+                second = app_module._get_cached_drive_service()
+        finally:
+            app_module._invalidate_drive_service_cache()
+
+        self.assertIs(first, second)
+        mock_lock.__enter__.assert_not_called()
+
+    @patch("app.delete_folder_by_path")
+    @patch("app.get_token_mtime")
+    @patch("app.authenticate_google_drive")
+    @patch("app.check_token_exists")
+    def test_drive_service_invalidated_on_unauthorized(self, mock_check, mock_auth, mock_token_mtime, mock_delete):
+        """Test that a 401 from Drive drops the cached service so the next request re-authenticates."""
+        mock_check.return_value = True
+        mock_auth.side_effect = [MagicMock(), MagicMock()]
+        mock_token_mtime.return_value = 1000
+        mock_delete.side_effect = [HttpError(MagicMock(status=401), b"Invalid Credentials"), True]
+
+        app_module._invalidate_drive_service_cache()
+        try:
+            first = self.client.post("/delete_folder", data={"folder_path": "test"})
+            second = self.client.post("/delete_folder", data={"folder_path": "test"})
+        finally:
+            app_module._invalidate_drive_service_cache()
+
+        self.assertEqual(first.status_code, 500)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(mock_auth.call_count, 2)
+
     @patch("app.logger")
     def test_request_logging(self, mock_logger):
         """Test that requests are properly logged."""
@@ -462,6 +931,23 @@ class TestApp(unittest.TestCase):
         # Check response is successful
         self.assertEqual(response.status_code, 200)
 
+    @patch("app.LOG_SAMPLE_N", 1000)
+    @patch("app.logger")
+    def test_request_logging_sampled(self, mock_logger):
+        """Test that unsampled successful requests are not logged but failures are."""
+        with patch("app._request_counter", itertools.count(1)):
+            self.client.get("/info")  # Request 1 is outside the 1-in-1000 sample
+
+        logged = [call.args[0] for call in mock_logger.info.call_args_list]
+        self.assertNotIn("Request %s started: %s %s [%s]", logged)
+        self.assertNotIn("Request %s completed: %s in %.3fs", logged)
+
+        with patch("app._request_counter", itertools.count(1)):
+            self.client.post("/submit_auth_code", json={})  # 400 response
+
+        logged = [call.args[0] for call in mock_logger.info.call_args_list]
+        self.assertIn("Request %s completed: %s in %.3fs", logged)
+
     def test_error_handling_middleware(self):
         """Test error handling middleware for unhandled exceptions."""
         with patch("app.get_version") as mock_get_version:
@@ -476,6 +962,22 @@ class TestApp(unittest.TestCase):
             response_data = json.loads(response.data)
             self.assertIn("error", response_data)
 
+    @patch("app.logger")
+    def test_error_handler_logging(self, mock_logger):
+        """Test HTTP errors are logged without a traceback and other errors with one."""
+        response = self.client.get("/does-not-exist")
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(json.loads(response.data)["error"]["code"], 404)
+        mock_logger.warning.assert_called_once()
+        mock_logger.exception.assert_not_called()
+
+        with patch("app.get_version", side_effect=Exception("Test error")):
+            response = self.client.get("/info")
+
+        self.assertEqual(response.status_code, 500)
+        mock_logger.exception.assert_called_once()
+
     def test_authorize_gdrive_exception_handling(self):
         """Test exception handling in authorize_gdrive endpoint."""
         with patch("app.generate_authorization_url") as mock_generate_url:
@@ -506,6 +1008,29 @@ class TestApp(unittest.TestCase):
             self.assertIn("error", response_data)
             self.assertEqual(response_data["error"]["type"], "Exception")
 
+    def test_info_reflects_environment(self):
+        """Test that the pre-serialized /info body is keyed by environment."""
+        with patch.dict(os.environ, {"FLASK_ENV": "development"}):
+            response = self.client.get("/info")
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(json.loads(response.data)["environment"], "development")
+
+        with patch.dict(os.environ, {"FLASK_ENV": "staging"}):
+            response = self.client.get("/info")
+        self.assertEqual(json.loads(response.data)["environment"], "staging")
+
+    def test_version_endpoint(self):
+        """Test the version endpoint returns detailed version information."""
+        with patch.dict(os.environ, {"FLASK_ENV": "testing"}):
+            response = self.client.get("/version")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/json")
+        response_data = json.loads(response.data)
+        self.assertEqual(response_data["environment"], "testing")
+        self.assertEqual(response_data["service"], "google-drive-service")
+        self.assertIn("build_date", response_data)
+
     def test_after_request_middleware(self):
         """Test after_request middleware logs response information."""
         with patch("app.logger") as mock_logger:
@@ -519,5 +1044,42 @@ class TestApp(unittest.TestCase):
             self.assertEqual(response.status_code, 200)
 
 
+@unittest.skipUnless(app_module.HAS_ORJSON, "orjson is not installed")
+class TestOrjsonProvider(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a provider bound to the app."""
+        self.provider = app_module.OrjsonProvider(app)
+
+    def test_dumps_matches_default_provider(self):
+        """Test that orjson output decodes to the same data the default provider produces."""
+        data = {"b": 1, "a": [1, 2.5, None, True], "when": datetime(2024, 1, 2, 3, 4, 5), "ratio": Decimal("1.5")}
+
+        encoded = self.provider.dumps(data, separators=(",", ":"))
+
+        self.assertEqual(encoded, DefaultJSONProvider(app).dumps(data, separators=(",", ":")))
+        self.assertTrue(encoded.startswith('{"a":'))
+
+    def test_dumps_indent_and_fallback(self):
+        """Test indented output and fallback to the stdlib for options orjson does not support."""
+        self.assertEqual(json.loads(self.provider.dumps({"a": 1}, indent=2)), {"a": 1})
+        self.assertIn("\n    ", self.provider.dumps({"a": 1}, indent=4))
+
+    def test_response_matches_default_provider(self):
+        """Test that jsonify bodies are byte-identical to the default provider's output."""
+        data = {"b": 1, "when": datetime(2024, 1, 2, 3, 4, 5), "ratio": Decimal("1.5")}
+
+        with app.app_context():
+            response = self.provider.response(data)
+            expected = DefaultJSONProvider(app).response(data)
+
+        self.assertEqual(response.get_data(), expected.get_data())
+        self.assertEqual(response.mimetype, "application/json")
+
+    def test_loads(self):
+        """Test that JSON request bodies are parsed with orjson."""
+        self.assertEqual(self.provider.loads(b'{"code": "abc"}'), {"code": "abc"})
+
+
 if __name__ == "__main__":
     unittest.main()
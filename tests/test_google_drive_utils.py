@@ -1,25 +1,74 @@
+import hashlib
+import io
+import json
+import mmap
 import os
+import subprocess
+import sys
 import tempfile
+import threading
+import time
 import unittest
-from unittest.mock import MagicMock, patch
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, call, patch
 
+from googleapiclient.discovery import build
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpMockSequence, HttpRequest, MediaIoBaseUpload
 
 # Import the functions to test
 from google_drive_utils import (
+    DISCOVERY_CACHE_TTL,
+    HTTP_TIMEOUT,
+    NEW_FOLDER_TTL,
+    PATH_QUERY_MAX_PAGES,
+    REDIRECT_URI,
+    UPLOAD_CHUNK_RETRIES,
+    _add_cached_child_folder,
+    _build_drive_service,
+    _cache_child_folders,
+    _cache_folder_id,
+    _discovery_cache,
+    _DiscoveryCache,
+    _drive_escape,
+    _get_cached_child_folders,
+    _get_cached_folder_id,
+    _guess_mimetype,
+    _HttpConnectionPool,
+    _media_md5,
+    _new_oauth_flow,
+    _PersistentFolderCache,
+    _PooledAuthorizedHttp,
+    _PrefetchingMmapUpload,
+    _read_client_config,
+    _read_token_info,
+    _save_token,
+    _schedule_credentials_refresh,
+    _split_folder_path,
+    _upload_chunk_size,
     authenticate_google_drive,
     check_token_exists,
     create_folder,
     create_folder_if_not_exists,
+    create_folders_if_not_exist,
     delete_file_by_id,
+    delete_files_batch,
     delete_folder_by_id,
     delete_folder_by_path,
+    delete_folders_by_paths,
     exchange_code_for_tokens,
     find_file_id,
     find_folder_id,
     generate_authorization_url,
     get_folder_id_by_path,
+    get_folder_ids_by_paths,
+    invalidate_folder_cache,
+    invalidate_token_state,
     upload_file_to_drive,
+    upload_files_to_drive,
+    upload_stream_to_drive,
 )
 
 
@@ -71,6 +120,19 @@ class TestGoogleDriveUtils(unittest.TestCase):
         final_call_args = list_calls[-1][1]
         self.assertIn("name='test_file.txt'", final_call_args["q"])
         self.assertIn("'folder_id' in parents", final_call_args["q"])
+        self.assertEqual(final_call_args["fields"], "files(id)")
+        self.assertEqual(final_call_args["spaces"], "drive")
+        self.assertEqual(final_call_args["corpora"], "user")
+
+    def test_find_file_id_escapes_name(self):
+        """Test that quotes and backslashes in file names are escaped in the query."""
+        self.mock_drive_service.files().list().execute.return_value = {"files": []}
+
+        find_file_id(self.mock_drive_service, "it's a \\ file", "folder_id")
+
+        query = self.mock_drive_service.files().list.call_args[1]["q"]
+        self.assertEqual(query, "name='it\\'s a \\\\ file' and 'folder_id' in parents and trashed=false")
+        self.assertEqual(_drive_escape("a\\'b"), "'a\\\\\\'b'")
 
     def test_find_file_id_not_found(self):
         """Test finding a file ID when the file doesn't exist."""
@@ -138,6 +200,18 @@ class TestGoogleDriveUtils(unittest.TestCase):
         # Verify that sleep was called (indicating retries happened but were fast)
         self.assertTrue(mock_sleep.called)
 
+    @patch("time.sleep")
+    def test_delete_file_by_id_rate_limited(self, mock_sleep):
+        """Test that a rate limit 403 is retried instead of being reported as permission denied."""
+        rate_limited = HttpError(
+            resp=MagicMock(status=403), content=b'{"error": {"errors": [{"reason": "userRateLimitExceeded"}]}}'
+        )
+        self.mock_drive_service.files().delete().execute.side_effect = [rate_limited, None]
+
+        self.assertTrue(delete_file_by_id(self.mock_drive_service, "test_file_id"))
+        self.assertEqual(self.mock_drive_service.files().delete().execute.call_count, 2)
+        mock_sleep.assert_called()
+
     @patch("google_drive_utils.find_file_id")
     @patch("google_drive_utils.delete_file_by_id")
     @patch("google_drive_utils.MediaFileUpload")
@@ -162,6 +236,7 @@ class TestGoogleDriveUtils(unittest.TestCase):
 
         # Verify the result
         self.assertEqual(result, "https://drive.google.com/file/d/new_file_id")
+        mock_request.next_chunk.assert_called_once_with(num_retries=UPLOAD_CHUNK_RETRIES)
 
         # Verify find_file_id was called (decorator-resilient)
         find_calls = mock_find_file.call_args_list
@@ -181,6 +256,125 @@ class TestGoogleDriveUtils(unittest.TestCase):
         self.assertEqual(final_call_args["body"]["name"], os.path.basename(self.test_file_path))
         self.assertEqual(final_call_args["body"]["parents"], ["folder_id"])
         self.assertEqual(final_call_args["media_body"], mock_media)
+        self.assertEqual(final_call_args["fields"], "id,webViewLink")
+
+    def test_guess_mimetype(self):
+        """Test that MIME types are guessed from the whole suffix of the file name."""
+        self.assertEqual(_guess_mimetype("/tmp/gdrive_upload_1.pdf"), "application/pdf")
+        self.assertEqual(_guess_mimetype("report.v2.pdf"), "application/pdf")
+        self.assertEqual(_guess_mimetype("archive.tar.gz"), "application/x-tar")
+        self.assertEqual(_guess_mimetype("README"), "application/octet-stream")
+        self.assertEqual(_guess_mimetype(".hidden"), "application/octet-stream")
+
+    @patch("google_drive_utils.CHECKSUM_CHUNK_SIZE", 5)
+    @patch("google_drive_utils.time.sleep")
+    def test_media_md5_yields_between_chunks(self, mock_sleep):
+        """Test that content is checksummed in chunks, yielding to other greenlets after each."""
+        media = MediaIoBaseUpload(io.BytesIO(b"Test content"), mimetype="text/plain", resumable=True)
+
+        self.assertEqual(_media_md5(media), hashlib.md5(b"Test content").hexdigest())
+        self.assertEqual(mock_sleep.call_args_list, [call(0)] * 3)
+
+    @patch("google_drive_utils.CHECKSUM_CHUNK_SIZE", 5)
+    @patch("google_drive_utils.time.sleep")
+    @patch("google_drive_utils.MMAP_UPLOAD_MIN_SIZE", 0)
+    @patch("google_drive_utils.SIMPLE_UPLOAD_MAX_SIZE", 0)
+    @patch("google_drive_utils._upload_media")
+    def test_upload_file_to_drive_memory_mapped(self, mock_upload_media, mock_sleep):
+        """Test that large files are uploaded from a read-only memory map that is closed afterwards."""
+        uploaded = {}
+
+        def read_media(drive_service, media, file_name, folder_id, overwrite):
+            uploaded["media"] = media
+            uploaded["content"] = media.getbytes(0, media.size())
+            uploaded["md5"] = _media_md5(media)
+            return "https://drive/mapped"
+
+        mock_upload_media.side_effect = read_media
+
+        result = upload_file_to_drive(self.mock_drive_service, self.test_file_path, "folder_id")
+
+        self.assertEqual(result, "https://drive/mapped")
+        with open(self.test_file_path, "rb") as f:
+            self.assertEqual(uploaded["content"], f.read())
+        self.assertEqual(uploaded["md5"], hashlib.md5(uploaded["content"]).hexdigest())
+        self.assertEqual(mock_sleep.call_count, 3)
+        self.assertTrue(uploaded["media"].resumable())
+        self.assertEqual(uploaded["media"].mimetype(), "text/plain")
+        self.assertTrue(uploaded["media"]._fd.closed)
+
+    @unittest.skipUnless(hasattr(mmap, "MADV_WILLNEED"), "madvise is not available")
+    def test_memory_mapped_upload_prefetches_next_chunk(self):
+        """Test that reading a chunk of a memory-mapped upload asks the kernel to read the next one ahead."""
+        chunk_size = 256 * 1024
+        mapped = MagicMock()
+        mapped.tell.return_value = 3 * chunk_size
+        mapped.__len__.return_value = 3 * chunk_size
+        mapped.read.side_effect = lambda length: b"x" * length
+        media = _PrefetchingMmapUpload(mapped, "text/plain", chunksize=chunk_size, resumable=True)
+
+        self.assertEqual(media.getbytes(chunk_size, chunk_size), b"x" * chunk_size)
+        mapped.madvise.assert_called_once_with(mmap.MADV_WILLNEED, 2 * chunk_size, chunk_size)
+
+        mapped.read.side_effect = lambda length: b"x" * chunk_size
+        media.getbytes(2 * chunk_size, chunk_size)
+        mapped.madvise.assert_called_once()  # Nothing left to prefetch after the last chunk
+
+    @unittest.skipUnless(hasattr(mmap, "MADV_WILLNEED"), "madvise is not available")
+    def test_memory_mapped_resumable_upload_prefetches_each_next_chunk(self):
+        """Test that a resumable upload of a memory-mapped file has each next chunk read ahead."""
+        chunk_size = 256 * 1024
+        content = os.urandom(4 * chunk_size)
+        with open(self.test_file_path, "wb") as f:
+            f.write(content)
+        with open(self.test_file_path, "rb") as f:
+            real_mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.addCleanup(real_mapped.close)
+        mapped = MagicMock(wraps=real_mapped)
+        mapped.__len__.return_value = len(content)
+        media = _PrefetchingMmapUpload(mapped, "application/octet-stream", chunksize=chunk_size, resumable=True)
+
+        http = HttpMockSequence(
+            [({"status": "200", "location": "https://upload/session"}, b"")]
+            + [({"status": "308", "range": f"bytes=0-{end * chunk_size - 1}"}, b"") for end in range(1, 4)]
+            + [({"status": "200"}, b'{"id": "file1"}')]
+        )
+        bodies = []
+        send = http.request
+
+        def record(uri, method="GET", body=None, headers=None, **kwargs):
+            bodies.append(body)
+            return send(uri, method, body, headers, **kwargs)
+
+        http.request = record
+        request = HttpRequest(http, lambda resp, body: json.loads(body), "https://upload/files", resumable=media)
+
+        response = None
+        while response is None:
+            _, response = request.next_chunk()
+
+        self.assertEqual(response, {"id": "file1"})
+        self.assertEqual(b"".join(bodies[1:]), content)
+        self.assertEqual(
+            mapped.madvise.call_args_list,
+            [call(mmap.MADV_WILLNEED, start * chunk_size, chunk_size) for start in range(1, 4)],
+        )
+
+    @patch("google_drive_utils.find_file_id")
+    @patch("google_drive_utils.MediaFileUpload")
+    def test_upload_file_to_drive_custom_name(self, mock_media_upload, mock_find_file):
+        """Test uploading a file under a name other than its basename on disk."""
+        mock_find_file.return_value = None
+        mock_request = MagicMock()
+        mock_request.next_chunk.return_value = (None, {"id": "new_file_id", "webViewLink": "https://drive/new"})
+        self.mock_drive_service.files().create.return_value = mock_request
+
+        result = upload_file_to_drive(self.mock_drive_service, self.test_file_path, "folder_id", file_name="report.pdf")
+
+        self.assertEqual(result, "https://drive/new")
+        self.assertEqual(mock_find_file.call_args[0], (self.mock_drive_service, "report.pdf", "folder_id"))
+        create_kwargs = self.mock_drive_service.files().create.call_args_list[-1][1]
+        self.assertEqual(create_kwargs["body"]["name"], "report.pdf")
 
     @patch("google_drive_utils.find_file_id")
     @patch("google_drive_utils.delete_file_by_id")
@@ -189,24 +383,30 @@ class TestGoogleDriveUtils(unittest.TestCase):
         """Test uploading a file with overwrite=True when a file with same name exists."""
         # Configure mocks
         mock_find_file.return_value = "existing_file_id"  # Existing file
-        mock_delete_file.return_value = True  # Deletion successful
         mock_media = MagicMock()
+        mock_media.resumable.return_value = False
         mock_media_upload.return_value = mock_media
 
-        # Mock the resumable upload request and response
+        # Mock the update request and response
         mock_request = MagicMock()
-        # Mock next_chunk to return (None, response) indicating upload is complete
-        mock_request.next_chunk.return_value = (
-            None,
-            {"id": "new_file_id", "webViewLink": "https://drive.google.com/file/d/new_file_id"},
-        )
-        self.mock_drive_service.files().create.return_value = mock_request
+        mock_request.execute.return_value = {
+            "id": "existing_file_id",
+            "name": os.path.basename(self.test_file_path),
+            "parents": ["folder_id"],
+            "webViewLink": "https://drive.google.com/file/d/existing_file_id",
+        }
+        self.mock_drive_service.files().update.return_value = mock_request
+        self.mock_drive_service.files().get().execute.return_value = {
+            "name": os.path.basename(self.test_file_path),
+            "parents": ["folder_id"],
+        }
+        self.mock_drive_service.files().create.reset_mock()
 
         # Test the function
         result = upload_file_to_drive(self.mock_drive_service, self.test_file_path, "folder_id", overwrite=True)
 
-        # Verify the result
-        self.assertEqual(result, "https://drive.google.com/file/d/new_file_id")
+        # The existing file keeps its ID and link
+        self.assertEqual(result, "https://drive.google.com/file/d/existing_file_id")
 
         # Verify find_file_id was called (decorator-resilient)
         find_calls = mock_find_file.call_args_list
@@ -216,11 +416,56 @@ class TestGoogleDriveUtils(unittest.TestCase):
             final_find_call[0], (self.mock_drive_service, os.path.basename(self.test_file_path), "folder_id")
         )
 
-        # Verify delete_file_by_id was called with the existing file ID (decorator-resilient)
-        delete_calls = mock_delete_file.call_args_list
-        self.assertGreater(len(delete_calls), 0, "Should call delete_file_by_id at least once")
-        final_delete_call = delete_calls[-1]
-        self.assertEqual(final_delete_call[0], (self.mock_drive_service, "existing_file_id"))
+        # The existing file is updated in place rather than replaced by a new one
+        update_kwargs = self.mock_drive_service.files().update.call_args[1]
+        self.assertEqual(update_kwargs["fileId"], "existing_file_id")
+        self.assertEqual(update_kwargs["media_body"], mock_media)
+        self.mock_drive_service.files().create.assert_not_called()
+        mock_delete_file.assert_not_called()
+
+    @patch("google_drive_utils.find_file_id")
+    @patch("google_drive_utils.delete_file_by_id")
+    @patch("google_drive_utils.MediaFileUpload")
+    def test_upload_file_to_drive_overwrite_existing_file_gone(
+        self, mock_media_upload, mock_delete_file, mock_find_file
+    ):
+        """Test that a new file is created when the file found by the lookup is deleted before the update."""
+        mock_find_file.return_value = "existing_file_id"
+        mock_media_upload.return_value.resumable.return_value = False
+        self.mock_drive_service.files().update().execute.side_effect = HttpError(
+            resp=MagicMock(status=404), content=b"Not found"
+        )
+        mock_request = MagicMock()
+        mock_request.execute.return_value = {"id": "new_file_id", "webViewLink": "https://drive/new"}
+        self.mock_drive_service.files().create.return_value = mock_request
+
+        result = upload_file_to_drive(self.mock_drive_service, self.test_file_path, "folder_id", overwrite=True)
+
+        self.assertEqual(result, "https://drive/new")
+        mock_delete_file.assert_not_called()
+
+    @patch("time.sleep")
+    @patch("google_drive_utils.find_file_id")
+    @patch("google_drive_utils.delete_file_by_id")
+    @patch("google_drive_utils.MediaFileUpload")
+    def test_upload_file_to_drive_overwrite_keeps_existing_on_failure(
+        self, mock_media_upload, mock_delete_file, mock_find_file, mock_sleep
+    ):
+        """Test that a failed overwrite leaves the existing file in place."""
+        mock_find_file.return_value = "existing_file_id"
+        mock_media_upload.return_value.resumable.return_value = False
+        mock_request = MagicMock()
+        mock_request.execute.side_effect = HttpError(resp=MagicMock(status=500), content=b"Error")
+        self.mock_drive_service.files().update.return_value = mock_request
+        self.mock_drive_service.files().get().execute.return_value = {
+            "name": os.path.basename(self.test_file_path),
+            "parents": ["folder_id"],
+        }
+
+        with self.assertRaises(Exception):
+            upload_file_to_drive(self.mock_drive_service, self.test_file_path, "folder_id", overwrite=True)
+
+        mock_delete_file.assert_not_called()
 
     @patch("google_drive_utils.find_file_id")
     @patch("google_drive_utils.delete_file_by_id")
@@ -284,12 +529,254 @@ class TestGoogleDriveUtils(unittest.TestCase):
         # Enhanced logging may change retry behavior, so we just verify the exception was raised
         # The important thing is that the function properly handles and propagates errors
 
+    @patch("google_drive_utils.find_file_id")
+    @patch("google_drive_utils.delete_file_by_id")
+    @patch("google_drive_utils.MediaIoBaseUpload")
+    def test_upload_stream_to_drive(self, mock_media_upload, mock_delete_file, mock_find_file):
+        """Test uploading a file-like object without writing it to disk."""
+        mock_find_file.return_value = "existing_file_id"
+        mock_media = MagicMock()
+        mock_media_upload.return_value = mock_media
+
+        mock_media.resumable.return_value = False
+        mock_request = MagicMock()
+        mock_request.execute.return_value = {
+            "id": "existing_file_id",
+            "name": "report.csv",
+            "parents": ["folder_id"],
+            "webViewLink": "https://drive.google.com/file/d/existing_file_id",
+        }
+        self.mock_drive_service.files().update.return_value = mock_request
+        self.mock_drive_service.files().get().execute.return_value = {"name": "report.csv", "parents": ["folder_id"]}
+
+        stream = io.BytesIO(b"streamed content")
+        stream.seek(5)  # Upload must start from the beginning regardless of the stream position
+        result = upload_stream_to_drive(
+            self.mock_drive_service, stream, "report.csv", "folder_id", mimetype="text/csv", overwrite=True
+        )
+
+        self.assertEqual(result, "https://drive.google.com/file/d/existing_file_id")
+        self.assertEqual(stream.tell(), 0)
+        mock_media_upload.assert_called_once_with(
+            stream, mimetype="text/csv", chunksize=8 * 1024 * 1024, resumable=False
+        )
+        mock_delete_file.assert_not_called()
+
+        update_kwargs = self.mock_drive_service.files().update.call_args[1]
+        self.assertEqual(update_kwargs["fileId"], "existing_file_id")
+        self.assertEqual(update_kwargs["media_body"], mock_media)
+
+    def test_upload_small_stream_in_one_request(self):
+        """Test that small uploads are sent as one multipart request instead of a resumable session."""
+        mock_request = MagicMock()
+        mock_request.execute.return_value = {"id": "new_file_id", "webViewLink": "https://drive/new"}
+        self.mock_drive_service.files().create.return_value = mock_request
+
+        result = upload_stream_to_drive(
+            self.mock_drive_service, io.BytesIO(b"small"), "a.txt", "folder_id", overwrite=False
+        )
+
+        self.assertEqual(result, "https://drive/new")
+        mock_request.next_chunk.assert_not_called()
+        self.assertFalse(self.mock_drive_service.files().create.call_args[1]["media_body"].resumable())
+
+    @patch("google_drive_utils.find_file_id")
+    def test_upload_into_new_folder_skips_existing_file_lookup(self, mock_find_file):
+        """Test that only the first upload into a folder this process created skips the lookup."""
+        mock_find_file.return_value = None
+        self.mock_drive_service.files().create().execute.side_effect = [
+            {"id": "new_folder_id"},
+            {"id": "file1", "webViewLink": "https://drive/file1"},
+            {"id": "file2", "webViewLink": "https://drive/file2"},
+        ]
+
+        self.assertEqual(create_folder(self.mock_drive_service, "reports", "root"), "new_folder_id")
+        upload_stream_to_drive(self.mock_drive_service, io.BytesIO(b"one"), "a.txt", "new_folder_id")
+        mock_find_file.assert_not_called()
+
+        upload_stream_to_drive(self.mock_drive_service, io.BytesIO(b"two"), "b.txt", "new_folder_id")
+        mock_find_file.assert_called_once_with(self.mock_drive_service, "b.txt", "new_folder_id")
+
+    @patch("google_drive_utils.find_file_id")
+    def test_non_overwriting_upload_claims_new_folder(self, mock_find_file):
+        """Test that a non-overwriting first upload into a new folder leaves no skipped lookup for later uploads."""
+        mock_find_file.return_value = "file1"
+        files = self.mock_drive_service.files()
+        files.create().execute.side_effect = [
+            {"id": "new_folder_id"},
+            {"id": "file1", "webViewLink": "https://drive/file1"},
+        ]
+        files.update().execute.return_value = {"id": "file1", "webViewLink": "https://drive/file1"}
+        files.create.reset_mock()
+        files.update.reset_mock()
+
+        create_folder(self.mock_drive_service, "reports", "root")
+        upload_stream_to_drive(self.mock_drive_service, io.BytesIO(b"one"), "a.txt", "new_folder_id", overwrite=False)
+        result = upload_stream_to_drive(self.mock_drive_service, io.BytesIO(b"two"), "a.txt", "new_folder_id")
+
+        self.assertEqual(result, "https://drive/file1")
+        mock_find_file.assert_called_once_with(self.mock_drive_service, "a.txt", "new_folder_id")
+        self.assertEqual(files.create.call_count, 2)
+        self.assertEqual(files.update.call_args[1]["fileId"], "file1")
+
+    @patch("google_drive_utils.time.monotonic")
+    @patch("google_drive_utils.find_file_id")
+    def test_new_folder_mark_expires(self, mock_find_file, mock_monotonic):
+        """Test that an upload long after a folder was created looks for a file to replace."""
+        mock_find_file.return_value = None
+        mock_monotonic.return_value = 100.0
+        files = self.mock_drive_service.files()
+        files.create().execute.side_effect = [
+            {"id": "new_folder_id"},
+            {"id": "file1", "webViewLink": "https://drive/file1"},
+        ]
+
+        create_folder(self.mock_drive_service, "reports", "root")
+        mock_monotonic.return_value = 100.0 + NEW_FOLDER_TTL + 1
+        upload_stream_to_drive(self.mock_drive_service, io.BytesIO(b"one"), "a.txt", "new_folder_id")
+
+        mock_find_file.assert_called_once_with(self.mock_drive_service, "a.txt", "new_folder_id")
+
+    @patch("google_drive_utils.find_file_id")
+    def test_overwrite_updates_previously_uploaded_file(self, mock_find_file):
+        """Test that overwriting a file this process uploaded updates it in place with one request."""
+        mock_find_file.return_value = None
+        files = self.mock_drive_service.files()
+        files.create().execute.return_value = {"id": "file1", "webViewLink": "https://drive/file1"}
+        files.update().execute.return_value = {
+            "id": "file1",
+            "name": "a.txt",
+            "parents": ["folder_id"],
+            "webViewLink": "https://drive/file1",
+        }
+        files.get().execute.return_value = {"name": "a.txt", "parents": ["folder_id"]}
+        files.create.reset_mock()
+        files.update.reset_mock()
+
+        upload_stream_to_drive(self.mock_drive_service, io.BytesIO(b"one"), "a.txt", "folder_id")
+        result = upload_stream_to_drive(self.mock_drive_service, io.BytesIO(b"two"), "a.txt", "folder_id")
+
+        self.assertEqual(result, "https://drive/file1")
+        files.create.assert_called_once()
+        self.assertEqual(files.update.call_args[1]["fileId"], "file1")
+        mock_find_file.assert_called_once()
+
+    @patch("google_drive_utils.SIMPLE_UPLOAD_MAX_SIZE", 0)
+    @patch("google_drive_utils.find_file_id")
+    def test_overwrite_skips_unchanged_resumable_upload(self, mock_find_file):
+        """Test that a resumable re-upload of unchanged content is skipped after a checksum check."""
+        mock_find_file.return_value = None
+        files = self.mock_drive_service.files()
+        uploaded = {"id": "file1", "name": "a.txt", "parents": ["folder_id"], "webViewLink": "https://drive/file1"}
+        files.create().next_chunk.return_value = (None, uploaded)
+        files.update().next_chunk.return_value = (None, uploaded)
+        files.get().execute.return_value = dict(uploaded, md5Checksum=hashlib.md5(b"same").hexdigest())
+        files.update.reset_mock()
+
+        upload_stream_to_drive(self.mock_drive_service, io.BytesIO(b"same"), "a.txt", "folder_id")
+        result = upload_stream_to_drive(self.mock_drive_service, io.BytesIO(b"same"), "a.txt", "folder_id")
+
+        self.assertEqual(result, "https://drive/file1")
+        files.update.assert_not_called()
+
+        result = upload_stream_to_drive(self.mock_drive_service, io.BytesIO(b"changed"), "a.txt", "folder_id")
+
+        self.assertEqual(result, "https://drive/file1")
+        self.assertEqual(files.update.call_args[1]["fileId"], "file1")
+
+    @patch("google_drive_utils.SIMPLE_UPLOAD_MAX_SIZE", 0)
+    @patch("google_drive_utils._media_md5", wraps=_media_md5)
+    @patch("google_drive_utils.find_file_id")
+    def test_overwrite_hashes_content_once(self, mock_find_file, mock_media_md5):
+        """Test that a displaced cached file is skipped for the one found by name, hashing the content once."""
+        mock_find_file.return_value = None
+        files = self.mock_drive_service.files()
+        files.create().next_chunk.return_value = (None, {"id": "file1", "webViewLink": "https://drive/file1"})
+        files.update().next_chunk.return_value = (None, {"id": "file2", "webViewLink": "https://drive/file2"})
+        files.get().execute.side_effect = [
+            {"name": "a.txt", "parents": ["other_folder_id"], "md5Checksum": "old"},
+            {"name": "a.txt", "parents": ["folder_id"], "md5Checksum": "old"},
+        ]
+        files.update.reset_mock()
+        upload_stream_to_drive(self.mock_drive_service, io.BytesIO(b"one"), "a.txt", "folder_id")
+        mock_find_file.return_value = "file2"
+
+        result = upload_stream_to_drive(self.mock_drive_service, io.BytesIO(b"two"), "a.txt", "folder_id")
+
+        self.assertEqual(result, "https://drive/file2")
+        files.update.assert_called_once()
+        self.assertEqual(files.update.call_args[1]["fileId"], "file2")
+        mock_media_md5.assert_called_once()
+
+    @patch("google_drive_utils.find_file_id")
+    def test_overwrite_never_updates_displaced_file(self, mock_find_file):
+        """Test that a previously uploaded file that was trashed, renamed or moved is left alone."""
+        displaced = {
+            "trashed": {"name": "a.txt", "parents": ["folder_id"], "trashed": True},
+            "renamed": {"name": "b.txt", "parents": ["folder_id"]},
+            "moved": {"name": "a.txt", "parents": ["other_folder_id"]},
+        }
+        for reason, metadata in displaced.items():
+            with self.subTest(reason=reason):
+                invalidate_folder_cache()
+                mock_find_file.reset_mock()
+                mock_find_file.return_value = None
+                files = self.mock_drive_service.files()
+                files.create().execute.side_effect = [
+                    {"id": "file1", "webViewLink": "https://drive/file1"},
+                    {"id": "file2", "webViewLink": "https://drive/file2"},
+                ]
+                files.get().execute.return_value = metadata
+                files.update.reset_mock()
+
+                upload_stream_to_drive(self.mock_drive_service, io.BytesIO(b"one"), "a.txt", "folder_id")
+                result = upload_stream_to_drive(self.mock_drive_service, io.BytesIO(b"two"), "a.txt", "folder_id")
+
+                self.assertEqual(result, "https://drive/file2")
+                files.update.assert_not_called()
+                self.assertEqual(mock_find_file.call_count, 2)
+
+    @patch("google_drive_utils.upload_file_to_drive")
+    def test_upload_files_to_drive(self, mock_upload_file):
+        """Test that files are uploaded concurrently, results keep their order and failures give None."""
+        started = threading.Barrier(2, timeout=5)
+
+        def upload(drive_service, file_path, folder_id, overwrite):
+            started.wait()
+            if file_path == "bad.txt":
+                raise HttpError(resp=MagicMock(status=500), content=b"Error")
+            return f"https://drive/{file_path}"
+
+        mock_upload_file.side_effect = upload
+
+        result = upload_files_to_drive(
+            self.mock_drive_service, [("a.txt", "folder_id"), ("bad.txt", "folder_id")], max_concurrency=2
+        )
+
+        self.assertEqual(result, ["https://drive/a.txt", None])
+        self.assertEqual(upload_files_to_drive(self.mock_drive_service, []), [])
+
+    def test_upload_chunk_size(self):
+        """Test that chunks grow for very large files, stay 256 KiB aligned and are capped at 32 MiB."""
+        self.assertEqual(_upload_chunk_size(10 * 1024 * 1024), 8 * 1024 * 1024)
+        self.assertEqual(_upload_chunk_size(1024**3 + 12345), 16 * 1024 * 1024)
+        self.assertEqual(_upload_chunk_size(100 * 1024**3), 32 * 1024 * 1024)
+        self.assertEqual(_upload_chunk_size(1300 * 1024 * 1024) % (256 * 1024), 0)
+
+        with patch("google_drive_utils.MAX_UPLOAD_CHUNK_SIZE", 64 * 1024 * 1024):
+            self.assertEqual(_upload_chunk_size(100 * 1024**3), 64 * 1024 * 1024)
+
+    def test_upload_stream_to_drive_invalid_parameters(self):
+        """Test upload_stream_to_drive rejects a missing service or folder."""
+        self.assertIsNone(upload_stream_to_drive(None, io.BytesIO(b"data"), "file.txt", "folder_id"))
+        self.assertIsNone(upload_stream_to_drive(self.mock_drive_service, io.BytesIO(b"data"), "file.txt", ""))
+
     # Additional tests for folder-related functions
     def test_find_folder_id(self):
         """Test finding a folder ID."""
         # Mock the files().list().execute() response
         mock_list = MagicMock()
-        mock_execute = MagicMock(return_value={"files": [{"id": "folder_id"}]})
+        mock_execute = MagicMock(return_value={"files": [{"id": "folder_id", "name": "test_folder"}]})
         mock_list.execute = mock_execute
         self.mock_drive_service.files().list.return_value = mock_list
 
@@ -304,9 +791,32 @@ class TestGoogleDriveUtils(unittest.TestCase):
         self.assertGreater(len(list_calls), 0, "Should call list at least once")
         final_call_args = list_calls[-1][1]
         self.assertIn("mimeType='application/vnd.google-apps.folder'", final_call_args["q"])
-        self.assertIn("name='test_folder'", final_call_args["q"])
         self.assertIn("'parent_id' in parents", final_call_args["q"])
 
+    def test_find_folder_id_caches_siblings(self):
+        """Test that one listing answers sibling lookups and created folders are added to it."""
+        self.mock_drive_service.files().list().execute.side_effect = [
+            {"files": [{"id": "a_id", "name": "a"}, {"id": "b_id", "name": "b"}], "nextPageToken": "page2"},
+            {"files": [{"id": "dup_id", "name": "a"}, {"id": "c_id", "name": "c"}]},
+            {"files": []},
+        ]
+        self.mock_drive_service.files().create().execute.return_value = {"id": "new_id"}
+        list_mock = self.mock_drive_service.files().list
+        list_mock.reset_mock()
+
+        self.assertEqual(find_folder_id(self.mock_drive_service, "a", "parent_id"), "a_id")
+        self.assertEqual(find_folder_id(self.mock_drive_service, "c", "parent_id"), "c_id")
+        self.assertEqual(list_mock.call_args_list[1][1]["pageToken"], "page2")
+        self.assertEqual(list_mock.call_count, 2)
+
+        self.assertEqual(create_folder(self.mock_drive_service, "new", "parent_id"), "new_id")
+        self.assertEqual(find_folder_id(self.mock_drive_service, "new", "parent_id"), "new_id")
+        self.assertEqual(list_mock.call_count, 2)
+
+        # A name missing from the cached listing is looked up again
+        self.assertIsNone(find_folder_id(self.mock_drive_service, "missing", "parent_id"))
+        self.assertEqual(list_mock.call_count, 3)
+
     def test_create_folder(self):
         """Test creating a folder."""
         # Mock the files().create().execute() response
@@ -329,6 +839,23 @@ class TestGoogleDriveUtils(unittest.TestCase):
         self.assertEqual(final_call_args["body"]["mimeType"], "application/vnd.google-apps.folder")
         self.assertEqual(final_call_args["body"]["parents"], ["parent_id"])
 
+    @patch("time.sleep")
+    def test_create_folder_in_deleted_parent_forgets_it(self, mock_sleep):
+        """Test that a parent folder deleted outside the service is dropped from the cache when creating in it."""
+        _cache_folder_id(("a",), "a_id")
+        _cache_folder_id(("a", "b"), "b_id")
+        _cache_folder_id(("other",), "other_id")
+        self.mock_drive_service.files().create().execute.side_effect = HttpError(
+            resp=MagicMock(status=404), content=b"Not found"
+        )
+
+        with self.assertRaises(HttpError):
+            create_folder(self.mock_drive_service, "c", "a_id")
+
+        self.assertIsNone(_get_cached_folder_id(("a",)))
+        self.assertIsNone(_get_cached_folder_id(("a", "b")))
+        self.assertEqual(_get_cached_folder_id(("other",)), "other_id")
+
     @patch("google_drive_utils.find_folder_id")
     @patch("google_drive_utils.create_folder")
     def test_create_folder_if_not_exists_existing(self, mock_create_folder, mock_find_folder):
@@ -377,6 +904,38 @@ class TestGoogleDriveUtils(unittest.TestCase):
         final_create_call = create_calls[-1]
         self.assertEqual(final_create_call[0], (self.mock_drive_service, "test_folder", "root"))
 
+    @patch("google_drive_utils.find_folder_id")
+    @patch("google_drive_utils.create_folder")
+    def test_create_folder_if_not_exists_concurrent(self, mock_create_folder, mock_find_folder):
+        """Test that concurrent calls for the same new folder create it once."""
+        mock_find_folder.return_value = None
+        _cache_child_folders("root", {})
+        started, release = threading.Event(), threading.Event()
+
+        def slow_create(drive_service, folder_name, parent_id):
+            started.set()
+            release.wait(5)
+            _add_cached_child_folder(parent_id, folder_name, "new_folder_id")
+            return "new_folder_id"
+
+        mock_create_folder.side_effect = slow_create
+        results = []
+        first = threading.Thread(
+            target=lambda: results.append(create_folder_if_not_exists(self.mock_drive_service, "reports"))
+        )
+        first.start()
+        started.wait(5)
+        second = threading.Thread(
+            target=lambda: results.append(create_folder_if_not_exists(self.mock_drive_service, "reports/"))
+        )
+        second.start()
+        release.set()
+        first.join()
+        second.join()
+
+        self.assertEqual(results, ["new_folder_id", "new_folder_id"])
+        mock_create_folder.assert_called_once()
+
     @patch("google_drive_utils.find_folder_id")
     def test_get_folder_id_by_path(self, mock_find_folder):
         """Test getting a folder ID by path."""
@@ -394,6 +953,337 @@ class TestGoogleDriveUtils(unittest.TestCase):
         mock_find_folder.assert_any_call(self.mock_drive_service, "folder1", "root")
         mock_find_folder.assert_any_call(self.mock_drive_service, "folder2", "folder1_id")
 
+    def _mock_batch_responses(self, responses):
+        """Make new_batch_http_request deliver the given responses, keyed by request_id, to the callback."""
+
+        def new_batch(callback):
+            batch = MagicMock()
+            request_ids = []
+            batch.add.side_effect = lambda request, request_id: request_ids.append(request_id)
+            batch.execute.side_effect = lambda: [
+                (
+                    callback(request_id, None, responses[request_id])
+                    if isinstance(responses.get(request_id), Exception)
+                    else callback(request_id, responses.get(request_id), None)
+                )
+                for request_id in request_ids
+            ]
+            return batch
+
+        self.mock_drive_service.new_batch_http_request.side_effect = new_batch
+
+    @patch("google_drive_utils.delete_file_by_id")
+    def test_delete_files_batch(self, mock_delete_file):
+        """Test that deletes are sent in one batch with 404 as success, 403 as failure and others retried."""
+        self._mock_batch_responses(
+            {
+                "ok": {},
+                "gone": HttpError(resp=MagicMock(status=404), content=b"Not found"),
+                "denied": HttpError(resp=MagicMock(status=403), content=b"Forbidden"),
+                "flaky": HttpError(resp=MagicMock(status=500), content=b"Error"),
+                "throttled": HttpError(resp=MagicMock(status=403), content=b'{"reason": "rateLimitExceeded"}'),
+            }
+        )
+        mock_delete_file.return_value = True
+
+        result = delete_files_batch(self.mock_drive_service, ["ok", "gone", "denied", "flaky", "throttled", "ok"])
+
+        self.assertEqual(result, {"ok": True, "gone": True, "denied": False, "flaky": True, "throttled": True})
+        self.mock_drive_service.new_batch_http_request.assert_called_once()
+        self.assertEqual(
+            mock_delete_file.call_args_list,
+            [
+                unittest.mock.call(self.mock_drive_service, "flaky"),
+                unittest.mock.call(self.mock_drive_service, "throttled"),
+            ],
+        )
+
+    @patch("google_drive_utils.find_folder_id")
+    def test_concurrent_lookups_of_one_path_coalesce(self, mock_find_folder):
+        """Test that lookups of a path already being resolved wait for that resolution instead of repeating it."""
+        release = threading.Event()
+
+        def find(drive_service, folder_name, parent_id):
+            release.wait(timeout=5)
+            return "a_id"
+
+        mock_find_folder.side_effect = find
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(get_folder_id_by_path, self.mock_drive_service, "a") for _ in range(4)]
+            time.sleep(0.1)  # Let every lookup reach the path before the first one completes
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(results, ["a_id"] * 4)
+        mock_find_folder.assert_called_once()
+
+    @patch("google_drive_utils.get_folder_ids_by_paths")
+    def test_delete_folders_by_paths(self, mock_get_folder_ids):
+        """Test that the folders at several paths are deleted in one batch and their cached paths forgotten."""
+        mock_get_folder_ids.return_value = {"a/b": "b_id", "c": "c_id", "missing": None, "/": "root"}
+        _cache_folder_id(("a", "b", "d"), "d_id")
+        _cache_folder_id(("a", "b"), "b_id")
+        self._mock_batch_responses({"b_id": {}, "c_id": HttpError(resp=MagicMock(status=403), content=b"Forbidden")})
+
+        result = delete_folders_by_paths(self.mock_drive_service, ["a/b", "c", "missing", "/", ""])
+
+        self.assertEqual(result, {"a/b": True, "c": False, "missing": False, "/": False, "": False})
+        self.mock_drive_service.new_batch_http_request.assert_called_once()
+        mock_get_folder_ids.assert_called_once_with(self.mock_drive_service, ["a/b", "c", "missing", "/"])
+        self.assertIsNone(_get_cached_folder_id(("a", "b", "d")))
+
+    @patch("google_drive_utils.delete_file_by_id")
+    @patch("google_drive_utils.delete_folder_by_id")
+    @patch("google_drive_utils.get_folder_ids_by_paths")
+    def test_delete_folders_by_paths_retries_with_folder_delete(
+        self, mock_get_folder_ids, mock_delete_folder, mock_delete_file
+    ):
+        """Test that a folder delete the batch did not settle is retried as a folder, not a file."""
+        mock_get_folder_ids.return_value = {"a": "a_id"}
+        mock_delete_folder.return_value = True
+        self._mock_batch_responses({"a_id": HttpError(resp=MagicMock(status=500), content=b"Error")})
+
+        with self.assertLogs("google_drive_utils", level="INFO") as logs:
+            result = delete_folders_by_paths(self.mock_drive_service, ["a"])
+
+        self.assertEqual(result, {"a": True})
+        mock_delete_folder.assert_called_once_with(self.mock_drive_service, "a_id")
+        mock_delete_file.assert_not_called()
+        self.assertIn("Deleted 1 of 1 folders", "\n".join(logs.output))
+
+    @patch("google_drive_utils.get_folder_id_by_path")
+    def test_get_folder_ids_by_paths(self, mock_get_folder_id):
+        """Test that several paths are resolved concurrently and duplicates are looked up once."""
+        started = threading.Barrier(2, timeout=5)
+
+        def lookup(drive_service, folder_path):
+            # Both lookups must be in flight at the same time to pass the barrier
+            started.wait()
+            return None if folder_path == "missing" else f"{folder_path}_id"
+
+        mock_get_folder_id.side_effect = lookup
+
+        result = get_folder_ids_by_paths(self.mock_drive_service, ["a/b", "missing", "a/b"])
+
+        self.assertEqual(result, {"a/b": "a/b_id", "missing": None})
+        self.assertEqual(mock_get_folder_id.call_count, 2)
+
+    @patch("google_drive_utils.create_folder_if_not_exists")
+    def test_create_folders_if_not_exist(self, mock_create_path):
+        """Test that several paths are created concurrently and duplicates are created once."""
+        started = threading.Barrier(2, timeout=5)
+
+        def create(drive_service, folder_path):
+            # Both creations must be in flight at the same time to pass the barrier
+            started.wait()
+            return None if folder_path == "denied" else f"{folder_path}_id"
+
+        mock_create_path.side_effect = create
+
+        result = create_folders_if_not_exist(self.mock_drive_service, ["a/b", "denied", "a/b"])
+
+        self.assertEqual(result, {"a/b": "a/b_id", "denied": None})
+        self.assertEqual(mock_create_path.call_count, 2)
+
+    def test_split_folder_path(self):
+        """Test that folder paths are split into non-empty segments."""
+        self.assertEqual(_split_folder_path("/a//b/c/"), ("a", "b", "c"))
+        self.assertEqual(_split_folder_path("/"), ())
+
+    def _mock_path_search(self, *pages):
+        """Make the root folder lookup return root_id and the folder name search return the given pages."""
+        self.mock_drive_service.files().get().execute.return_value = {"id": "root_id"}
+        self.mock_drive_service.files().list().execute.side_effect = list(pages)
+
+    @patch("google_drive_utils.find_folder_id")
+    def test_get_folder_id_by_path_listed(self, mock_find_folder):
+        """Test that a multi-level path is resolved from one search for all its folder names."""
+        self._mock_path_search(
+            {
+                "files": [
+                    {"id": "a_id", "name": "a", "parents": ["root_id"]},
+                    {"id": "other_a", "name": "a", "parents": ["elsewhere"]},
+                    {"id": "b_id", "name": "b", "parents": ["a_id"]},
+                    {"id": "newer_b", "name": "b", "parents": ["a_id"]},
+                ]
+            }
+        )
+
+        result = get_folder_id_by_path(self.mock_drive_service, "a/b")
+
+        self.assertEqual(result, "b_id")
+        mock_find_folder.assert_not_called()
+        query = self.mock_drive_service.files().list.call_args[1]["q"]
+        self.assertIn("(name='a' or name='b')", query)
+
+        # The root folder ID is cached, so another path only needs the search
+        self._mock_path_search({"files": [{"id": "x_id", "name": "x", "parents": ["root_id"]}]})
+        self.mock_drive_service.files().get().execute.reset_mock()
+        self.assertIsNone(get_folder_id_by_path(self.mock_drive_service, "x/y"))
+        self.mock_drive_service.files().get().execute.assert_not_called()
+
+    @patch("google_drive_utils.find_folder_id")
+    def test_get_folder_id_by_path_listed_from_cached_ancestor(self, mock_find_folder):
+        """Test that the search only covers the segments below the deepest cached ancestor."""
+        _cache_folder_id(("a",), "a_id")
+        self._mock_path_search(
+            {
+                "files": [
+                    {"id": "b_id", "name": "b", "parents": ["a_id"]},
+                    {"id": "c_id", "name": "c", "parents": ["b_id"]},
+                ]
+            }
+        )
+
+        result = get_folder_id_by_path(self.mock_drive_service, "a/b/c")
+
+        self.assertEqual(result, "c_id")
+        mock_find_folder.assert_not_called()
+        self.mock_drive_service.files().get().execute.assert_not_called()
+        query = self.mock_drive_service.files().list.call_args[1]["q"]
+        self.assertIn("(name='b' or name='c')", query)
+
+    @patch("google_drive_utils.find_folder_id")
+    def test_get_folder_id_by_path_listed_pages(self, mock_find_folder):
+        """Test that the search is paged and segments beyond the fetched pages are looked up one by one."""
+        pages = [{"files": [], "nextPageToken": f"page{index}"} for index in range(PATH_QUERY_MAX_PAGES)]
+        pages[0]["files"] = [{"id": "a_id", "name": "a", "parents": ["root_id"]}]
+        self._mock_path_search(*pages)
+        mock_find_folder.side_effect = ["b_id", "c_id"]
+
+        result = get_folder_id_by_path(self.mock_drive_service, "a/b/c")
+
+        self.assertEqual(result, "c_id")
+        self.assertEqual(self.mock_drive_service.files().list().execute.call_count, PATH_QUERY_MAX_PAGES)
+        self.assertEqual(
+            mock_find_folder.call_args_list,
+            [
+                unittest.mock.call(self.mock_drive_service, "b", "a_id"),
+                unittest.mock.call(self.mock_drive_service, "c", "b_id"),
+            ],
+        )
+
+    @patch("google_drive_utils.find_folder_id")
+    def test_get_folder_id_by_path_listed_missing(self, mock_find_folder):
+        """Test that a segment the complete search results do not contain is reported missing without lookups."""
+        self._mock_path_search(
+            {
+                "files": [
+                    {"id": "a_id", "name": "a", "parents": ["root_id"]},
+                    {"id": "b_elsewhere", "name": "b", "parents": ["other_id"]},
+                ]
+            }
+        )
+
+        self.assertIsNone(get_folder_id_by_path(self.mock_drive_service, "a/b/c"))
+        mock_find_folder.assert_not_called()
+
+    @patch("google_drive_utils.find_folder_id")
+    def test_get_folder_id_by_path_listed_error(self, mock_find_folder):
+        """Test that a failed search falls back to resolving the path segment by segment."""
+        self.mock_drive_service.files().get().execute.side_effect = HttpError(
+            resp=MagicMock(status=500), content=b"Error"
+        )
+        mock_find_folder.side_effect = ["a_id", "b_id"]
+
+        self.assertEqual(get_folder_id_by_path(self.mock_drive_service, "a/b"), "b_id")
+        mock_find_folder.assert_any_call(self.mock_drive_service, "a", "root")
+
+    @patch("google_drive_utils.find_folder_id")
+    @patch("google_drive_utils.create_folder")
+    def test_create_folder_if_not_exists_listed(self, mock_create_folder, mock_find_folder):
+        """Test that existing segments are resolved from one search and segments it shows missing are just created."""
+        self._mock_path_search({"files": [{"id": "a_id", "name": "a", "parents": ["root_id"]}]})
+        mock_find_folder.return_value = None
+        mock_create_folder.side_effect = ["b_id", "c_id"]
+
+        result = create_folder_if_not_exists(self.mock_drive_service, "a/b/c")
+
+        self.assertEqual(result, "c_id")
+        mock_find_folder.assert_not_called()
+        self.assertEqual(
+            mock_create_folder.call_args_list,
+            [
+                unittest.mock.call(self.mock_drive_service, "b", "a_id"),
+                unittest.mock.call(self.mock_drive_service, "c", "b_id"),
+            ],
+        )
+
+    @patch("google_drive_utils.find_folder_id")
+    def test_folder_ids_cached_until_folder_deleted(self, mock_find_folder):
+        """Test that resolved folder paths are reused and forgotten once a folder is deleted."""
+        mock_find_folder.return_value = "a_id"
+
+        self.assertEqual(create_folder_if_not_exists(self.mock_drive_service, "a"), "a_id")
+        self.assertEqual(create_folder_if_not_exists(self.mock_drive_service, "/a/"), "a_id")
+        self.assertEqual(get_folder_id_by_path(self.mock_drive_service, "a"), "a_id")
+        mock_find_folder.assert_called_once()
+
+        delete_folder_by_id(self.mock_drive_service, "other_id")
+        get_folder_id_by_path(self.mock_drive_service, "a")
+        self.assertEqual(mock_find_folder.call_count, 2)
+
+    @patch("google_drive_utils.FOLDER_CACHE_SIZE", 2)
+    def test_folder_cache_evicts_least_recently_used(self):
+        """Test that a full folder cache drops the path used least recently rather than the oldest."""
+        _cache_folder_id(("a",), "a_id")
+        _cache_folder_id(("b",), "b_id")
+        self.assertEqual(_get_cached_folder_id(("a",)), "a_id")
+
+        _cache_folder_id(("c",), "c_id")
+
+        self.assertEqual(_get_cached_folder_id(("a",)), "a_id")
+        self.assertIsNone(_get_cached_folder_id(("b",)))
+        self.assertEqual(_get_cached_folder_id(("c",)), "c_id")
+
+    def test_persistent_folder_cache(self):
+        """Test that folder IDs stored in the database are shared and forgotten with their subtree."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database = _PersistentFolderCache(os.path.join(temp_dir, "folders.sqlite3"))
+            with patch("google_drive_utils._persistent_folder_cache", database):
+                _cache_folder_id(("a",), "a_id")
+                _cache_folder_id(("a", "b"), "b_id")
+                _cache_folder_id(("ab",), "ab_id")
+
+                # Another process starts with an empty in-memory cache
+                with patch.dict("google_drive_utils._folder_id_cache", clear=True):
+                    self.assertEqual(_get_cached_folder_id(("a", "b")), "b_id")
+                    self.assertIsNone(_get_cached_folder_id(("c",)))
+
+                self.assertTrue(delete_folder_by_id(self.mock_drive_service, "a_id"))
+                self.assertIsNone(database.get(("a",)))
+                self.assertIsNone(database.get(("a", "b")))
+                self.assertEqual(database.get(("ab",))[0], "ab_id")
+
+                with patch("google_drive_utils.FOLDER_CACHE_TTL", -1):
+                    _cache_folder_id(("old",), "old_id")
+                self.assertIsNone(database.get(("old",)))
+
+                invalidate_folder_cache()
+                self.assertIsNone(database.get(("ab",)))
+
+    def test_deleting_folder_forgets_only_its_subtree(self):
+        """Test that deleting a folder with a cached path keeps unrelated cached folders."""
+        _cache_folder_id(("a", "b"), "b_id")
+        _cache_folder_id(("a", "b", "c"), "c_id")
+        _cache_folder_id(("x",), "x_id")
+        _cache_child_folders("a_id", {"b": "b_id", "other": "other_id"})
+
+        self.assertTrue(delete_folder_by_id(self.mock_drive_service, "b_id"))
+
+        self.assertIsNone(_get_cached_folder_id(("a", "b")))
+        self.assertIsNone(_get_cached_folder_id(("a", "b", "c")))
+        self.assertEqual(_get_cached_folder_id(("x",)), "x_id")
+        self.assertEqual(_get_cached_child_folders("a_id"), {"other": "other_id"})
+
+    @patch("google_drive_utils.find_folder_id")
+    def test_missing_folder_not_cached(self, mock_find_folder):
+        """Test that paths that do not exist are looked up again on the next call."""
+        mock_find_folder.side_effect = [None, "a_id"]
+
+        self.assertIsNone(get_folder_id_by_path(self.mock_drive_service, "a"))
+        self.assertEqual(get_folder_id_by_path(self.mock_drive_service, "a"), "a_id")
+
     def test_delete_folder_by_id(self):
         """Test deleting a folder by ID."""
         # Mock the files().delete().execute() response
@@ -444,27 +1334,48 @@ class TestGoogleDriveUtils(unittest.TestCase):
 class TestAuthenticationFunctions(unittest.TestCase):
     """Test authentication-related functions."""
 
-    @patch("google_drive_utils.os.path.exists")
-    def test_check_token_exists_true(self, mock_exists):
+    @patch("google_drive_utils.os.stat")
+    def test_check_token_exists_true(self, mock_stat):
         """Test check_token_exists when token file exists."""
-        mock_exists.return_value = True
+        mock_stat.return_value = MagicMock(st_mtime_ns=1000)
 
         result = check_token_exists()
 
         self.assertTrue(result)
-        mock_exists.assert_called_once()
+        mock_stat.assert_called_once()
 
-    @patch("google_drive_utils.os.path.exists")
-    def test_check_token_exists_false(self, mock_exists):
+    @patch("google_drive_utils.os.stat")
+    def test_check_token_exists_false(self, mock_stat):
         """Test check_token_exists when token file doesn't exist."""
-        mock_exists.return_value = False
+        mock_stat.side_effect = FileNotFoundError()
 
         result = check_token_exists()
 
         self.assertFalse(result)
-        mock_exists.assert_called_once()
+        mock_stat.assert_called_once()
+
+    @patch("google_drive_utils.os.stat")
+    def test_check_token_exists_cached_within_ttl(self, mock_stat):
+        """Test check_token_exists only stats the token file once per TTL window."""
+        mock_stat.return_value = MagicMock(st_mtime_ns=1000)
+
+        self.assertTrue(check_token_exists())
+        self.assertTrue(check_token_exists())
+
+        mock_stat.assert_called_once()
 
-    @patch("google_drive_utils.Flow.from_client_secrets_file")
+    @patch("google_drive_utils.os.stat")
+    def test_check_token_exists_invalidated(self, mock_stat):
+        """Test invalidate_token_state forces the next check to hit the filesystem."""
+        mock_stat.side_effect = [FileNotFoundError(), MagicMock(st_mtime_ns=1000)]
+
+        self.assertFalse(check_token_exists())
+        invalidate_token_state()
+        self.assertTrue(check_token_exists())
+
+        self.assertEqual(mock_stat.call_count, 2)
+
+    @patch("google_drive_utils._new_oauth_flow")
     def test_generate_authorization_url_success(self, mock_flow_class):
         """Test generate_authorization_url when successful."""
         # Mock the flow instance
@@ -480,7 +1391,7 @@ class TestAuthenticationFunctions(unittest.TestCase):
             prompt="consent", access_type="offline", include_granted_scopes="true"
         )
 
-    @patch("google_drive_utils.Flow.from_client_secrets_file")
+    @patch("google_drive_utils._new_oauth_flow")
     def test_generate_authorization_url_failure(self, mock_flow_class):
         """Test generate_authorization_url when it fails."""
         # Mock the flow to raise an exception during authorization_url call
@@ -497,9 +1408,8 @@ class TestAuthenticationFunctions(unittest.TestCase):
             prompt="consent", access_type="offline", include_granted_scopes="true"
         )
 
-    @patch("google_drive_utils.Flow.from_client_secrets_file")
-    @patch("builtins.open", new_callable=unittest.mock.mock_open)
-    def test_exchange_code_for_tokens_success(self, mock_open, mock_flow_class):
+    @patch("google_drive_utils._new_oauth_flow")
+    def test_exchange_code_for_tokens_success(self, mock_flow_class):
         """Test exchange_code_for_tokens when successful."""
         # Mock the flow instance and credentials
         mock_flow = MagicMock()
@@ -509,14 +1419,100 @@ class TestAuthenticationFunctions(unittest.TestCase):
         mock_flow.credentials = mock_creds
         mock_flow_class.return_value = mock_flow
 
-        result = exchange_code_for_tokens("test_code")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            token_path = os.path.join(temp_dir, "token.json")
+            with patch("google_drive_utils.TOKEN_PATH", token_path):
+                result = exchange_code_for_tokens("test_code")
 
-        self.assertTrue(result)
+            self.assertTrue(result)
+            with open(token_path) as token:
+                self.assertEqual(token.read(), '{"token": "test"}')
+            self.assertEqual(os.stat(token_path).st_mode & 0o777, 0o600)
+            self.assertEqual(os.listdir(temp_dir), ["token.json"])
         mock_flow_class.assert_called_once()
         mock_flow.fetch_token.assert_called_once_with(code="test_code")
-        mock_open.assert_called_once()
 
-    @patch("google_drive_utils.Flow.from_client_secrets_file")
+    def test_read_client_config_parses_once_per_mtime(self):
+        """Test that the client secrets are parsed again only after the file changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            secrets_path = os.path.join(temp_dir, "credentials.json")
+            with open(secrets_path, "w") as secrets:
+                secrets.write('{"web": {"client_id": "first"}}')
+            os.utime(secrets_path, ns=(1, 1))
+
+            with (
+                patch("google_drive_utils.CREDENTIALS_PATH", secrets_path),
+                patch("google_drive_utils.json.load", wraps=json.load) as mock_load,
+            ):
+                self.assertEqual(_read_client_config(), {"web": {"client_id": "first"}})
+                self.assertEqual(_read_client_config(), {"web": {"client_id": "first"}})
+                self.assertEqual(mock_load.call_count, 1)
+
+                with open(secrets_path, "w") as secrets:
+                    secrets.write('{"web": {"client_id": "second"}}')
+                os.utime(secrets_path, ns=(2, 2))
+                self.assertEqual(_read_client_config(), {"web": {"client_id": "second"}})
+                self.assertEqual(mock_load.call_count, 2)
+
+    @patch("google_drive_utils._read_client_config")
+    def test_new_oauth_flow_imports_oauthlib_on_first_use(self, mock_read_config):
+        """Test that google_auth_oauthlib is loaded by the authorization flow, not on module import."""
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, google_drive_utils; print('google_auth_oauthlib' in sys.modules)"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
+        mock_read_config.return_value = {
+            "web": {
+                "client_id": "client",
+                "client_secret": "secret",
+                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+                "token_uri": "https://oauth2.googleapis.com/token",
+            }
+        }
+        flow = _new_oauth_flow()
+        self.assertEqual(type(flow).__module__, "google_auth_oauthlib.flow")
+        self.assertEqual(flow.redirect_uri, REDIRECT_URI)
+
+    @patch("google_drive_utils.os.replace")
+    def test_save_token_skips_unchanged(self, mock_replace):
+        """Test that an unchanged token is not rewritten."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            token_path = os.path.join(temp_dir, "token.json")
+            with open(token_path, "w") as token:
+                token.write('{"token": "same"}')
+
+            with patch("google_drive_utils.TOKEN_PATH", token_path):
+                _save_token(MagicMock(to_json=MagicMock(return_value='{"token": "same"}')))
+
+        mock_replace.assert_not_called()
+
+    def test_read_token_info_parses_once_per_mtime(self):
+        """Test that the token file is parsed again only after it changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            token_path = os.path.join(temp_dir, "token.json")
+            with patch("google_drive_utils.TOKEN_PATH", token_path):
+                self.assertIsNone(_read_token_info())
+
+                with open(token_path, "w") as token:
+                    token.write('{"token": "first"}')
+                os.utime(token_path, ns=(1, 1))
+                with patch("google_drive_utils.json.load", wraps=json.load) as mock_load:
+                    self.assertEqual(_read_token_info(), {"token": "first"})
+                    self.assertEqual(_read_token_info(), {"token": "first"})
+                    self.assertEqual(mock_load.call_count, 1)
+
+                    with open(token_path, "w") as token:
+                        token.write('{"token": "second"}')
+                    os.utime(token_path, ns=(2, 2))
+                    self.assertEqual(_read_token_info(), {"token": "second"})
+                    self.assertEqual(mock_load.call_count, 2)
+
+    @patch("google_drive_utils._new_oauth_flow")
     def test_exchange_code_for_tokens_invalid_credentials(self, mock_flow_class):
         """Test exchange_code_for_tokens with invalid credentials."""
         # Mock the flow instance with invalid credentials
@@ -532,7 +1528,7 @@ class TestAuthenticationFunctions(unittest.TestCase):
         mock_flow_class.assert_called_once()
         mock_flow.fetch_token.assert_called_once_with(code="test_code")
 
-    @patch("google_drive_utils.Flow.from_client_secrets_file")
+    @patch("google_drive_utils._new_oauth_flow")
     def test_exchange_code_for_tokens_exception(self, mock_flow_class):
         """Test exchange_code_for_tokens when an exception occurs."""
         # Mock the flow to raise an exception
@@ -546,13 +1542,13 @@ class TestAuthenticationFunctions(unittest.TestCase):
         mock_flow_class.assert_called_once()
         mock_flow.fetch_token.assert_called_once_with(code="test_code")
 
-    @patch("google_drive_utils.build")
-    @patch("google_drive_utils.Credentials.from_authorized_user_file")
-    @patch("google_drive_utils.os.path.exists")
-    def test_authenticate_google_drive_success(self, mock_exists, mock_creds_from_file, mock_build):
+    @patch("google_drive_utils.build_from_document")
+    @patch("google_drive_utils.Credentials.from_authorized_user_info")
+    @patch("google_drive_utils._read_token_info")
+    def test_authenticate_google_drive_success(self, mock_read_token, mock_creds_from_file, mock_build):
         """Test authenticate_google_drive when successful."""
         # Mock token file exists
-        mock_exists.return_value = True
+        mock_read_token.return_value = {"refresh_token": "refresh_token"}
 
         # Mock valid credentials
         mock_creds = MagicMock()
@@ -561,15 +1557,18 @@ class TestAuthenticationFunctions(unittest.TestCase):
 
         # Mock service
         mock_service = MagicMock()
-        mock_service.files().list().execute.return_value = {"files": []}
+        mock_service.files().get().execute.return_value = {"id": "root_id"}
         mock_build.return_value = mock_service
 
         result = authenticate_google_drive()
 
         self.assertEqual(result, mock_service)
+        # The probe request warms the root folder ID used by path resolution
+        mock_service.files().get.assert_called_with(fileId="root", fields="id")
+        self.assertEqual(_get_cached_folder_id(()), "root_id")
         # Verify calls were made (decorator-resilient for authenticate_google_drive)
-        exists_calls = mock_exists.call_args_list
-        self.assertGreater(len(exists_calls), 0, "Should call exists at least once")
+        read_calls = mock_read_token.call_args_list
+        self.assertGreater(len(read_calls), 0, "Should read the token file at least once")
 
         creds_calls = mock_creds_from_file.call_args_list
         self.assertGreater(len(creds_calls), 0, "Should call creds_from_file at least once")
@@ -577,30 +1576,32 @@ class TestAuthenticationFunctions(unittest.TestCase):
         build_calls = mock_build.call_args_list
         self.assertGreater(len(build_calls), 0, "Should call build at least once")
         final_build_call = build_calls[-1]
-        self.assertEqual(final_build_call[0], ("drive", "v3"))
-        self.assertEqual(final_build_call[1]["credentials"], mock_creds)
+        self.assertEqual(final_build_call[0][0]["name"], "drive")
+        self.assertEqual(final_build_call[1]["http"].credentials, mock_creds)
 
-    @patch("google_drive_utils.os.path.exists")
-    def test_authenticate_google_drive_no_token(self, mock_exists):
+    @patch("google_drive_utils._read_token_info")
+    def test_authenticate_google_drive_no_token(self, mock_read_token):
         """Test authenticate_google_drive when no token file exists."""
         # Mock token file doesn't exist
-        mock_exists.return_value = False
+        mock_read_token.return_value = None
 
         result = authenticate_google_drive()
 
         self.assertIsNone(result)
-        # Verify exists was called (decorator-resilient for authenticate_google_drive)
-        exists_calls = mock_exists.call_args_list
-        self.assertGreater(len(exists_calls), 0, "Should call exists at least once")
-
-    @patch("google_drive_utils.build")
-    @patch("google_drive_utils.Credentials.from_authorized_user_file")
-    @patch("google_drive_utils.os.path.exists")
-    @patch("builtins.open", new_callable=unittest.mock.mock_open)
-    def test_authenticate_google_drive_refresh_token(self, mock_open, mock_exists, mock_creds_from_file, mock_build):
+        # Verify the token file was read (decorator-resilient for authenticate_google_drive)
+        read_calls = mock_read_token.call_args_list
+        self.assertGreater(len(read_calls), 0, "Should read the token file at least once")
+
+    @patch("google_drive_utils.build_from_document")
+    @patch("google_drive_utils.Credentials.from_authorized_user_info")
+    @patch("google_drive_utils._read_token_info")
+    @patch("google_drive_utils._save_token")
+    def test_authenticate_google_drive_refresh_token(
+        self, mock_save, mock_read_token, mock_creds_from_file, mock_build
+    ):
         """Test authenticate_google_drive with expired credentials that need refresh."""
         # Mock token file exists
-        mock_exists.return_value = True
+        mock_read_token.return_value = {"refresh_token": "refresh_token"}
 
         # Mock expired credentials with refresh token
         mock_creds = MagicMock()
@@ -612,7 +1613,7 @@ class TestAuthenticationFunctions(unittest.TestCase):
 
         # Mock service
         mock_service = MagicMock()
-        mock_service.files().list().execute.return_value = {"files": []}
+        mock_service.files().get().execute.return_value = {"id": "root_id"}
         mock_build.return_value = mock_service
 
         # After refresh, credentials become valid
@@ -628,16 +1629,15 @@ class TestAuthenticationFunctions(unittest.TestCase):
         refresh_calls = mock_creds.refresh.call_args_list
         self.assertGreater(len(refresh_calls), 0, "Should call refresh at least once")
 
-        open_calls = mock_open.call_args_list
-        self.assertGreater(len(open_calls), 0, "Should call open at least once")
+        mock_save.assert_called_with(mock_creds)
 
-    @patch("google_drive_utils.build")
-    @patch("google_drive_utils.Credentials.from_authorized_user_file")
-    @patch("google_drive_utils.os.path.exists")
-    def test_authenticate_google_drive_api_error(self, mock_exists, mock_creds_from_file, mock_build):
+    @patch("google_drive_utils.build_from_document")
+    @patch("google_drive_utils.Credentials.from_authorized_user_info")
+    @patch("google_drive_utils._read_token_info")
+    def test_authenticate_google_drive_api_error(self, mock_read_token, mock_creds_from_file, mock_build):
         """Test authenticate_google_drive when API call fails."""
         # Mock token file exists
-        mock_exists.return_value = True
+        mock_read_token.return_value = {"refresh_token": "refresh_token"}
 
         # Mock valid credentials
         mock_creds = MagicMock()
@@ -648,7 +1648,7 @@ class TestAuthenticationFunctions(unittest.TestCase):
         mock_service = MagicMock()
         mock_response = MagicMock()
         mock_response.status = 401
-        mock_service.files().list().execute.side_effect = HttpError(mock_response, b'{"error": "unauthorized"}')
+        mock_service.files().get().execute.side_effect = HttpError(mock_response, b'{"error": "unauthorized"}')
         mock_build.return_value = mock_service
 
         result = authenticate_google_drive()
@@ -658,20 +1658,20 @@ class TestAuthenticationFunctions(unittest.TestCase):
         build_calls = mock_build.call_args_list
         self.assertGreater(len(build_calls), 0, "Should call build at least once")
         final_build_call = build_calls[-1]
-        self.assertEqual(final_build_call[0], ("drive", "v3"))
-        self.assertEqual(final_build_call[1]["credentials"], mock_creds)
+        self.assertEqual(final_build_call[0][0]["name"], "drive")
+        self.assertEqual(final_build_call[1]["http"].credentials, mock_creds)
 
     @patch("google_drive_utils.os.remove")
-    @patch("google_drive_utils.build")
-    @patch("google_drive_utils.Credentials.from_authorized_user_file")
-    @patch("google_drive_utils.os.path.exists")
+    @patch("google_drive_utils.build_from_document")
+    @patch("google_drive_utils.Credentials.from_authorized_user_info")
+    @patch("google_drive_utils._read_token_info")
     @patch("builtins.open", new_callable=unittest.mock.mock_open)
     def test_authenticate_google_drive_invalid_grant_error(
-        self, mock_open, mock_exists, mock_creds_from_file, mock_build, mock_remove
+        self, mock_open, mock_read_token, mock_creds_from_file, mock_build, mock_remove
     ):  # noqa: ARG002
         """Test authenticate_google_drive with invalid_grant error that removes token file."""
         # Mock token file exists
-        mock_exists.return_value = True
+        mock_read_token.return_value = {"refresh_token": "refresh_token"}
 
         # Mock expired credentials with refresh token that fails with invalid_grant
         mock_creds = MagicMock()
@@ -693,13 +1693,15 @@ class TestAuthenticationFunctions(unittest.TestCase):
         remove_calls = mock_remove.call_args_list
         self.assertGreater(len(remove_calls), 0, "Should call remove at least once")
 
-    @patch("google_drive_utils.build")
-    @patch("google_drive_utils.Credentials.from_authorized_user_file")
-    @patch("google_drive_utils.os.path.exists")
-    def test_authenticate_google_drive_credentials_loading_error(self, mock_exists, mock_creds_from_file, mock_build):
+    @patch("google_drive_utils.build_from_document")
+    @patch("google_drive_utils.Credentials.from_authorized_user_info")
+    @patch("google_drive_utils._read_token_info")
+    def test_authenticate_google_drive_credentials_loading_error(
+        self, mock_read_token, mock_creds_from_file, mock_build
+    ):
         """Test authenticate_google_drive when credentials loading fails."""
         # Mock token file exists
-        mock_exists.return_value = True
+        mock_read_token.return_value = {"refresh_token": "refresh_token"}
 
         # Mock credentials loading to raise an exception
         mock_creds_from_file.side_effect = Exception("Credentials loading error")
@@ -712,6 +1714,185 @@ class TestAuthenticationFunctions(unittest.TestCase):
         self.assertGreater(len(creds_calls), 0, "Should call creds_from_file at least once")
         mock_build.assert_not_called()
 
+    @patch("google_drive_utils.build")
+    @patch("google_drive_utils._get_drive_discovery_document")
+    @patch("google_drive_utils.Credentials.from_authorized_user_info")
+    @patch("google_drive_utils._read_token_info")
+    def test_authenticate_google_drive_without_static_discovery(
+        self, mock_read_token, mock_creds_from_file, mock_discovery_document, mock_build
+    ):
+        """Test that authentication falls back to build() when no bundled discovery document exists."""
+        mock_read_token.return_value = {"refresh_token": "refresh_token"}
+        mock_creds = MagicMock()
+        mock_creds.valid = True
+        mock_creds_from_file.return_value = mock_creds
+        mock_discovery_document.return_value = None
+        mock_service = MagicMock()
+        mock_build.return_value = mock_service
+
+        result = authenticate_google_drive()
+
+        self.assertEqual(result, mock_service)
+        build_args, build_kwargs = mock_build.call_args
+        self.assertEqual(build_args, ("drive", "v3"))
+        self.assertFalse(build_kwargs["static_discovery"])
+        self.assertIs(build_kwargs["cache"], _discovery_cache)
+        self.assertEqual(build_kwargs["http"].credentials, mock_creds)
+
+    def test_discovery_cache_fetches_document_once(self):
+        """Test that build() fetches the discovery document once and then serves it from memory."""
+        cache = _DiscoveryCache()
+        document = get_static_doc("drive", "v3")
+
+        build(
+            "drive", "v3", http=HttpMockSequence([({"status": "200"}, document)]), static_discovery=False, cache=cache
+        )
+        # An empty mock sequence fails on any request, so the second build must not fetch
+        service = build("drive", "v3", http=HttpMockSequence([]), static_discovery=False, cache=cache)
+
+        self.assertIsNotNone(service.files())
+
+    def test_discovery_cache_directory(self):
+        """Test that fetched discovery documents are shared through the cache directory until they expire."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            url = "https://www.googleapis.com/discovery/v1/apis/drive/v3/rest"
+            _DiscoveryCache(temp_dir).set(url, '{"name": "drive"}')
+
+            cache = _DiscoveryCache(temp_dir)
+            self.assertEqual(cache.get(url), '{"name": "drive"}')
+            self.assertIsNone(cache.get("https://www.googleapis.com/other"))
+
+            expired = time.time() - DISCOVERY_CACHE_TTL - 1
+            os.utime(_DiscoveryCache(temp_dir)._path(url), (expired, expired))
+            self.assertIsNone(_DiscoveryCache(temp_dir).get(url))
+
+    @patch("google_drive_utils._PooledAuthorizedHttp")
+    def test_build_drive_service_reuses_files_resource(self, mock_http):
+        """Test that the built service hands out one prebuilt files() collection."""
+        mock_http.return_value = HttpMockSequence([({"status": "200"}, '{"id": "root_id"}')])
+
+        service = _build_drive_service(MagicMock())
+
+        self.assertIsNotNone(service)
+        self.assertIs(service.files(), service.files())
+
+    @patch("google_drive_utils._PooledAuthorizedHttp")
+    def test_build_drive_service_clears_folder_caches_for_new_account(self, mock_http):
+        """Test that folder IDs cached for one account are dropped when a service is built for another."""
+
+        def build_for_account(root_id):
+            mock_http.return_value = HttpMockSequence([({"status": "200"}, json.dumps({"id": root_id}))])
+            self.assertIsNotNone(_build_drive_service(MagicMock()))
+
+        build_for_account("root_a")
+        _cache_folder_id(("reports",), "reports_a")
+
+        build_for_account("root_a")
+        self.assertEqual(_get_cached_folder_id(("reports",)), "reports_a")
+
+        build_for_account("root_b")
+        self.assertIsNone(_get_cached_folder_id(("reports",)))
+        self.assertEqual(_get_cached_folder_id(()), "root_b")
+
+    @patch("google_drive_utils.threading.Timer")
+    def test_schedule_credentials_refresh(self, mock_timer):
+        """Test that credentials are refreshed in the background before expiry and rescheduled."""
+        mock_creds = MagicMock(refresh_token="refresh")
+        mock_creds.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(minutes=60)
+
+        _schedule_credentials_refresh(mock_creds)
+
+        delay, refresh = mock_timer.call_args[0][:2]
+        self.assertAlmostEqual(delay, 55 * 60, delta=5)
+        mock_timer.return_value.start.assert_called_once()
+
+        refresh(mock_creds)
+
+        mock_creds.refresh.assert_called_once()
+        self.assertEqual(mock_timer.call_count, 2)
+        mock_timer.return_value.cancel.assert_called_once()
+
+    @patch("google_drive_utils.threading.Timer")
+    def test_schedule_credentials_refresh_without_expiry(self, mock_timer):
+        """Test that credentials without an expiry or refresh token are not scheduled."""
+        _schedule_credentials_refresh(MagicMock(expiry=None, refresh_token="refresh"))
+
+        mock_timer.assert_not_called()
+
+    @staticmethod
+    def _authorized_http(credentials, http, status=200, content=b"{}"):
+        """Stand in for AuthorizedHttp, answering every request with the given status."""
+        authorized = MagicMock(credentials=credentials, http=http)
+        authorized.request.return_value = (MagicMock(status=status), content)
+        return authorized
+
+    @patch("google_drive_utils.AuthorizedHttp")
+    def test_pooled_authorized_http_rate_limit(self, mock_authorized_http):
+        """Test that every request takes a token and rate limit responses slow the bucket down."""
+        bucket = MagicMock(rate=2.5)
+        bucket.acquire.return_value = 0.0
+        transport = _PooledAuthorizedHttp(MagicMock(), pool=_HttpConnectionPool(max_idle=1), bucket=bucket)
+
+        mock_authorized_http.side_effect = self._authorized_http
+        transport.request("https://www.googleapis.com/drive/v3/files")
+        bucket.reward.assert_called_once()
+
+        mock_authorized_http.side_effect = lambda credentials, http: self._authorized_http(
+            credentials, http, status=403, content=b'{"error": {"errors": [{"reason": "userRateLimitExceeded"}]}}'
+        )
+        response, _ = transport.request("https://www.googleapis.com/drive/v3/files")
+
+        self.assertEqual(response.status, 403)
+        self.assertEqual(bucket.acquire.call_count, 2)
+        bucket.penalize.assert_called_once()
+
+        mock_authorized_http.side_effect = lambda credentials, http: self._authorized_http(
+            credentials, http, status=403, content=b'{"error": {"errors": [{"reason": "insufficientPermissions"}]}}'
+        )
+        transport.request("https://www.googleapis.com/drive/v3/files")
+        bucket.penalize.assert_called_once()
+
+    @patch("google_drive_utils.AuthorizedHttp")
+    def test_pooled_authorized_http(self, mock_authorized_http):
+        """Test that connections are reused across threads and only concurrent calls open new ones."""
+        mock_authorized_http.side_effect = self._authorized_http
+        mock_creds = MagicMock()
+        pool = _HttpConnectionPool(max_idle=1)
+        transport = _PooledAuthorizedHttp(mock_creds, pool=pool)
+
+        transport.request("https://www.googleapis.com/drive/v3/files")
+        worker = threading.Thread(target=transport.request, args=("https://www.googleapis.com/drive/v3/files",))
+        worker.start()
+        worker.join()
+        self.assertEqual(len(pool._idle), 1)
+        connection = pool._idle[0]
+        self.assertNotIn(308, connection.redirect_codes)
+        self.assertEqual(connection.timeout, HTTP_TIMEOUT)
+        self.assertIs(mock_authorized_http.call_args[0][0], mock_creds)
+        self.assertIs(mock_authorized_http.call_args[1]["http"], connection)
+
+        # A call made while another is in flight gets its own connection; only max_idle are kept
+        first = transport._checkout()
+        transport.request("https://www.googleapis.com/drive/v3/about")
+        transport._checkin(first)
+        self.assertEqual(len(pool._idle), 1)
+        self.assertIsNot(pool._idle[0], connection)
+
+    @patch("google_drive_utils.AuthorizedHttp")
+    def test_pooled_connections_survive_service_rebuild(self, mock_authorized_http):
+        """Test that a transport built for new credentials reuses connections from the previous one."""
+        mock_authorized_http.side_effect = self._authorized_http
+        pool = _HttpConnectionPool(max_idle=2)
+        old_creds, new_creds = MagicMock(), MagicMock()
+
+        _PooledAuthorizedHttp(old_creds, pool=pool).request("https://www.googleapis.com/drive/v3/files")
+        connection = pool._idle[0]
+        _PooledAuthorizedHttp(new_creds, pool=pool).request("https://www.googleapis.com/drive/v3/files")
+
+        self.assertEqual(pool._idle, [connection])
+        self.assertIs(mock_authorized_http.call_args[0][0], new_creds)
+        self.assertIs(mock_authorized_http.call_args[1]["http"], connection)
+
 
 class TestUtilityFunctions(unittest.TestCase):
     """Test utility functions in google_drive_utils."""
@@ -877,12 +2058,12 @@ class TestUtilityFunctions(unittest.TestCase):
 
         self.assertFalse(result)
 
-    @patch("google_drive_utils.os.path.exists")
-    def test_upload_file_to_drive_nonexistent_file(self, mock_exists):
+    @patch("google_drive_utils.os.stat")
+    def test_upload_file_to_drive_nonexistent_file(self, mock_stat):
         """Test upload_file_to_drive with non-existent file."""
         from google_drive_utils import upload_file_to_drive
 
-        mock_exists.return_value = False
+        mock_stat.side_effect = FileNotFoundError
 
         result = upload_file_to_drive(self.mock_drive_service, "/nonexistent/file.txt", "folder_id")
 
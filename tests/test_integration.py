@@ -84,19 +84,14 @@ class TestIntegration(unittest.TestCase):
     @patch("app.check_token_exists")
     @patch("app.authenticate_google_drive")
     @patch("app.create_folder_if_not_exists")
-    @patch("app.upload_file_to_drive")
-    @patch("os.path.join")
-    @patch("os.remove")
-    def test_complete_file_upload_workflow(
-        self, mock_remove, mock_join, mock_upload, mock_create_folder, mock_auth, mock_check_token
-    ):
+    @patch("app.upload_stream_to_drive")
+    def test_complete_file_upload_workflow(self, mock_upload, mock_create_folder, mock_auth, mock_check_token):
         """Test the complete file upload workflow."""
         # Configure mocks
         mock_check_token.return_value = True
         mock_auth.return_value = MagicMock()
         mock_create_folder.return_value = "test_folder_id"
         mock_upload.return_value = "https://drive.google.com/file/d/test_file_id"
-        mock_join.return_value = "/tmp/test_file.txt"
 
         # Test file upload
         data = {
@@ -0,0 +1,67 @@
+import logging
+import logging.handlers
+import os
+import tempfile
+import unittest
+
+from src.core import logging_config
+from src.core.logging_config import configure_logging
+
+
+class TestConfigureLogging(unittest.TestCase):
+    """Test cases for configure_logging."""
+
+    def setUp(self):
+        """Save the root logger state so each test can reconfigure it."""
+        self.root_logger = logging.getLogger()
+        self.saved_handlers = self.root_logger.handlers[:]
+        self.saved_level = self.root_logger.level
+        self.saved_listener = logging_config._queue_listener
+        logging_config._queue_listener = None
+        self.log_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Stop the test listener and restore the saved root logger state."""
+        if logging_config._queue_listener is not None:
+            logging_config._queue_listener.stop()
+        for handler in self.root_logger.handlers[:]:
+            self.root_logger.removeHandler(handler)
+            handler.close()
+        for handler in self.saved_handlers:
+            self.root_logger.addHandler(handler)
+        self.root_logger.setLevel(self.saved_level)
+        logging_config._queue_listener = self.saved_listener
+
+    def _read_log(self):
+        with open(os.path.join(self.log_dir, "test.log")) as f:
+            return f.read()
+
+    def test_async_logging_writes_from_listener(self):
+        """Test that records pass through a QueueHandler and are written once the listener drains."""
+        configure_logging(enable_console=False, log_dir=self.log_dir, log_file="test.log")
+
+        self.assertEqual(len(self.root_logger.handlers), 1)
+        self.assertIsInstance(self.root_logger.handlers[0], logging.handlers.QueueHandler)
+
+        logging.getLogger("tests.component").warning("upload failed token=abc123")
+        logging_config._queue_listener.stop()
+        logging_config._queue_listener = None
+
+        lines = [line for line in self._read_log().splitlines() if "upload failed" in line]
+        self.assertEqual(len(lines), 1)
+        self.assertIn("google-drive-service - component - WARNING", lines[0])
+        self.assertIn("token=[FILTERED]", lines[0])
+
+    def test_sync_logging_writes_directly(self):
+        """Test that enable_async=False attaches the file handler to the root logger."""
+        configure_logging(enable_console=False, log_dir=self.log_dir, log_file="test.log", enable_async=False)
+
+        self.assertIsNone(logging_config._queue_listener)
+        self.assertIsInstance(self.root_logger.handlers[0], logging.handlers.RotatingFileHandler)
+
+        logging.getLogger("tests.component").warning("written synchronously")
+        self.assertIn("written synchronously", self._read_log())
+
+
+if __name__ == "__main__":
+    unittest.main()
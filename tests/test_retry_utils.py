@@ -2,20 +2,27 @@
 Tests for retry_utils module.
 """
 
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
+import httplib2
 from googleapiclient.errors import HttpError
 
 from retry_utils import (
     RETRYABLE_GOOGLE_ERRORS,
     RETRYABLE_STATUS_CODES,
     RetryableError,
+    TokenBucket,
     circuit_breaker,
     detailed_error_response,
+    get_retry_after,
+    is_rate_limit_error,
     is_retryable_error,
     rate_limit,
     retry,
+    single_flight,
 )
 
 
@@ -179,6 +186,64 @@ class TestRetryDecorator(unittest.TestCase):
         mock_sleep.assert_any_call(2.0)
         mock_sleep.assert_any_call(4.0)
 
+    @patch("retry_utils.time.sleep")
+    def test_retry_honors_retry_after(self, mock_sleep):
+        """Test that a 429's Retry-After header sets the retry delay."""
+        call_count = 0
+
+        @retry(max_retries=1, initial_delay=1.0, max_delay=30.0, jitter=False)
+        def test_function():
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                raise HttpError(httplib2.Response({"status": 429, "retry-after": "7"}), b"Rate limited")
+            return "success"
+
+        self.assertEqual(test_function(), "success")
+        mock_sleep.assert_called_once_with(7.0)
+
+    def test_get_retry_after_rate_limit_403(self):
+        """Test that Retry-After is read from rate limit 403s but not from other 403s."""
+        headers = {"status": 403, "retry-after": "5"}
+        rate_limited = HttpError(
+            httplib2.Response(headers), b'{"error": {"errors": [{"reason": "rateLimitExceeded"}]}}'
+        )
+        forbidden = HttpError(httplib2.Response(headers), b'{"error": {"errors": [{"reason": "forbidden"}]}}')
+
+        self.assertEqual(get_retry_after(rate_limited), 5.0)
+        self.assertIsNone(get_retry_after(forbidden))
+
+    @patch("retry_utils.time.sleep")
+    def test_retry_gives_up_when_retry_after_exceeds_max_delay(self, mock_sleep):
+        """Test that no retry is attempted when the server asks to wait longer than max_delay."""
+
+        @retry(max_retries=3, initial_delay=1.0, max_delay=10.0)
+        def test_function():
+            raise HttpError(httplib2.Response({"status": 429, "retry-after": "120"}), b"Rate limited")
+
+        with self.assertRaises(HttpError):
+            test_function()
+        mock_sleep.assert_not_called()
+
+    @patch("retry_utils.time.sleep")
+    def test_retry_converted_http_error(self, mock_sleep):
+        """Test that exceptions raised from a retryable HttpError are retried."""
+        call_count = 0
+
+        @retry(max_retries=1, initial_delay=1.0, jitter=False)
+        def test_function():
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                try:
+                    raise HttpError(httplib2.Response({"status": 503}), b"Backend Error")
+                except HttpError as e:
+                    raise ValueError("Drive API error") from e
+            return "success"
+
+        self.assertEqual(test_function(), "success")
+        self.assertEqual(call_count, 2)
+
 
 class TestRateLimit(unittest.TestCase):
     """Test the rate_limit decorator."""
@@ -202,6 +267,60 @@ class TestRateLimit(unittest.TestCase):
         self.assertEqual(result2, "success")
         self.assertEqual(mock_sleep.call_count, 0)
 
+    @patch("retry_utils.time.time", return_value=100.0)
+    @patch("retry_utils.time.sleep")
+    def test_rate_limit_shared_bucket(self, mock_sleep, mock_time):
+        """Test that functions sharing a bucket draw from one limit."""
+        bucket = TokenBucket(calls_per_second=2, max_burst=2)
+
+        @rate_limit(bucket=bucket)
+        def first():
+            return "first"
+
+        @rate_limit(bucket=bucket)
+        def second():
+            return "second"
+
+        first()
+        second()
+        mock_sleep.assert_not_called()
+
+        first()
+        mock_sleep.assert_called_once_with(0.5)
+
+    @patch("retry_utils.time.time", return_value=100.0)
+    @patch("retry_utils.time.sleep")
+    def test_rate_limit_adapts_to_rate_limit_errors(self, mock_sleep, mock_time):
+        """Test that a 429 halves the rate and successful calls restore it."""
+        bucket = TokenBucket(calls_per_second=4, max_burst=10)
+        responses = [HttpError(resp=MagicMock(status=429), content=b"Too Many Requests")] + ["ok"] * 20
+
+        @rate_limit(bucket=bucket)
+        def call_api():
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        with self.assertRaises(HttpError):
+            call_api()
+        self.assertEqual(bucket.rate, 2)
+
+        for _ in range(10):
+            call_api()
+        self.assertEqual(bucket.rate, 4)
+
+    def test_is_rate_limit_error(self):
+        """Test that 429s and 403s with a rate limit reason are recognized."""
+        self.assertTrue(is_rate_limit_error(HttpError(resp=MagicMock(status=429), content=b"")))
+        self.assertTrue(
+            is_rate_limit_error(HttpError(resp=MagicMock(status=403), content=b'{"reason": "userRateLimitExceeded"}'))
+        )
+        self.assertFalse(
+            is_rate_limit_error(HttpError(resp=MagicMock(status=403), content=b'{"reason": "insufficientPermissions"}'))
+        )
+        self.assertFalse(is_rate_limit_error(ValueError("boom")))
+
 
 class TestCircuitBreaker(unittest.TestCase):
     """Test the circuit_breaker decorator."""
@@ -242,6 +361,89 @@ class TestCircuitBreaker(unittest.TestCase):
         self.assertEqual(call_count, 2)  # Function only called twice
 
 
+class TestSingleFlight(unittest.TestCase):
+    """Test the single_flight decorator."""
+
+    def test_single_flight_coalesces_concurrent_calls(self):
+        """Test concurrent calls with the same arguments share one execution."""
+        started = threading.Event()
+        release = threading.Event()
+        call_count = 0
+
+        @single_flight()
+        def test_function(code):
+            nonlocal call_count
+            call_count += 1
+            started.set()
+            release.wait(5)
+            return f"token-{code}"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(test_function("abc")))
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=lambda: results.append(test_function("abc")))
+        follower.start()
+        time.sleep(0.05)  # Give the follower time to join the in-flight call
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        self.assertEqual(results, ["token-abc", "token-abc"])
+        self.assertEqual(call_count, 1)
+
+    @patch("retry_utils.time.monotonic")
+    def test_single_flight_ttl(self, mock_monotonic):
+        """Test completed results are reused until the ttl expires."""
+        mock_monotonic.return_value = 100.0
+        call_count = 0
+
+        @single_flight(ttl=60.0)
+        def test_function(code):
+            nonlocal call_count
+            call_count += 1
+            return call_count
+
+        self.assertEqual(test_function("abc"), 1)
+        self.assertEqual(test_function("abc"), 1)
+        self.assertEqual(test_function("other"), 2)
+
+        mock_monotonic.return_value = 161.0
+        self.assertEqual(test_function("abc"), 3)
+
+        test_function.cache_clear()
+        self.assertEqual(test_function("abc"), 4)
+
+    def test_single_flight_does_not_cache_exceptions(self):
+        """Test a failed call is retried by the next caller."""
+        call_count = 0
+
+        @single_flight(ttl=60.0)
+        def test_function():
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                raise ValueError("Test error")
+            return "success"
+
+        with self.assertRaises(ValueError):
+            test_function()
+        self.assertEqual(test_function(), "success")
+        self.assertEqual(call_count, 2)
+
+    def test_single_flight_does_not_cache_falsy_results(self):
+        """Test a call that reports failure with a falsy result is retried by the next caller."""
+        results = iter([False, True])
+
+        @single_flight(ttl=60.0)
+        def test_function():
+            return next(results)
+
+        self.assertFalse(test_function())
+        self.assertTrue(test_function())
+        self.assertTrue(test_function())
+
+
 class TestDetailedErrorResponse(unittest.TestCase):
     """Test the detailed_error_response function."""
 
@@ -140,12 +140,11 @@ class TestVersionModule(unittest.TestCase):
         version2 = get_version()
         self.assertEqual(version1, version2)
 
-        # Version info should have same version but different build_date
+        # Version info is computed once, but callers get their own copy
         info1 = get_version_info()
         info2 = get_version_info()
-        self.assertEqual(info1["version"], info2["version"])
-        self.assertEqual(info1["service"], info2["service"])
-        # build_date might be different due to timing
+        self.assertEqual(info1, info2)
+        self.assertIsNot(info1, info2)
 
     def test_module_constants(self):
         """Test that module constants are properly defined."""
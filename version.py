@@ -7,10 +7,14 @@ import re
 import shutil
 import subprocess  # nosec B404 - controlled use to query git tags (no shell, constant args)
 from datetime import datetime
+from functools import lru_cache
 
 # Current version - update this for releases
 __version__ = "2025.08.3"
 
+# Recorded once when the service starts; version details do not change at runtime
+_BUILD_DATE = datetime.now().isoformat()
+
 
 def get_version():
     """Get the current version of the service."""
@@ -19,10 +23,16 @@ def get_version():
 
 def get_version_info():
     """Get detailed version information."""
+    return dict(_get_version_info_for(os.environ.get("FLASK_ENV", "production")))
+
+
+@lru_cache(maxsize=8)
+def _get_version_info_for(environment):
+    """Build the version information for an environment once and reuse it."""
     return {
         "version": __version__,
-        "build_date": datetime.now().isoformat(),
-        "environment": os.environ.get("FLASK_ENV", "production"),
+        "build_date": _BUILD_DATE,
+        "environment": environment,
         "service": "google-drive-service",
     }
 
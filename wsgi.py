@@ -0,0 +1,25 @@
+"""WSGI entry point for production servers.
+
+Usage:
+    gunicorn -c gunicorn_conf.py wsgi:app
+    gunicorn -k gevent -w 4 --worker-connections 1000 wsgi:app
+
+When gevent is installed the standard library is monkey-patched before the application
+(and the Google API client's sockets, SSL and threading) is imported, so blocking Drive
+calls yield to other requests. Gunicorn's gevent worker patches on its own; this covers
+servers that do not.
+"""
+
+try:
+    from gevent import monkey
+
+    HAS_GEVENT = True
+except ImportError:
+    HAS_GEVENT = False
+
+if HAS_GEVENT and not monkey.is_module_patched("socket"):
+    monkey.patch_all()
+
+from app import app  # noqa: E402
+
+__all__ = ["app"]